@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 import re
 from typing import Any, Optional
@@ -100,6 +101,14 @@ class TextSection:
     value: str
     key_line: int
 
+    @cached_property
+    def links(self) -> list[dict[str, str]]:
+        return _extract_links_from_text(self.value)
+
+    @cached_property
+    def normalized_text(self) -> str:
+        return _normalize_human_text(self.value)
+
 
 _MARKDOWN_IMAGE_RE = re.compile(r"!\[(.*?)\]\((.*?)\)")
 _FILE_TAG_RE = re.compile(
@@ -162,8 +171,16 @@ def find_accessibility_findings(
     document_start_line: int,
     input_file: Optional[str] = None,
     options: Optional[AccessibilityLintOptions] = None,
+    sections: Optional[list[TextSection]] = None,
 ) -> list[AccessibilityFinding]:
+    """Return accessibility findings for one document.
+
+    sections may be passed in when the caller has already extracted the
+    document's text sections (see ``DocumentTextIndex.sections``).
+    """
     options = options or AccessibilityLintOptions()
+    if sections is None:
+        sections = _iter_text_sections(doc, source_code)
     findings: list[FindingDraft] = []
     findings.extend(_check_yesno_shortcuts(doc, source_code, document_start_line))
     findings.extend(_check_multifield_no_label_usage(doc, document_start_line))
@@ -186,7 +203,7 @@ def find_accessibility_findings(
             input_file=input_file,
         )
     )
-    for section in _iter_text_sections(doc, source_code):
+    for section in sections:
         findings.extend(
             _check_missing_alt_text(section, source_code, document_start_line)
         )
@@ -218,7 +235,7 @@ def find_accessibility_findings(
             _check_clickable_non_controls(section, source_code, document_start_line)
         )
     findings.extend(
-        _check_ambiguous_link_destinations(doc, source_code, document_start_line)
+        _check_ambiguous_link_destinations(sections, source_code, document_start_line)
     )
     unique_findings: list[AccessibilityFinding] = []
     seen: set[tuple[str, str, int]] = set()
@@ -794,7 +811,7 @@ def _check_empty_link_text(
     section: TextSection, source_code: str, document_start_line: int
 ) -> list[FindingDraft]:
     findings: list[FindingDraft] = []
-    for link in _extract_links_from_text(section.value):
+    for link in section.links:
         visible_text = _normalize_human_text(link["text"])
         if visible_text:
             continue
@@ -822,7 +839,7 @@ def _check_non_descriptive_link_text(
     section: TextSection, source_code: str, document_start_line: int
 ) -> list[FindingDraft]:
     findings: list[FindingDraft] = []
-    for link in _extract_links_from_text(section.value):
+    for link in section.links:
         normalized = _normalize_human_text(link["text"])
         if not normalized or normalized not in GENERIC_LINK_TEXT:
             continue
@@ -845,7 +862,7 @@ def _check_non_descriptive_link_text(
 def _check_color_only_instructions(
     section: TextSection, source_code: str, document_start_line: int
 ) -> list[FindingDraft]:
-    plain_text = _normalize_human_text(section.value)
+    plain_text = section.normalized_text
     if not any(color in plain_text.split() for color in COLOR_WORDS):
         return []
     color_reference_re = re.compile(
@@ -901,11 +918,11 @@ def _check_inline_color_styling(
 
 
 def _check_ambiguous_link_destinations(
-    doc: dict[str, Any], source_code: str, document_start_line: int
+    sections: list[TextSection], source_code: str, document_start_line: int
 ) -> list[FindingDraft]:
     links_by_text: dict[str, list[tuple[str, TextSection, str]]] = {}
-    for section in _iter_text_sections(doc, source_code):
-        for link in _extract_links_from_text(section.value):
+    for section in sections:
+        for link in section.links:
             text = _normalize_human_text(link["text"])
             if not text or not link["target"].strip():
                 continue
@@ -935,7 +952,7 @@ def _check_new_tab_links(
     section: TextSection, source_code: str, document_start_line: int
 ) -> list[FindingDraft]:
     findings: list[FindingDraft] = []
-    for link in _extract_links_from_text(section.value):
+    for link in section.links:
         attrs = link["attrs"].lower()
         if 'target="_blank"' not in attrs and "target='_blank'" not in attrs:
             continue
@@ -0,0 +1,163 @@
+"""
+On-disk caches shared by the checker and the formatter.
+
+Caches live in ``$DAYAMLCHECKER_CACHE_DIR`` if it is set, otherwise in
+``$XDG_CACHE_HOME/dayamlchecker`` (``~/.cache/dayamlchecker`` by default).
+Each cache is a single JSON file holding a version number, a mapping of
+string keys to JSON values and the time each entry was last used. Saving
+merges in whatever other runs wrote since the cache was loaded and drops
+entries that have not been used for a while, so the files stay bounded. A
+cache that is missing, unreadable or written by another version loads as
+empty, and failures to save are ignored: a cache only ever saves work, it
+never changes results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+__all__ = ["JSONCache", "cache_key", "default_cache_dir"]
+
+
+def default_cache_dir() -> Path:
+    """Return the directory for dayamlchecker caches."""
+    override = os.environ.get("DAYAMLCHECKER_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "dayamlchecker"
+
+
+def cache_key(*parts: str) -> str:
+    """Hash *parts* into a cache key; parts are kept distinct from each other."""
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class JSONCache:
+    """A string-keyed cache stored as one JSON file.
+
+    Entries added to :attr:`entries` count as used when the cache is saved;
+    call :meth:`touch` for entries that were read. :meth:`save` keeps at
+    most *max_entries* entries, none unused for longer than *max_age*
+    seconds.
+    """
+
+    MAX_ENTRIES = 10_000
+    MAX_AGE = 30 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        path: Path,
+        version: int,
+        entries: dict[str, Any] | None = None,
+        *,
+        used: dict[str, float] | None = None,
+        max_entries: int = MAX_ENTRIES,
+        max_age: float = MAX_AGE,
+    ) -> None:
+        self.path = path
+        self.version = version
+        self.entries: dict[str, Any] = entries if entries is not None else {}
+        self.used: dict[str, float] = used if used is not None else {}
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._touched: set[str] = set()
+
+    @classmethod
+    def load(cls, path: Path, *, version: int, **limits: Any) -> "JSONCache":
+        """Read the cache at *path*; *limits* are passed to the constructor."""
+        entries, used = _read_cache_file(path, version)
+        return cls(path, version, entries, used=used, **limits)
+
+    def touch(self, *keys: str) -> None:
+        """Mark *keys* as used by this run, so saving keeps them."""
+        self._touched.update(keys)
+
+    def save(self) -> None:
+        """Merge with the file, prune it and write it atomically.
+
+        Entries other runs saved since this cache was loaded are kept, and
+        concurrent runs never see half a file.
+        """
+        now = time.time()
+        entries, used = _read_cache_file(self.path, self.version)
+        entries.update(self.entries)
+        for key in self.entries:
+            if key in self.used:
+                # Loaded entries keep their own time, or a later one from
+                # the file if another run used them meanwhile.
+                used[key] = max(used.get(key, 0.0), self.used[key])
+            else:
+                used[key] = now
+        for key in self._touched & entries.keys():
+            used[key] = now
+        recent = sorted(
+            (key for key in entries if now - used[key] <= self.max_age),
+            key=lambda key: used[key],
+            reverse=True,
+        )[: self.max_entries]
+        kept_used = {key: used[key] for key in recent}
+        data = {
+            "version": self.version,
+            "entries": {key: entries[key] for key in recent},
+            "used": kept_used,
+        }
+        self.used.update(kept_used)
+        self._touched.clear()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}."
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            os.replace(temp_name, self.path)
+        except OSError:
+            Path(temp_name).unlink(missing_ok=True)
+
+
+def _read_cache_file(
+    path: Path, version: int
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """Return the entries and last-used times in *path*, or empty mappings.
+
+    Entries written without a time count as used when they are read, so they
+    expire like any other entry once that time is saved.
+    """
+    read_at = time.time()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != version
+        or not isinstance(data.get("entries"), dict)
+    ):
+        return {}, {}
+    used = data.get("used")
+    if not isinstance(used, dict):
+        used = {}
+    return data["entries"], {
+        key: (
+            used[key]
+            if isinstance(used.get(key), (int, float)) and used[key] <= read_at
+            else read_at
+        )
+        for key in data["entries"]
+    }
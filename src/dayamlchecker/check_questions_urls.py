@@ -4,18 +4,28 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import json
+import math
 import os
 import pathlib
 import re
 import sys
+import time
 import tokenize
 import warnings
+import zipfile
 from collections import defaultdict
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
 from io import StringIO
-from typing import Literal
-from urllib.parse import urlparse
+from itertools import repeat
+from typing import Any, Literal, TextIO
+from urllib.parse import urlparse, urlsplit, urlunsplit
+from xml.etree import ElementTree
 
 from dayamlchecker.messages import Finding, MessageId
 import requests
@@ -23,6 +33,7 @@ from docx2python import docx2python
 from linkify_it import LinkifyIt  # type: ignore[attr-defined,import-untyped]
 from pypdf import PdfReader
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
 from urllib3.util.retry import Retry
 
 IssueSeverity = Literal["error", "warning", "ignore"]
@@ -32,7 +43,11 @@ SourceKind = Literal["yaml", "template"]
 # - broken: the URL responded with a known dead-page status (404/410)
 # - concatenated: the extracted token appears to contain multiple URLs jammed together
 # - unreachable: the checker could not connect at all (timeout, DNS, TLS, etc.)
-IssueCategory = Literal["broken", "concatenated", "unreachable"]
+# - skipped: the URL phase ran out of its time budget before reaching this URL,
+#   or the URL is missing from a replay cassette with --replay-miss skip
+IssueCategory = Literal["broken", "concatenated", "unreachable", "skipped"]
+CassetteMode = Literal["record", "replay"]
+CassetteMissPolicy = Literal["error", "skip"]
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -86,6 +101,18 @@ class URLCheckResult:
         return any(issue.severity == "warning" for issue in self.issues)
 
 
+@dataclass(frozen=True)
+class URLExtractionOptions:
+    """Per-file limits for template text extraction.
+
+    ``pdf_max_pages`` and ``pdf_time_budget`` bound how much PDF page text is
+    extracted; link annotations are still read from every page.
+    """
+
+    pdf_max_pages: int | None = None
+    pdf_time_budget: float | None = None
+
+
 @dataclass(frozen=True)
 class URLSourceCollection:
     yaml_urls: dict[str, set[str]]
@@ -100,6 +127,10 @@ class URLSourceCollection:
         return len(set(self.yaml_urls) | set(self.document_urls))
 
 
+URL_MANIFEST_VERSION = 1
+_MANIFEST_SOURCE_KINDS: tuple[SourceKind, ...] = ("yaml", "template")
+
+
 def _source_label(source_kind: SourceKind) -> str:
     if source_kind == "yaml":
         return "question files"
@@ -119,6 +150,12 @@ def _url_message_id(*, severity: ReportSeverity, category: IssueCategory) -> str
             if severity == "error"
             else MessageId.URL_BROKEN_WARNING
         )
+    if category == "skipped":
+        return (
+            MessageId.URL_SKIPPED_ERROR
+            if severity == "error"
+            else MessageId.URL_SKIPPED_WARNING
+        )
     return (
         MessageId.URL_UNREACHABLE_ERROR
         if severity == "error"
@@ -150,8 +187,8 @@ def parse_args() -> argparse.Namespace:
         "--ignore-urls",
         default="",
         help=(
-            "Comma/newline-separated absolute URLs to ignore while checking "
-            "(default: none)"
+            "Comma/newline-separated absolute URLs or URL globs such as "
+            "'https://docs.example.org/*' to ignore while checking (default: none)"
         ),
     )
     parser.add_argument(
@@ -181,6 +218,102 @@ def parse_args() -> argparse.Namespace:
         default="warning",
         help="How to report URLs that could not be reached at all (default: warning)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for URL extraction (default: 1)",
+    )
+    parser.add_argument(
+        "--pdf-max-pages",
+        type=int,
+        default=None,
+        help="Extract text from at most this many pages per PDF (default: all)",
+    )
+    parser.add_argument(
+        "--pdf-time-budget",
+        type=float,
+        default=None,
+        help="Seconds to spend extracting text from each PDF (default: no limit)",
+    )
+    parser.add_argument(
+        "--collapse-trailing-slashes",
+        action="store_true",
+        help="Check URLs that differ only by a trailing slash once (default: off)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help=(
+            "Stop checking URLs after this many seconds and report the rest as "
+            "skipped (default: no limit)"
+        ),
+    )
+    parser.add_argument(
+        "--history",
+        type=pathlib.Path,
+        default=None,
+        metavar="PATH",
+        help=(
+            "JSON file remembering past results, so previously broken and "
+            "never-checked URLs are checked first; updated after each run"
+        ),
+    )
+    parser.add_argument(
+        "--stats-json",
+        type=pathlib.Path,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Write per-URL timings, retries and redirects plus per-host latency "
+            "percentiles and failure counts to a JSON file at PATH"
+        ),
+    )
+    cassette_mode = parser.add_mutually_exclusive_group()
+    cassette_mode.add_argument(
+        "--record",
+        type=pathlib.Path,
+        default=None,
+        metavar="PATH",
+        help="Record every URL check outcome to a JSON cassette at PATH",
+    )
+    cassette_mode.add_argument(
+        "--replay",
+        type=pathlib.Path,
+        default=None,
+        metavar="PATH",
+        help="Answer URL checks from a cassette at PATH without network access",
+    )
+    parser.add_argument(
+        "--replay-miss",
+        choices=("error", "skip"),
+        default="error",
+        help=(
+            "What to do with URLs missing from the --replay cassette: fail the "
+            "run or report them as skipped (default: error)"
+        ),
+    )
+    manifest_mode = parser.add_mutually_exclusive_group()
+    manifest_mode.add_argument(
+        "--write-manifest",
+        type=pathlib.Path,
+        default=None,
+        metavar="PATH",
+        help="Only extract URLs and write them to a JSON manifest at PATH",
+    )
+    manifest_mode.add_argument(
+        "--verify-manifest",
+        type=pathlib.Path,
+        action="append",
+        default=[],
+        metavar="PATH",
+        help=(
+            "Check the URLs in a manifest written by --write-manifest instead "
+            "of scanning --root. Repeat to merge manifests from several runs"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -219,6 +352,60 @@ _YAML_PYTHON_BLOCK_KEYS: frozenset[str] = frozenset({"code"})
 _YAML_BLOCK_SCALAR_RE = re.compile(
     r"^\s*(?:-\s*)?(?P<key>[^#:\n][^:\n]*):\s*[>|][^\n]*$"
 )
+_DOCX_RELS_PART_RE = re.compile(r"^word/_rels/[^/]+\.rels$")
+_DOCX_TEXT_PART_RE = re.compile(
+    r"^word/(?:document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml$"
+)
+_DOCX_RELATIONSHIP_TAG = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+_DOCX_HYPERLINK_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+)
+_WORDML_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_TEXT_TAGS: frozenset[str] = frozenset(
+    {f"{_WORDML_NS}t", f"{_WORDML_NS}instrText"}
+)
+_DOCX_BREAK_TAGS: frozenset[str] = frozenset(
+    {f"{_WORDML_NS}tab", f"{_WORDML_NS}br", f"{_WORDML_NS}cr"}
+)
+# Outside quotes: a double quote after an even run of backslashes, a single
+# quote, or a '#' that starts a comment.
+_YAML_UNQUOTED_SCAN_RE = re.compile(
+    r"""(?P<backslashes>\\*)"|(?P<single>')|(?P<comment>(?<!\S)#)"""
+)
+_YAML_SINGLE_QUOTE_END_RE = re.compile(r"(?:[^']|'')*'(?!')")
+_YAML_DOUBLE_QUOTE_END_RE = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+# linkify rejects some all-digit hosts, so every label must hold a letter.
+# Path punctuation that linkify treats specially ('.', '?', '-') is only
+# accepted where it cannot end the link.
+_FAST_URL_HOST_LABEL = (
+    r"(?=[A-Za-z0-9-]*[A-Za-z])[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?"
+)
+_FAST_URL_PATH_CHAR = r"(?:[A-Za-z0-9_~/\#=&%+]|-+|[.?](?=[A-Za-z0-9_~/\#=&%+]))"
+# A whitespace-delimited chunk holding one plain URL, optionally wrapped in
+# brackets or quotes. The prefix cannot hold ':', '/' or '@' so no other
+# linkify schema or e-mail match can start before the URL, and linkify drops
+# a bare host followed by ".>".
+_FAST_URL_CHUNK_RE = re.compile(
+    rf"""
+    (?P<prefix>[^\s:/@]*?)
+    (?P<url>
+        https?://
+        {_FAST_URL_HOST_LABEL}(?:\.{_FAST_URL_HOST_LABEL})*
+        (?::\d{{1,4}})?
+        (?:
+            /(?:{_FAST_URL_PATH_CHAR}*[A-Za-z0-9/])?
+            |[?\#]{_FAST_URL_PATH_CHAR}*[A-Za-z0-9/]
+        )?
+    )
+    (?!\.>)[\"')>\]}}.,;:!?*]*
+    """,
+    re.VERBOSE,
+)
+_FUZZY_HOST_HINT_RE = re.compile(r"\.[^\W_]|localhost", re.IGNORECASE)
+# Characters that linkify accepts immediately before an ``http(s)://`` schema.
+_FAST_URL_PRECEDING_CHARS: frozenset[str] = frozenset("!\"#%&'()*,-.;<>?[\\]{}")
 _URL_CONTINUATION_CHARS: frozenset[str] = frozenset("-_/=&%?#")
 _URL_LEADING_TOKEN_RE = re.compile(r"^([A-Za-z0-9._~:/?#\[\]@!$&'()*+,;=%-]+)")
 
@@ -342,35 +529,162 @@ def is_absolute_http_url(url: str) -> bool:
     return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
 
 
+class _PrefixTrieNode:
+    __slots__ = ("children", "terminal", "globs")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixTrieNode] = {}
+        self.terminal = False
+        self.globs: list[re.Pattern[str]] = []
+
+
+_GLOB_CHARS_RE = re.compile(r"[*?\[]")
+
+
+class URLMatcher:
+    """Match URLs against exact URLs, URL prefixes, globs and host suffixes.
+
+    Prefixes live in a character trie, so a lookup walks the URL once no
+    matter how many prefixes there are. Each glob is filed in the trie under
+    its literal leading text (everything before the first ``*``, ``?`` or
+    ``[``) and is only tried on URLs that share that text. A host suffix
+    such as ``example.com`` matches that host and all of its subdomains.
+    """
+
+    def __init__(
+        self,
+        *,
+        exact: Iterable[str] = (),
+        prefixes: Iterable[str] = (),
+        globs: Iterable[str] = (),
+        host_suffixes: Iterable[str] = (),
+    ) -> None:
+        self._exact = frozenset(exact)
+        self._host_suffixes = frozenset(suffix.lower() for suffix in host_suffixes)
+        self._root = _PrefixTrieNode()
+        for prefix in prefixes:
+            self._node_for(prefix).terminal = True
+        for glob in globs:
+            literal = _GLOB_CHARS_RE.split(glob, maxsplit=1)[0]
+            if glob == f"{literal}*":
+                self._node_for(literal).terminal = True
+            else:
+                pattern = re.compile(fnmatch.translate(glob))
+                self._node_for(literal).globs.append(pattern)
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[str]) -> "URLMatcher":
+        """Build a matcher from ``--ignore-urls`` entries.
+
+        Entries with a ``*`` are globs where ``*`` matches anything,
+        ``/`` included; ``https://docs.example.org/*`` ignores every URL
+        under that prefix. ``?`` and ``[`` are literal, so query strings
+        work in globs and exact entries alike. Other entries match exactly.
+        """
+        exact: set[str] = set()
+        globs: set[str] = set()
+        for pattern in patterns:
+            if "*" in pattern:
+                globs.add(re.sub(r"([?\[])", r"[\1]", pattern))
+            else:
+                exact.add(pattern)
+        return cls(exact=exact, globs=globs)
+
+    def _node_for(self, prefix: str) -> _PrefixTrieNode:
+        node = self._root
+        for char in prefix:
+            node = node.children.setdefault(char, _PrefixTrieNode())
+        return node
+
+    def matches(self, url: str) -> bool:
+        if url in self._exact:
+            return True
+        if self._host_suffixes and self._matches_host(url):
+            return True
+        node: _PrefixTrieNode | None = self._root
+        position = 0
+        while node is not None:
+            if node.terminal:
+                return True
+            if any(glob.match(url) for glob in node.globs):
+                return True
+            if position == len(url):
+                break
+            node = node.children.get(url[position])
+            position += 1
+        return False
+
+    def _matches_host(self, url: str) -> bool:
+        hostname = (urlparse(url).hostname or "").lower()
+        while hostname:
+            if hostname in self._host_suffixes:
+                return True
+            hostname = hostname.partition(".")[2]
+        return False
+
+
+# RFC 2606 and RFC 6761 reserve these special-use names. IANA also operates
+# example.edu as an example domain, even though it is not listed in the
+# RFC 6761 Special-Use Domain Names registry.
+_RESERVED_EXAMPLE_DOMAINS: frozenset[str] = frozenset(
+    {
+        "example",
+        "example.com",
+        "example.edu",
+        "example.net",
+        "example.org",
+        "invalid",
+        "localhost",
+        "test",
+    }
+)
+_RESERVED_EXAMPLE_DOMAIN_MATCHER = URLMatcher(host_suffixes=_RESERVED_EXAMPLE_DOMAINS)
+
+
 def is_reserved_example_domain(url: str) -> bool:
-    """Check if URL is in a non-registrable example/test domain.
+    """Check if URL is in a non-registrable example/test domain."""
+    return _RESERVED_EXAMPLE_DOMAIN_MATCHER.matches(url)
+
+
+_DEFAULT_PORTS: dict[str, int] = {"http": 80, "https": 443}
 
-    RFC 2606 and RFC 6761 reserve the special-use names below. IANA also
-    operates example.edu as an example domain, even though it is not listed
-    in the RFC 6761 Special-Use Domain Names registry.
+
+def canonicalize_url(url: str, *, collapse_trailing_slash: bool = False) -> str:
+    """Return the key under which *url* is checked, so each page is fetched once.
+
+    The fragment is dropped, the scheme and host are lowercased, default
+    ports are removed and an empty path becomes ``/``. With
+    *collapse_trailing_slash*, ``/page/`` and ``/page`` are also treated as
+    the same page. ``http`` and ``https`` stay distinct because a site can
+    serve different responses (or none) on each.
     """
-    rfc_special_use_domains: frozenset[str] = frozenset(
-        {
-            "example",
-            "example.com",
-            "example.net",
-            "example.org",
-            "invalid",
-            "localhost",
-            "test",
-        }
-    )
-    iana_managed_example_domains: frozenset[str] = frozenset({"example.edu"})
-    ignored_domains = rfc_special_use_domains | iana_managed_example_domains
-    hostname = (urlparse(url).hostname or "").lower()
-    return hostname in ignored_domains or any(
-        hostname.endswith(f".{domain}") for domain in ignored_domains
-    )
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc
+    host = parts.hostname
+    if host is not None:
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        userinfo, _, _ = netloc.rpartition("@")
+        netloc = f"[{host}]" if ":" in host else host
+        if port is not None and port != _DEFAULT_PORTS.get(scheme):
+            netloc = f"{netloc}:{port}"
+        if userinfo:
+            netloc = f"{userinfo}@{netloc}"
+    path = parts.path or "/"
+    if collapse_trailing_slash and len(path) > 1:
+        path = path.rstrip("/") or "/"
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+_WHITELIST_URL_MATCHER = URLMatcher(prefixes=_WHITELIST_URL_PREFIXES)
 
 
 def is_whitelisted_url(url: str) -> bool:
     """Check if URL is in the whitelist (prefix-based for API families)."""
-    return any(url.startswith(prefix) for prefix in _WHITELIST_URL_PREFIXES)
+    return _WHITELIST_URL_MATCHER.matches(url)
 
 
 def extract_text_from_pdf(file_path: pathlib.Path) -> str:
@@ -391,6 +705,111 @@ def extract_text_from_pdf(file_path: pathlib.Path) -> str:
         return ""
 
 
+def _iter_pdf_link_annotation_uris(page: Any) -> Iterable[str]:
+    annotations = page.get("/Annots")
+    if annotations is None:
+        return
+    for annotation_ref in annotations.get_object():
+        annotation = annotation_ref.get_object()
+        if annotation.get("/Subtype") != "/Link" or "/A" not in annotation:
+            continue
+        action = annotation["/A"]
+        uri = action.get("/URI") if hasattr(action, "get") else None
+        if uri is None:
+            continue
+        uri = uri.get_object()
+        if isinstance(uri, bytes):
+            uri = uri.decode("latin-1")
+        uri_text = str(uri).strip()
+        if uri_text:
+            yield uri_text
+
+
+def _extract_urls_from_pdf(
+    file_path: pathlib.Path,
+    linkify: LinkifyIt,
+    options: URLExtractionOptions,
+) -> tuple[list[str], list[str], dict[str, set[str]]]:
+    """Extract URLs from a PDF, reading link annotations before page text.
+
+    Pages are processed one at a time so only a single page of text is held
+    in memory. Text extraction stops once the page or time budget from
+    *options* is spent; annotations are still read from the remaining pages.
+    """
+    found_urls: list[str] = []
+    concatenated_urls: list[str] = []
+    repair_candidates: dict[str, set[str]] = defaultdict(set)
+    annotation_urls: set[str] = set()
+    text_urls: list[str] = []
+    deadline = (
+        time.monotonic() + options.pdf_time_budget
+        if options.pdf_time_budget is not None
+        else None
+    )
+    budget_note: str | None = None
+    previous_line = ""
+    try:
+        reader = PdfReader(file_path)
+        for page_number, page in enumerate(reader.pages, start=1):
+            for uri in _iter_pdf_link_annotation_uris(page):
+                url, is_concatenated = parse_url_token(uri)
+                if is_concatenated:
+                    concatenated_urls.append(uri)
+                elif url and not is_reserved_example_domain(url):
+                    annotation_urls.add(url)
+                    found_urls.append(url)
+
+            if budget_note is None:
+                if (
+                    options.pdf_max_pages is not None
+                    and page_number > options.pdf_max_pages
+                ):
+                    budget_note = f"page budget of {options.pdf_max_pages}"
+                elif deadline is not None and time.monotonic() > deadline:
+                    budget_note = f"time budget of {options.pdf_time_budget}s"
+            if budget_note is not None:
+                continue
+
+            page_text = page.extract_text() or ""
+            if not page_text:
+                continue
+            page_urls, page_concatenated = _scan_text_for_urls(page_text, linkify)
+            text_urls.extend(page_urls)
+            found_urls.extend(page_urls)
+            concatenated_urls.extend(page_concatenated)
+            # Carry the previous page's last line so URLs wrapped across a
+            # page break still produce repair candidates.
+            wrapped_text = (
+                f"{previous_line}\n{page_text}" if previous_line else page_text
+            )
+            for url, candidates in _extract_wrapped_pdf_url_repairs(
+                wrapped_text
+            ).items():
+                repair_candidates[url].update(candidates)
+            previous_line = page_text.splitlines()[-1] if page_text.strip() else ""
+    except Exception as e:
+        print(
+            f"Warning: could not extract text from PDF {file_path}: {e}",
+            file=sys.stderr,
+        )
+    if budget_note is not None:
+        print(
+            f"Warning: stopped extracting text from PDF {file_path} after the "
+            f"{budget_note}; link annotations were still checked",
+            file=sys.stderr,
+        )
+
+    # A text URL that is a strict prefix of a link annotation was most likely
+    # wrapped in the rendered text; the annotation is the authoritative repair.
+    for url in text_urls:
+        if url in annotation_urls:
+            continue
+        for annotation_url in annotation_urls:
+            if annotation_url.startswith(url):
+                repair_candidates[url].add(annotation_url)
+    return found_urls, concatenated_urls, dict(repair_candidates)
+
+
 def extract_text_from_docx(file_path: pathlib.Path) -> str:
     """Extract all text from a DOCX file."""
     try:
@@ -411,6 +830,66 @@ def extract_text_from_docx(file_path: pathlib.Path) -> str:
         return ""
 
 
+def _iter_docx_hyperlink_targets(archive: zipfile.ZipFile, name: str) -> Iterable[str]:
+    with archive.open(name) as handle:
+        for _, element in ElementTree.iterparse(handle, events=("end",)):
+            if element.tag != _DOCX_RELATIONSHIP_TAG:
+                continue
+            if (
+                element.get("Type") == _DOCX_HYPERLINK_REL_TYPE
+                and element.get("TargetMode") == "External"
+            ):
+                target = (element.get("Target") or "").strip()
+                if target:
+                    yield target
+            element.clear()
+
+
+def _iter_docx_paragraph_text(archive: zipfile.ZipFile, name: str) -> Iterable[str]:
+    paragraph: list[str] = []
+    with archive.open(name) as handle:
+        for _, element in ElementTree.iterparse(handle, events=("end",)):
+            tag = element.tag
+            if tag in _DOCX_TEXT_TAGS:
+                paragraph.append(element.text or "")
+            elif tag in _DOCX_BREAK_TAGS:
+                paragraph.append(" ")
+            elif tag == f"{_WORDML_NS}p":
+                if paragraph:
+                    yield "".join(paragraph)
+                    paragraph = []
+                # Drop the finished paragraph subtree so memory stays bounded
+                # by one paragraph rather than the whole document.
+                element.clear()
+    if paragraph:
+        yield "".join(paragraph)
+
+
+def extract_url_text_from_docx(file_path: pathlib.Path) -> str:
+    """Extract hyperlink targets and text runs from a DOCX for URL scanning.
+
+    Reads the zip members directly instead of rendering the document, so
+    hyperlinks are found even when their display text is not the URL.
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            names = archive.namelist()
+            parts: list[str] = []
+            for name in names:
+                if _DOCX_RELS_PART_RE.match(name):
+                    parts.extend(_iter_docx_hyperlink_targets(archive, name))
+            for name in names:
+                if _DOCX_TEXT_PART_RE.match(name):
+                    parts.extend(_iter_docx_paragraph_text(archive, name))
+        return "\n".join(parts)
+    except Exception as e:
+        print(
+            f"Warning: could not extract text from DOCX {file_path}: {e}",
+            file=sys.stderr,
+        )
+        return ""
+
+
 def parse_url_token(raw_url: str) -> tuple[str | None, bool]:
     """Return (normalized_url, is_concatenated).
 
@@ -458,7 +937,10 @@ def parse_url_token(raw_url: str) -> tuple[str | None, bool]:
 
 
 def parse_ignore_urls(raw: str) -> set[str]:
-    """Parse comma/newline separated URLs to ignore."""
+    """Parse comma/newline separated URLs and URL globs to ignore.
+
+    Globs are kept as written; see :meth:`URLMatcher.from_patterns`.
+    """
     if not raw:
         return set()
 
@@ -468,6 +950,9 @@ def parse_ignore_urls(raw: str) -> set[str]:
         candidate = token.strip()
         if not candidate:
             continue
+        if "*" in candidate:
+            ignored_urls.add(candidate)
+            continue
         url, is_concatenated = parse_url_token(candidate)
         if is_concatenated:
             continue
@@ -545,13 +1030,43 @@ def _yaml_block_scalar_mode(line: str) -> str | None:
     return "raw"
 
 
-def _is_unescaped_double_quote(line: str, index: int) -> bool:
-    backslash_count = 0
-    scan_index = index - 1
-    while scan_index >= 0 and line[scan_index] == "\\":
-        backslash_count += 1
-        scan_index -= 1
-    return backslash_count % 2 == 0
+def _strip_yaml_comment_from_line(
+    line: str, in_single: bool, in_double: bool
+) -> tuple[str, bool, bool]:
+    """Drop a trailing YAML comment from *line*, tracking quoted-scalar state.
+
+    Quoted scalars can span lines, so the quote state is threaded through
+    from the previous line and returned for the next one.
+    """
+    if not in_single and not in_double:
+        if "#" not in line and "'" not in line and '"' not in line:
+            return line, False, False
+
+    position = 0
+    while True:
+        if in_single:
+            closing = _YAML_SINGLE_QUOTE_END_RE.match(line, position)
+            if closing is None:
+                return line, True, False
+            position = closing.end()
+            in_single = False
+        elif in_double:
+            closing = _YAML_DOUBLE_QUOTE_END_RE.match(line, position)
+            if closing is None:
+                return line, False, True
+            position = closing.end()
+            in_double = False
+
+        token = _YAML_UNQUOTED_SCAN_RE.search(line, position)
+        if token is None:
+            return line, False, False
+        if token.group("comment"):
+            return line[: token.start()], False, False
+        position = token.end()
+        if token.group("single"):
+            in_single = True
+        elif len(token.group("backslashes")) % 2 == 0:
+            in_double = True
 
 
 def _strip_yaml_comments(text: str) -> str:
@@ -586,38 +1101,9 @@ def _strip_yaml_comments(text: str) -> str:
                 block_scalar_lines.append(line)
                 continue
 
-        result: list[str] = []
-        index = 0
-        while index < len(line):
-            char = line[index]
-            if char == "'" and not in_double:
-                if in_single and index + 1 < len(line) and line[index + 1] == "'":
-                    result.append("''")
-                    index += 2
-                    continue
-                in_single = not in_single
-                result.append(char)
-                index += 1
-                continue
-            if (
-                char == '"'
-                and not in_single
-                and _is_unescaped_double_quote(line, index)
-            ):
-                in_double = not in_double
-                result.append(char)
-                index += 1
-                continue
-            if (
-                char == "#"
-                and not in_single
-                and not in_double
-                and (index == 0 or line[index - 1].isspace())
-            ):
-                break
-            result.append(char)
-            index += 1
-        stripped_line = "".join(result)
+        stripped_line, in_single, in_double = _strip_yaml_comment_from_line(
+            line, in_single, in_double
+        )
         stripped_lines.append(stripped_line)
         block_scalar_mode = _yaml_block_scalar_mode(stripped_line)
         if block_scalar_mode is not None:
@@ -643,18 +1129,106 @@ def extract_urls_from_file(
     return urls, concatenated_urls
 
 
+def _fuzzy_host_hint(linkify: LinkifyIt) -> re.Pattern[str] | None:
+    """Return a pattern every bare domain linkify could report will match.
+
+    With ``fuzzy_link`` on, linkify reports text such as ``docassemble.org``
+    as an ``http://`` link; those always hold a dot followed by a letter or
+    digit. The checker itself turns fuzzy links off.
+    """
+    if not getattr(linkify, "_opts", {"fuzzy_link": True}).get("fuzzy_link"):
+        return None
+    return _FUZZY_HOST_HINT_RE
+
+
+def _may_contain_urls(text: str, fuzzy_hint: re.Pattern[str] | None) -> bool:
+    if "http://" in text or "https://" in text:
+        return True
+    return fuzzy_hint is not None and fuzzy_hint.search(text) is not None
+
+
+def _fast_chunk_url(chunk: str, fuzzy_hint: re.Pattern[str] | None) -> str | None:
+    """Return the URL token linkify would find in *chunk*, or ``None``.
+
+    Only handles a single plain ``http(s)`` URL with optional bracket or
+    quote wrapping; anything more unusual is left to linkify.
+    """
+    match = _FAST_URL_CHUNK_RE.fullmatch(chunk)
+    if match is None:
+        return None
+    prefix = match.group("prefix")
+    if prefix and (
+        prefix[-1] not in _FAST_URL_PRECEDING_CHARS
+        or (fuzzy_hint is not None and fuzzy_hint.search(prefix))
+    ):
+        return None
+    return match.group("url")
+
+
+def _fast_line_url_tokens(
+    line: str, fuzzy_hint: re.Pattern[str] | None
+) -> list[str] | None:
+    tokens: list[str] = []
+    for chunk in line.split():
+        if "http://" not in chunk and "https://" not in chunk:
+            if fuzzy_hint is not None and fuzzy_hint.search(chunk):
+                return None
+            continue
+        token = _fast_chunk_url(chunk, fuzzy_hint)
+        if token is None:
+            return None
+        tokens.append(token)
+    return tokens
+
+
+def _scan_text_for_urls(text: str, linkify: LinkifyIt) -> tuple[list[str], list[str]]:
+    """Find URL tokens in *text* with the same results as ``linkify.match``.
+
+    URL-free lines are skipped with substring checks, and chunks holding a
+    plain ``http(s)`` URL are validated with an anchored regex. Only lines
+    with unusual URL text are handed to linkify; its matches never span a
+    newline, so scanning line by line reports the same tokens.
+    """
+    found_urls: list[str] = []
+    concatenated_urls: list[str] = []
+    fuzzy_hint = _fuzzy_host_hint(linkify)
+    if not _may_contain_urls(text, fuzzy_hint):
+        return found_urls, concatenated_urls
+
+    for line in text.split("\n"):
+        if not _may_contain_urls(line, fuzzy_hint):
+            continue
+        tokens = _fast_line_url_tokens(line, fuzzy_hint)
+        if tokens is None:
+            tokens = [match.url for match in linkify.match(line) or []]
+        for token in tokens:
+            url, is_concatenated = parse_url_token(token)
+            if is_concatenated:
+                concatenated_urls.append(token.strip())
+                continue
+            if not url:
+                continue
+            if is_reserved_example_domain(url):
+                continue
+            found_urls.append(url)
+    return found_urls, concatenated_urls
+
+
 def _extract_urls_from_file_detailed(
-    file_path: pathlib.Path, linkify: LinkifyIt
+    file_path: pathlib.Path,
+    linkify: LinkifyIt,
+    options: URLExtractionOptions | None = None,
+    text: str | None = None,
 ) -> tuple[list[str], list[str], dict[str, set[str]]]:
     # Extract text based on file type
     suffix = file_path.suffix.lower()
-    repair_candidates: dict[str, set[str]] = {}
     if suffix == ".pdf":
-        text = extract_text_from_pdf(file_path)
-        repair_candidates = _extract_wrapped_pdf_url_repairs(text)
-    elif suffix == ".docx":
-        text = extract_text_from_docx(file_path)
-    else:
+        return _extract_urls_from_pdf(
+            file_path, linkify, options or URLExtractionOptions()
+        )
+    if suffix == ".docx":
+        text = extract_url_text_from_docx(file_path)
+    elif text is None:
         # Plain text files
         try:
             text = file_path.read_text(encoding="utf-8")
@@ -662,25 +1236,12 @@ def _extract_urls_from_file_detailed(
             # Skip non-text files in questions directories.
             return [], [], {}
 
-    if not text:
+    if not text or not _may_contain_urls(text, _fuzzy_host_hint(linkify)):
         return [], [], {}
 
     text = _prepare_text_for_url_extraction(file_path, text)
-
-    matches = linkify.match(text) or []
-    found_urls: list[str] = []
-    concatenated_urls: list[str] = []
-    for match in matches:
-        url, is_concatenated = parse_url_token(match.url)
-        if is_concatenated:
-            concatenated_urls.append(match.url.strip())
-            continue
-        if not url:
-            continue
-        if is_reserved_example_domain(url):
-            continue
-        found_urls.append(url)
-    return found_urls, concatenated_urls, repair_candidates
+    found_urls, concatenated_urls = _scan_text_for_urls(text, linkify)
+    return found_urls, concatenated_urls, {}
 
 
 def _display_path(file_path: pathlib.Path, root: pathlib.Path) -> str:
@@ -690,18 +1251,52 @@ def _display_path(file_path: pathlib.Path, root: pathlib.Path) -> str:
         return str(file_path)
 
 
+@lru_cache(maxsize=1)
+def _worker_linkify() -> LinkifyIt:
+    return LinkifyIt(options={"fuzzy_link": False})
+
+
+def _extract_urls_in_worker(
+    file_path: pathlib.Path,
+    options: URLExtractionOptions | None,
+    text: str | None = None,
+) -> tuple[list[str], list[str], dict[str, set[str]]]:
+    # Module-level so it can be pickled by process pools; each worker process
+    # builds its own LinkifyIt instance once.
+    return _extract_urls_from_file_detailed(file_path, _worker_linkify(), options, text)
+
+
 def collect_urls_from_files(
-    file_paths: Iterable[pathlib.Path], root: pathlib.Path
+    file_paths: Iterable[pathlib.Path],
+    root: pathlib.Path,
+    *,
+    executor: Executor | None = None,
+    options: URLExtractionOptions | None = None,
+    file_texts: Mapping[pathlib.Path, str] | None = None,
 ) -> tuple[dict[str, set[str]], dict[str, set[str]], dict[str, set[str]]]:
-    linkify = LinkifyIt(options={"fuzzy_link": False})
+    """Extract URLs from *file_paths*, optionally in parallel on *executor*.
+
+    Results are merged in the order of *file_paths* regardless of which
+    worker finishes first, so the output does not depend on scheduling.
+    Files whose contents are already in *file_texts* are not read again.
+    """
+    paths = list(file_paths)
+    texts = [(file_texts or {}).get(file_path) for file_path in paths]
+    results: Iterable[tuple[list[str], list[str], dict[str, set[str]]]]
+    if executor is not None and len(paths) > 1:
+        results = executor.map(_extract_urls_in_worker, paths, repeat(options), texts)
+    else:
+        linkify = LinkifyIt(options={"fuzzy_link": False})
+        results = (
+            _extract_urls_from_file_detailed(file_path, linkify, options, text)
+            for file_path, text in zip(paths, texts)
+        )
+
     url_sources: dict[str, set[str]] = defaultdict(set)
     concatenated_sources: dict[str, set[str]] = defaultdict(set)
     repair_candidates: dict[str, set[str]] = defaultdict(set)
-    for file_path in file_paths:
+    for file_path, (urls, concatenated_urls, file_repairs) in zip(paths, results):
         rel_path = _display_path(file_path, root)
-        urls, concatenated_urls, file_repairs = _extract_urls_from_file_detailed(
-            file_path, linkify
-        )
         for url in urls:
             url_sources[url].add(rel_path)
         for bad_url in concatenated_urls:
@@ -716,12 +1311,20 @@ def collect_urls(
     question_files: Iterable[pathlib.Path] | None = None,
     package_dirs: Iterable[pathlib.Path] | None = None,
     check_documents: bool = True,
+    *,
+    executor: Executor | None = None,
+    extraction_options: URLExtractionOptions | None = None,
+    file_texts: Mapping[pathlib.Path, str] | None = None,
 ) -> URLSourceCollection:
     if question_files is None:
         question_files = iter_question_files(root, package_dirs=package_dirs)
 
     yaml_urls, yaml_concatenated, yaml_repairs = collect_urls_from_files(
-        question_files, root
+        question_files,
+        root,
+        executor=executor,
+        options=extraction_options,
+        file_texts=file_texts,
     )
 
     document_urls: dict[str, set[str]] = {}
@@ -730,7 +1333,10 @@ def collect_urls(
     if check_documents:
         document_urls, document_concatenated, document_repairs = (
             collect_urls_from_files(
-                iter_document_files(root, package_dirs=package_dirs), root
+                iter_document_files(root, package_dirs=package_dirs),
+                root,
+                executor=executor,
+                options=extraction_options,
             )
         )
 
@@ -744,69 +1350,672 @@ def collect_urls(
     )
 
 
+def merge_url_sources(
+    collections: Iterable[URLSourceCollection],
+) -> URLSourceCollection:
+    """Merge URL collections, e.g. from manifests written by lint shards."""
+    merged: dict[str, dict[str, set[str]]] = {
+        name: defaultdict(set)
+        for name in (
+            "yaml_urls",
+            "document_urls",
+            "yaml_concatenated",
+            "document_concatenated",
+            "yaml_repairs",
+            "document_repairs",
+        )
+    }
+    for collection in collections:
+        for name, target in merged.items():
+            for url, values in getattr(collection, name).items():
+                target[url].update(values)
+    return URLSourceCollection(
+        **{name: dict(target) for name, target in merged.items()}
+    )
+
+
+def _manifest_fields(
+    source_kind: SourceKind,
+) -> tuple[str, str, str]:
+    if source_kind == "yaml":
+        return "yaml_urls", "yaml_concatenated", "yaml_repairs"
+    return "document_urls", "document_concatenated", "document_repairs"
+
+
+def url_manifest_from_sources(collected: URLSourceCollection) -> dict[str, Any]:
+    """Return a JSON-serializable manifest of *collected* URLs.
+
+    Entries are sorted so manifests of the same files compare equal.
+    """
+    urls: list[dict[str, Any]] = []
+    concatenated: list[dict[str, Any]] = []
+    for source_kind in _MANIFEST_SOURCE_KINDS:
+        urls_field, concatenated_field, repairs_field = _manifest_fields(source_kind)
+        repairs: dict[str, set[str]] = getattr(collected, repairs_field)
+        for url, sources in sorted(getattr(collected, urls_field).items()):
+            urls.append(
+                {
+                    "url": url,
+                    "source_kind": source_kind,
+                    "sources": sorted(sources),
+                    "repair_candidates": sorted(repairs.get(url, ())),
+                }
+            )
+        for url, sources in sorted(getattr(collected, concatenated_field).items()):
+            concatenated.append(
+                {"url": url, "source_kind": source_kind, "sources": sorted(sources)}
+            )
+    return {
+        "version": URL_MANIFEST_VERSION,
+        "urls": urls,
+        "concatenated": concatenated,
+    }
+
+
+def url_sources_from_manifest(manifest: Mapping[str, Any]) -> URLSourceCollection:
+    """Rebuild a :class:`URLSourceCollection` from a URL manifest.
+
+    Raises:
+        ValueError: if the manifest version or an entry is not recognized.
+    """
+    if manifest.get("version") != URL_MANIFEST_VERSION:
+        raise ValueError(
+            f"unsupported URL manifest version {manifest.get('version')!r}"
+        )
+    fields: dict[str, dict[str, set[str]]] = {
+        name: defaultdict(set)
+        for source_kind in _MANIFEST_SOURCE_KINDS
+        for name in _manifest_fields(source_kind)
+    }
+    for key, with_repairs in (("urls", True), ("concatenated", False)):
+        for entry in manifest.get(key, ()):
+            source_kind = entry.get("source_kind")
+            if source_kind not in _MANIFEST_SOURCE_KINDS:
+                raise ValueError(f"unknown URL manifest source kind {source_kind!r}")
+            urls_field, concatenated_field, repairs_field = _manifest_fields(
+                source_kind
+            )
+            url = entry["url"]
+            if with_repairs:
+                fields[urls_field][url].update(entry.get("sources", ()))
+                candidates = entry.get("repair_candidates", ())
+                if candidates:
+                    fields[repairs_field][url].update(candidates)
+            else:
+                fields[concatenated_field][url].update(entry.get("sources", ()))
+    return URLSourceCollection(**{name: dict(value) for name, value in fields.items()})
+
+
+def write_url_manifest(path: pathlib.Path, collected: URLSourceCollection) -> None:
+    path.write_text(
+        json.dumps(url_manifest_from_sources(collected), indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
+def read_url_manifests(paths: Iterable[pathlib.Path]) -> URLSourceCollection:
+    """Read and merge the URL manifests at *paths*.
+
+    Raises:
+        ValueError: if a manifest is not valid JSON or not a URL manifest.
+    """
+    collections: list[URLSourceCollection] = []
+    for path in paths:
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path}: not a valid URL manifest: {exc}") from exc
+        if not isinstance(manifest, dict):
+            raise ValueError(f"{path}: not a valid URL manifest")
+        try:
+            collections.append(url_sources_from_manifest(manifest))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+    return merge_url_sources(collections)
+
+
 _DEAD_STATUS_CODES: frozenset[int] = frozenset({404, 410})
 
 
+URL_CHECK_STATS_VERSION = 1
+
+
+@dataclass(frozen=True)
+class URLRequestStats:
+    """Timing and transfer details for one URL request."""
+
+    url: str
+    host: str
+    elapsed: float
+    status_code: int | None
+    unreachable: bool
+    retries: int
+    redirects: int
+    bytes_read: int
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+@dataclass
+class URLCheckStats:
+    """Instrumentation for the URL phase.
+
+    Collects a :class:`URLRequestStats` entry per network request and, when
+    *progress_stream* is set, keeps a live ``checked/total`` line with an
+    ETA on it. :meth:`to_json` adds per-host request counts, p50/p95
+    latency and failure counts for trending across runs.
+    """
+
+    progress_stream: TextIO | None = None
+    requests: list[URLRequestStats] = field(default_factory=list)
+    total: int = 0
+    done: int = 0
+    skipped: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def start(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.skipped = 0
+        self.started_at = time.monotonic()
+        self._show_progress()
+
+    def advance(self, count: int = 1, *, skipped: bool = False) -> None:
+        self.done += count
+        if skipped:
+            self.skipped += count
+        self._show_progress()
+
+    def finish(self) -> None:
+        self.finished_at = time.monotonic()
+        if self.progress_stream is not None and self.total:
+            print(file=self.progress_stream, flush=True)
+
+    def record(self, request: URLRequestStats) -> None:
+        self.requests.append(request)
+
+    def _show_progress(self) -> None:
+        if self.progress_stream is None or not self.total:
+            return
+        line = f"Checking URLs: {self.done}/{self.total}"
+        if self.done and self.started_at is not None:
+            elapsed = time.monotonic() - self.started_at
+            remaining = elapsed / self.done * (self.total - self.done)
+            line += f", ETA {_format_duration(remaining)}"
+        print(f"\r\033[K{line}", end="", file=self.progress_stream, flush=True)
+
+    def host_summaries(self) -> dict[str, dict[str, Any]]:
+        by_host: dict[str, list[URLRequestStats]] = defaultdict(list)
+        for request in self.requests:
+            by_host[request.host].append(request)
+        summaries: dict[str, dict[str, Any]] = {}
+        for host, requests_for_host in sorted(by_host.items()):
+            latencies = sorted(request.elapsed for request in requests_for_host)
+            summaries[host] = {
+                "count": len(requests_for_host),
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "failures": sum(
+                    1
+                    for request in requests_for_host
+                    if request.unreachable or request.status_code in _DEAD_STATUS_CODES
+                ),
+            }
+        return summaries
+
+    def to_json(self) -> dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None and self.finished_at is not None:
+            elapsed = self.finished_at - self.started_at
+        return {
+            "version": URL_CHECK_STATS_VERSION,
+            "elapsed": elapsed,
+            "checked": self.done - self.skipped,
+            "skipped": self.skipped,
+            "total": self.total,
+            "hosts": self.host_summaries(),
+            "requests": [asdict(request) for request in self.requests],
+        }
+
+    def save(self, path: pathlib.Path) -> None:
+        path.write_text(json.dumps(self.to_json(), indent=2) + "\n", encoding="utf-8")
+
+
+def _response_retries(response: requests.Response) -> int:
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if isinstance(retries, Retry) else 0
+
+
+def _response_bytes_read(response: requests.Response) -> int:
+    # requests drains redirect bodies, so the stream knows their size. The
+    # final body is closed unread, so its size comes from Content-Length.
+    tell = getattr(response.raw, "tell", None)
+    read = tell() if callable(tell) else 0
+    if read:
+        return read
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(int(headers.get("Content-Length", 0)), 0)
+    except ValueError:
+        return 0
+
+
+def _failed_request_retries(
+    session: requests.Session, url: str, exc: requests.RequestException
+) -> int:
+    # urllib3 only raises MaxRetryError once every retry has been used.
+    if not (exc.args and isinstance(exc.args[0], MaxRetryError)):
+        return 0
+    retry = getattr(session.get_adapter(url), "max_retries", None)
+    if isinstance(retry, Retry) and isinstance(retry.total, int):
+        return retry.total
+    return 0
+
+
+def _worst_case_request_seconds(retry: Retry, timeout: float) -> float:
+    """Longest time one request with *timeout* can take under *retry*."""
+    attempts = (retry.total if isinstance(retry.total, int) else 0) + 1
+    # urllib3 sleeps before the third and later attempts only.
+    backoff = sum(
+        min(retry.backoff_max, retry.backoff_factor * 2 ** (errors - 1))
+        for errors in range(2, attempts)
+    )
+    return attempts * timeout + backoff
+
+
+@contextmanager
+def _retries_within(
+    session: requests.Session, url: str, timeout: float, remaining: float
+) -> Iterator[None]:
+    """Turn off retries for *url* while they could run past *remaining*."""
+    adapter = session.get_adapter(url) if hasattr(session, "get_adapter") else None
+    if (
+        not isinstance(adapter, HTTPAdapter)
+        or not isinstance(adapter.max_retries, Retry)
+        or _worst_case_request_seconds(adapter.max_retries, timeout) <= remaining
+    ):
+        yield
+        return
+    retry = adapter.max_retries
+    adapter.max_retries = retry.new(total=0, connect=0, read=0)
+    try:
+        yield
+    finally:
+        adapter.max_retries = retry
+
+
 def _check_single_url(
     session: requests.Session,
     url: str,
-    timeout: int,
+    timeout: float,
     *,
     report_unreachable: bool = True,
+    stats: URLCheckStats | None = None,
 ) -> tuple[int | None, bool]:
+    started = time.monotonic()
     try:
         with session.get(
             url, allow_redirects=True, timeout=timeout, stream=True
         ) as response:
+            if stats is not None:
+                hops = [*response.history, response]
+                stats.record(
+                    URLRequestStats(
+                        url=url,
+                        host=urlsplit(url).hostname or "",
+                        elapsed=time.monotonic() - started,
+                        status_code=response.status_code,
+                        unreachable=False,
+                        retries=sum(_response_retries(hop) for hop in hops),
+                        redirects=len(response.history),
+                        bytes_read=sum(_response_bytes_read(hop) for hop in hops),
+                    )
+                )
             return response.status_code, False
     except requests.RequestException as exc:
+        if stats is not None:
+            stats.record(
+                URLRequestStats(
+                    url=url,
+                    host=urlsplit(url).hostname or "",
+                    elapsed=time.monotonic() - started,
+                    status_code=None,
+                    unreachable=True,
+                    retries=_failed_request_retries(session, url, exc),
+                    redirects=0,
+                    bytes_read=0,
+                )
+            )
         if report_unreachable:
             print(f"Warning: could not check {url}: {exc}", file=sys.stderr)
         return None, True
 
 
+URL_CASSETTE_VERSION = 1
+
+
+class URLCassetteMiss(LookupError):
+    """Raised in replay mode for a URL that has no recorded response."""
+
+
+@dataclass
+class URLCassette:
+    """Recorded URL check outcomes for deterministic, offline URL checks.
+
+    In ``record`` mode every request goes to the network and its outcome is
+    kept; call :meth:`save` afterwards. In ``replay`` mode outcomes come
+    only from ``responses``; a URL that was not recorded raises
+    :class:`URLCassetteMiss`. With ``on_miss="skip"`` the URL checks report
+    such URLs as skipped instead of failing the run.
+    """
+
+    mode: CassetteMode
+    on_miss: CassetteMissPolicy = "error"
+    responses: dict[str, tuple[int | None, bool]] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, path: pathlib.Path, *, on_miss: CassetteMissPolicy = "error"
+    ) -> "URLCassette":
+        """Read a cassette written by :meth:`save` for replay.
+
+        Raises:
+            ValueError: if the file is not a URL cassette.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != URL_CASSETTE_VERSION:
+                raise ValueError(
+                    f"unsupported URL cassette version {data.get('version')!r}"
+                )
+            responses = {
+                url: (entry["status_code"], bool(entry["unreachable"]))
+                for url, entry in data["responses"].items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"{path}: not a valid URL cassette: {exc}") from exc
+        return cls(mode="replay", on_miss=on_miss, responses=responses)
+
+    def save(self, path: pathlib.Path) -> None:
+        data = {
+            "version": URL_CASSETTE_VERSION,
+            "responses": {
+                url: {"status_code": status_code, "unreachable": unreachable}
+                for url, (status_code, unreachable) in sorted(self.responses.items())
+            },
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def check(
+        self,
+        session: requests.Session,
+        url: str,
+        timeout: float,
+        *,
+        report_unreachable: bool = True,
+        stats: URLCheckStats | None = None,
+    ) -> tuple[int | None, bool]:
+        """Drop-in replacement for a single URL check that records or replays.
+
+        Replayed outcomes are not network requests, so they are not added to
+        *stats*.
+        """
+        if self.mode == "record":
+            outcome = _check_single_url(
+                session,
+                url,
+                timeout,
+                report_unreachable=report_unreachable,
+                stats=stats,
+            )
+            self.responses[url] = outcome
+            return outcome
+        if url in self.responses:
+            return self.responses[url]
+        raise URLCassetteMiss(f"no recorded response for {url}")
+
+
+URL_CHECK_HISTORY_VERSION = 1
+URLHealth = Literal["healthy", "broken", "unreachable"]
+
+
+@dataclass
+class URLCheckHistory:
+    """When each URL was last checked and how it went.
+
+    Used to check previously broken and never-checked URLs before URLs that
+    were recently healthy, so a time-limited run spends its budget where
+    problems are most likely.
+    """
+
+    entries: dict[str, tuple[URLHealth, float]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "URLCheckHistory":
+        """Read a history file; a missing file is an empty history.
+
+        Raises:
+            ValueError: if the file is not a URL check history.
+        """
+        if not path.exists():
+            return cls()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != URL_CHECK_HISTORY_VERSION:
+                raise ValueError(
+                    f"unsupported URL check history version {data.get('version')!r}"
+                )
+            entries: dict[str, tuple[URLHealth, float]] = {
+                url: (entry["health"], float(entry["checked_at"]))
+                for url, entry in data["urls"].items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"{path}: not a valid URL check history: {exc}") from exc
+        return cls(entries=entries)
+
+    def save(self, path: pathlib.Path) -> None:
+        data = {
+            "version": URL_CHECK_HISTORY_VERSION,
+            "urls": {
+                url: {"health": health, "checked_at": checked_at}
+                for url, (health, checked_at) in sorted(self.entries.items())
+            },
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def priority(self, url: str) -> tuple[int, float]:
+        """Sort key: broken or unreachable first, then never checked, then
+        healthy URLs starting with the ones checked longest ago."""
+        entry = self.entries.get(url)
+        if entry is None:
+            return 1, 0.0
+        health, checked_at = entry
+        if health == "healthy":
+            return 2, checked_at
+        return 0, checked_at
+
+    def record(
+        self, url: str, status_code: int | None, unreachable: bool, checked_at: float
+    ) -> None:
+        health: URLHealth = "healthy"
+        if unreachable:
+            health = "unreachable"
+        elif status_code in _DEAD_STATUS_CODES:
+            health = "broken"
+        self.entries[url] = (health, checked_at)
+
+
 def check_urls(
     session: requests.Session,
     urls: Iterable[str],
     timeout: int,
     repair_candidates: dict[str, set[str]] | None = None,
+    *,
+    collapse_trailing_slashes: bool = False,
+    cassette: URLCassette | None = None,
 ) -> tuple[list[tuple[str, int]], list[str]]:
     """Return (broken, unreachable) for the given *urls*.
 
     *broken* contains ``(url, status_code)`` pairs for dead pages.
     *unreachable* lists URLs that could not be fetched at all.
+
+    URLs are grouped by :func:`canonicalize_url` and each group is fetched
+    once, through one of its original spellings; its result is reported for
+    every spelling. Requests go through *cassette* when one is given.
     """
+    results, _ = _check_url_targets(
+        session,
+        urls,
+        timeout,
+        repair_candidates,
+        collapse_trailing_slashes=collapse_trailing_slashes,
+        cassette=cassette,
+    )
+    return _split_check_results(results)
+
+
+def _split_check_results(
+    results: Mapping[str, tuple[int | None, bool]],
+) -> tuple[list[tuple[str, int]], list[str]]:
     broken: list[tuple[str, int]] = []
     unreachable: list[str] = []
+    for url in sorted(results):
+        status_code, was_unreachable = results[url]
+        if was_unreachable:
+            unreachable.append(url)
+        elif status_code is not None and status_code in _DEAD_STATUS_CODES:
+            broken.append((url, status_code))
+    return broken, unreachable
+
+
+def _check_url_targets(
+    session: requests.Session,
+    urls: Iterable[str],
+    timeout: int,
+    repair_candidates: dict[str, set[str]] | None = None,
+    *,
+    collapse_trailing_slashes: bool = False,
+    cassette: URLCassette | None = None,
+    budget: float | None = None,
+    priority: Callable[[str], Any] | None = None,
+    stats: URLCheckStats | None = None,
+) -> tuple[dict[str, tuple[int | None, bool]], list[str]]:
+    """Check *urls* and return ``(results, skipped)``.
+
+    *results* maps each checked spelling to ``(status_code, unreachable)``.
+    Spellings with the same :func:`canonicalize_url` key are fetched once,
+    as written: the spelling equal to the key if there is one, otherwise
+    the first. The key itself is never fetched, so a ``/page/`` link is not
+    requested as ``/page`` when trailing slashes are collapsed.
+    Fetch targets are checked in order of the lowest *priority* among their
+    spellings. Once *budget* seconds have passed, the remaining URLs are
+    returned in *skipped*, as are URLs whose repair candidates could not all
+    be checked in time. Each request's timeout is cut to the time left,
+    and its retries are turned off when they could run past the deadline.
+    Redirects are followed with the same timeout for every hop, so a
+    request that is redirected can still end after the deadline. URLs
+    missing from a replay *cassette* with ``on_miss="skip"`` are returned
+    in *skipped* too. Requests and progress are reported to
+    *stats* when it is given.
+    """
+    check_single_url = cassette.check if cassette is not None else _check_single_url
+    skip_cassette_misses = cassette is not None and cassette.on_miss == "skip"
+    spellings_by_target: dict[str, list[str]] = defaultdict(list)
     for url in sorted(urls):
         # Skip whitelisted URLs (e.g., API endpoints requiring authentication)
         if is_whitelisted_url(url):
             continue
-
-        status_code, was_unreachable = _check_single_url(session, url, timeout)
-        if was_unreachable:
-            unreachable.append(url)
-            continue
-        if status_code not in _DEAD_STATUS_CODES:
+        target = canonicalize_url(
+            url, collapse_trailing_slash=collapse_trailing_slashes
+        )
+        spellings_by_target[target].append(url)
+    targets = list(spellings_by_target)
+    if priority is not None:
+        targets.sort(key=lambda target: min(map(priority, spellings_by_target[target])))
+
+    deadline = time.monotonic() + budget if budget is not None else None
+
+    def request_timeout() -> float | None:
+        if deadline is None:
+            return timeout
+        remaining = deadline - time.monotonic()
+        return min(timeout, remaining) if remaining > 0 else None
+
+    def check_within_deadline(
+        url: str, url_timeout: float, **kwargs: Any
+    ) -> tuple[int | None, bool]:
+        if deadline is None:
+            return check_single_url(session, url, url_timeout, **kwargs)
+        with _retries_within(session, url, url_timeout, deadline - time.monotonic()):
+            return check_single_url(session, url, url_timeout, **kwargs)
+
+    results: dict[str, tuple[int | None, bool]] = {}
+    skipped: list[str] = []
+    if stats is not None:
+        stats.start(len(targets))
+    for target in targets:
+        spellings = spellings_by_target[target]
+        target_timeout = request_timeout()
+        if target_timeout is None:
+            skipped.extend(spellings)
+            if stats is not None:
+                stats.advance(skipped=True)
             continue
-
-        repaired = False
-        for candidate in sorted((repair_candidates or {}).get(url, ())):
-            if is_whitelisted_url(candidate):
-                repaired = True
-                break
-            candidate_status, candidate_unreachable = _check_single_url(
-                session,
-                candidate,
-                timeout,
-                report_unreachable=False,
+        unchecked = False
+        fetch_url = target if target in spellings else spellings[0]
+        try:
+            status_code, was_unreachable = check_within_deadline(
+                fetch_url, target_timeout, stats=stats
             )
-            if not candidate_unreachable and candidate_status not in _DEAD_STATUS_CODES:
-                repaired = True
-                break
-        if not repaired:
-            broken.append((url, status_code))
-    return broken, unreachable
+            if not was_unreachable and status_code in _DEAD_STATUS_CODES:
+                candidates = set().union(
+                    *((repair_candidates or {}).get(url, ()) for url in spellings)
+                )
+                for candidate in sorted(candidates):
+                    if is_whitelisted_url(candidate):
+                        status_code = None
+                        break
+                    candidate_timeout = request_timeout()
+                    if candidate_timeout is None:
+                        unchecked = True
+                        break
+                    candidate_status, candidate_unreachable = check_within_deadline(
+                        candidate,
+                        candidate_timeout,
+                        report_unreachable=False,
+                        stats=stats,
+                    )
+                    if (
+                        not candidate_unreachable
+                        and candidate_status not in _DEAD_STATUS_CODES
+                    ):
+                        status_code = None
+                        break
+        except URLCassetteMiss as exc:
+            if not skip_cassette_misses:
+                raise
+            print(f"Warning: {exc}; skipping", file=sys.stderr)
+            unchecked = True
+        if unchecked:
+            skipped.extend(spellings)
+        else:
+            for url in spellings:
+                results[url] = (status_code, was_unreachable)
+        if stats is not None:
+            stats.advance(skipped=unchecked)
+    if stats is not None:
+        stats.finish()
+    return results, sorted(skipped)
 
 
 def _resolve_issue_severity(
@@ -816,7 +2025,7 @@ def _resolve_issue_severity(
     document_severity: IssueSeverity,
     unreachable_severity: IssueSeverity,
 ) -> IssueSeverity:
-    if category == "unreachable":
+    if category in ("unreachable", "skipped"):
         return unreachable_severity
     if source_kind == "yaml":
         return yaml_severity
@@ -867,20 +2076,105 @@ def run_url_check(
     yaml_severity: IssueSeverity = "error",
     document_severity: IssueSeverity = "warning",
     unreachable_severity: IssueSeverity = "warning",
+    jobs: int = 1,
+    executor: Executor | None = None,
+    extraction_options: URLExtractionOptions | None = None,
+    file_texts: Mapping[pathlib.Path, str] | None = None,
+    collapse_trailing_slashes: bool = False,
+    cassette: URLCassette | None = None,
+    budget: float | None = None,
+    history: URLCheckHistory | None = None,
+    stats: URLCheckStats | None = None,
 ) -> URLCheckResult:
-    collected = collect_urls(
-        root=root,
-        question_files=question_files,
-        package_dirs=package_dirs,
-        check_documents=check_documents,
+    """Collect and check URLs for the given question files and packages.
+
+    Pass *executor* to reuse a worker pool that the caller already owns;
+    otherwise a process pool with *jobs* workers is created for the
+    extraction phase when *jobs* is greater than one. *file_texts* maps
+    question files the caller has already read to their contents.
+    """
+    if executor is None and jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as owned_executor:
+            collected = collect_urls(
+                root=root,
+                question_files=question_files,
+                package_dirs=package_dirs,
+                check_documents=check_documents,
+                executor=owned_executor,
+                extraction_options=extraction_options,
+                file_texts=file_texts,
+            )
+    else:
+        collected = collect_urls(
+            root=root,
+            question_files=question_files,
+            package_dirs=package_dirs,
+            check_documents=check_documents,
+            executor=executor,
+            extraction_options=extraction_options,
+            file_texts=file_texts,
+        )
+    return check_collected_urls(
+        collected,
+        timeout=timeout,
+        ignore_urls=ignore_urls,
+        yaml_severity=yaml_severity,
+        document_severity=document_severity,
+        unreachable_severity=unreachable_severity,
+        collapse_trailing_slashes=collapse_trailing_slashes,
+        cassette=cassette,
+        budget=budget,
+        history=history,
+        stats=stats,
     )
-    ignored_urls = set(ignore_urls)
+
+
+def check_collected_urls(
+    collected: URLSourceCollection,
+    *,
+    timeout: int = 10,
+    ignore_urls: Iterable[str] = (),
+    yaml_severity: IssueSeverity = "error",
+    document_severity: IssueSeverity = "warning",
+    unreachable_severity: IssueSeverity = "warning",
+    collapse_trailing_slashes: bool = False,
+    cassette: URLCassette | None = None,
+    budget: float | None = None,
+    history: URLCheckHistory | None = None,
+    stats: URLCheckStats | None = None,
+) -> URLCheckResult:
+    """Check URLs that were already collected, e.g. from a URL manifest.
+
+    Each fetch target is requested once no matter how many spellings,
+    files or source kinds it appears in; see :func:`check_urls`.
+
+    Question-file URLs are checked before template URLs and, within each
+    group, *history* puts previously broken and never-checked URLs ahead of
+    recently healthy ones. URLs not reached within *budget* seconds are
+    reported as skipped, and *history* is updated with every URL checked.
+    Pass *stats* to collect per-request timings and show progress.
+    """
+    ignore_matcher = URLMatcher.from_patterns(ignore_urls)
     ignored_matches = sorted(
-        ignored_urls & (set(collected.yaml_urls) | set(collected.document_urls))
+        url
+        for url in set(collected.yaml_urls) | set(collected.document_urls)
+        if ignore_matcher.matches(url)
     )
-    for ignored in ignored_matches:
-        collected.yaml_urls.pop(ignored, None)
-        collected.document_urls.pop(ignored, None)
+    ignored_urls = set(ignored_matches)
+    if ignored_matches:
+        collected = replace(
+            collected,
+            yaml_urls={
+                url: sources
+                for url, sources in collected.yaml_urls.items()
+                if url not in ignored_urls
+            },
+            document_urls={
+                url: sources
+                for url, sources in collected.document_urls.items()
+                if url not in ignored_urls
+            },
+        )
 
     issues: list[URLIssue] = []
     for bad_url, sources in sorted(collected.yaml_concatenated.items()):
@@ -909,9 +2203,15 @@ def run_url_check(
     urls_to_check = set(collected.yaml_urls) | set(collected.document_urls)
     broken: list[tuple[str, int]] = []
     unreachable: list[str] = []
+    skipped: list[str] = []
     if urls_to_check:
+
+        def priority(url: str) -> tuple[int, int, float]:
+            history_rank = history.priority(url) if history else (0, 0.0)
+            return (0 if url in collected.yaml_urls else 1, *history_rank)
+
         session = build_session()
-        broken, unreachable = check_urls(
+        results, skipped = _check_url_targets(
             session,
             urls_to_check,
             timeout,
@@ -920,7 +2220,17 @@ def run_url_check(
                 | set(collected.document_repairs.get(url, set()))
                 for url in urls_to_check
             },
+            collapse_trailing_slashes=collapse_trailing_slashes,
+            cassette=cassette,
+            budget=budget,
+            priority=priority,
+            stats=stats,
         )
+        broken, unreachable = _split_check_results(results)
+        if history is not None:
+            checked_at = time.time()
+            for url, (status_code, was_unreachable) in results.items():
+                history.record(url, status_code, was_unreachable, checked_at)
 
     for url, status_code in broken:
         if url in collected.yaml_urls:
@@ -972,8 +2282,32 @@ def run_url_check(
                 unreachable_severity=unreachable_severity,
             )
 
+    for url in skipped:
+        if url in collected.yaml_urls:
+            _append_issue(
+                issues,
+                category="skipped",
+                source_kind="yaml",
+                url=url,
+                sources=collected.yaml_urls[url],
+                yaml_severity=yaml_severity,
+                document_severity=document_severity,
+                unreachable_severity=unreachable_severity,
+            )
+        if url in collected.document_urls:
+            _append_issue(
+                issues,
+                category="skipped",
+                source_kind="template",
+                url=url,
+                sources=collected.document_urls[url],
+                yaml_severity=yaml_severity,
+                document_severity=document_severity,
+                unreachable_severity=unreachable_severity,
+            )
+
     severity_order = {"error": 0, "warning": 1}
-    category_order = {"concatenated": 0, "broken": 1, "unreachable": 2}
+    category_order = {"concatenated": 0, "broken": 1, "unreachable": 2, "skipped": 3}
     source_order = {"yaml": 0, "template": 1}
     ordered_issues = tuple(
         sorted(
@@ -987,12 +2321,33 @@ def run_url_check(
         )
     )
     return URLCheckResult(
-        checked_url_count=len(urls_to_check),
+        checked_url_count=len(urls_to_check) - len(skipped),
         ignored_url_count=len(ignored_matches),
         issues=ordered_issues,
     )
 
 
+def _cassette_from_args(
+    record: pathlib.Path | None,
+    replay: pathlib.Path | None,
+    replay_miss: CassetteMissPolicy,
+) -> URLCassette | None:
+    if replay is not None:
+        return URLCassette.load(replay, on_miss=replay_miss)
+    if record is not None:
+        return URLCassette(mode="record")
+    return None
+
+
+def _url_check_stats_from_args(stats_json: pathlib.Path | None) -> URLCheckStats | None:
+    """Stats for a CLI run: a live progress line on a terminal, and
+    collected timings when *stats_json* is given."""
+    progress_stream = sys.stderr if sys.stderr.isatty() else None
+    if progress_stream is None and stats_json is None:
+        return None
+    return URLCheckStats(progress_stream=progress_stream)
+
+
 def print_url_check_report(result: URLCheckResult) -> None:
     if result.ignored_url_count:
         print(f"Ignoring {result.ignored_url_count} URL(s) via --ignore-urls.")
@@ -1011,6 +2366,7 @@ def print_url_check_report(result: URLCheckResult) -> None:
         ),
         "broken": "Found URLs returning HTTP 404/410 in {source}:",
         "unreachable": "Could not reach URLs in {source} to verify them:",
+        "skipped": "Did not check URLs in {source} (out of time or not recorded):",
     }
 
     for severity in ("error", "warning"):
@@ -1018,7 +2374,7 @@ def print_url_check_report(result: URLCheckResult) -> None:
         if not matches:
             continue
         print(f"URL checker {severity}s:")
-        for category in ("concatenated", "broken", "unreachable"):
+        for category in ("concatenated", "broken", "unreachable", "skipped"):
             for source_kind in ("yaml", "template"):
                 bucket = [
                     issue
@@ -1035,15 +2391,69 @@ def print_url_check_report(result: URLCheckResult) -> None:
 def main() -> int:
     args = parse_args()
     root = pathlib.Path(args.root).resolve()
-    result = run_url_check(
-        root=root,
-        timeout=args.timeout,
-        check_documents=not args.skip_templates,
-        ignore_urls=parse_ignore_urls(args.ignore_urls),
-        yaml_severity=args.yaml_url_severity,
-        document_severity=args.document_url_severity,
-        unreachable_severity=args.unreachable_url_severity,
+    extraction_options = URLExtractionOptions(
+        pdf_max_pages=args.pdf_max_pages,
+        pdf_time_budget=args.pdf_time_budget,
     )
+    if args.write_manifest is not None:
+        with ExitStack() as stack:
+            executor: Executor | None = None
+            if args.jobs > 1:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=args.jobs)
+                )
+            collected = collect_urls(
+                root=root,
+                check_documents=not args.skip_templates,
+                executor=executor,
+                extraction_options=extraction_options,
+            )
+        write_url_manifest(args.write_manifest, collected)
+        print(f"Wrote {collected.unique_url_count} URL(s) to {args.write_manifest}.")
+        return 0
+
+    try:
+        cassette = _cassette_from_args(args.record, args.replay, args.replay_miss)
+        manifest_sources = (
+            read_url_manifests(args.verify_manifest) if args.verify_manifest else None
+        )
+        history = URLCheckHistory.load(args.history) if args.history else None
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    check_options: dict[str, Any] = {
+        "timeout": args.timeout,
+        "ignore_urls": parse_ignore_urls(args.ignore_urls),
+        "yaml_severity": args.yaml_url_severity,
+        "document_severity": args.document_url_severity,
+        "unreachable_severity": args.unreachable_url_severity,
+        "collapse_trailing_slashes": args.collapse_trailing_slashes,
+        "cassette": cassette,
+        "budget": args.budget,
+        "history": history,
+        "stats": _url_check_stats_from_args(args.stats_json),
+    }
+    try:
+        if manifest_sources is not None:
+            result = check_collected_urls(manifest_sources, **check_options)
+        else:
+            result = run_url_check(
+                root=root,
+                check_documents=not args.skip_templates,
+                jobs=args.jobs,
+                extraction_options=extraction_options,
+                **check_options,
+            )
+    except URLCassetteMiss as exc:
+        print(f"Error: {exc} in {args.replay}", file=sys.stderr)
+        return 1
+    if cassette is not None and args.record is not None:
+        cassette.save(args.record)
+    if history is not None:
+        history.save(args.history)
+    if args.stats_json is not None:
+        check_options["stats"].save(args.stats_json)
     print_url_check_report(result)
     return 1 if result.has_errors() else 0
 
@@ -15,10 +15,17 @@ Usage:
 
 from __future__ import annotations
 
+import argparse
+import json
 import re
 import sys
 import os
+from collections import ChainMap
+from collections.abc import Iterable, MutableMapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +33,8 @@ import black
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
+from dayamlchecker.cache import JSONCache, cache_key, default_cache_dir
+
 __all__ = [
     "format_yaml_file",
     "format_yaml_string",
@@ -242,8 +251,367 @@ def _find_block_body_span(lines: list[str], header_line: int) -> tuple[int, int,
     return start, end, first_body_indent
 
 
+_FORMATTER_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _formatter_source_hash() -> str:
+    """Hash of this module, so cached results do not outlive a formatter change."""
+    return cache_key(Path(__file__).read_text(encoding="utf-8"))
+
+
+def _block_settings_fingerprint(config: FormatterConfig) -> str:
+    """Settings and code that affect how a single code block is formatted."""
+    return json.dumps(
+        {
+            "formatter": _formatter_source_hash(),
+            "black": black.__version__,
+            "line_length": config.black_line_length,
+            "target_versions": sorted(v.name for v in config.black_target_versions),
+            "convert_indent_4_to_2": config.convert_indent_4_to_2,
+            "strip_trailing_whitespace": config.strip_trailing_whitespace,
+        },
+        sort_keys=True,
+    )
+
+
+def _config_fingerprint(config: FormatterConfig) -> str:
+    """Settings and code that affect how a whole file is formatted."""
+    return json.dumps(
+        {
+            "formatter": _formatter_source_hash(),
+            "block": _block_settings_fingerprint(config),
+            "python_keys": sorted(config.python_keys),
+            "prefer_literal_blocks": config.prefer_literal_blocks,
+        },
+        sort_keys=True,
+    )
+
+
+def _format_block(
+    code: str,
+    config: FormatterConfig,
+    original_indent: int,
+    block_cache: MutableMapping[str, str] | None,
+) -> str:
+    """format_python_code(), answered from *block_cache* when possible."""
+    if block_cache is None:
+        return format_python_code(code, config, original_indent=original_indent)
+    key = cache_key(_block_settings_fingerprint(config), str(original_indent), code)
+    formatted = block_cache.get(key)
+    if formatted is None:
+        formatted = format_python_code(code, config, original_indent=original_indent)
+        block_cache[key] = formatted
+    return formatted
+
+
+def _replacement_for_block(
+    lines: list[str],
+    key_line: int,
+    value: str,
+    config: FormatterConfig,
+    path: tuple[str, ...],
+    block_cache: MutableMapping[str, str] | None,
+    line_ranges: Sequence[tuple[int, int]] | None = None,
+) -> tuple[int, int, str, tuple[str, ...]] | None:
+    """Return the textual replacement for the Python block keyed at key_line,
+    or None if the block has no body, lies outside line_ranges or needs no
+    changes."""
+    # Determine the body span in the original text
+    body_start, body_end, body_indent = _find_block_body_span(lines, key_line)
+    if body_end < body_start:
+        return None
+    if line_ranges is not None and not any(
+        first <= body_end + 1 and key_line + 1 <= last for first, last in line_ranges
+    ):
+        return None
+
+    # Format using the detected body indent so we reinsert with the
+    # same indentation level
+    formatted = _format_block(value, config, body_indent, block_cache)
+
+    # Normalize newlines for comparison
+    if _normalize_newlines(formatted) == _normalize_newlines(value):
+        return None
+    return body_start, body_end, formatted, path
+
+
+# Characters that str.splitlines() treats as line breaks but YAML does not.
+_NON_YAML_LINE_BREAKS = frozenset("\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+_SCAN_LINE_RE = re.compile(r"(?P<indent> *)(?P<dashes>(?:-(?: +|$))*)(?P<rest>.*)")
+_SCAN_KEY_RE = re.compile(
+    r"(?P<key>[^\s#'\"?&*!|>%@`{\[\-][^#]*?|-[^\s#][^#]*?) *:(?: +|$)"
+)
+_SCAN_BLOCK_HEADER_RE = re.compile(
+    r"(?P<style>[|>])(?P<chomp>[-+]?)(?P<indent_indicator>[0-9]?)[-+]?"
+)
+_SCAN_TRAILING_COMMENT_RE = re.compile(r"(?:^| +)#.*$")
+_SCAN_DOUBLE_QUOTED_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SCAN_SINGLE_QUOTED_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+class _AmbiguousYaml(Exception):
+    """The block scanner cannot be sure it reads the file like ruamel does."""
+
+
+def _literal_block_value(
+    lines: list[str], body_start: int, body_end: int, indent: int, chomp: str
+) -> str:
+    """Return the string value of a literal block scalar body, as YAML reads it."""
+    content: list[str] = []
+    pending_breaks = 0
+    last_has_break = False
+    for line in lines[body_start : body_end + 1]:
+        text = line.rstrip("\r\n")
+        has_break = text != line
+        if not text.strip(" "):
+            if len(text) > indent:
+                # Spaces beyond the block indent are content; rare enough
+                # not to replicate.
+                raise _AmbiguousYaml
+            pending_breaks += 1 if has_break else 0
+            continue
+        content.extend([""] * pending_breaks)
+        pending_breaks = 0
+        content.append(text[indent:])
+        last_has_break = has_break
+    if not content:
+        raise _AmbiguousYaml
+    value = "\n".join(content)
+    if chomp == "-":
+        return value
+    if last_has_break:
+        value += "\n"
+    if chomp == "+":
+        value += "\n" * pending_breaks
+    return value
+
+
+def _classify_scalar(value: str) -> str:
+    """Classify an inline value as "empty", "block", "plain" or "closed".
+
+    "closed" values (quoted or flow) must end on their own line. Raises
+    _AmbiguousYaml for anything that may continue on later lines in a way
+    the scanner does not follow, or that relies on anchors, aliases or tags.
+    """
+    if value.startswith(('"', "'")):
+        quoted_re = (
+            _SCAN_DOUBLE_QUOTED_RE if value.startswith('"') else _SCAN_SINGLE_QUOTED_RE
+        )
+        match = quoted_re.match(value)
+        if match is None:
+            raise _AmbiguousYaml
+        rest = value[match.end() :]
+        if rest.strip() and not _SCAN_TRAILING_COMMENT_RE.fullmatch(rest):
+            raise _AmbiguousYaml
+        return "closed"
+    value = _SCAN_TRAILING_COMMENT_RE.sub("", value).rstrip()
+    if not value:
+        return "empty"
+    if value[0] in "|>":
+        header = _SCAN_BLOCK_HEADER_RE.fullmatch(value)
+        if header is None or header.group("indent_indicator"):
+            raise _AmbiguousYaml
+        return "block"
+    if value[0] in "[{":
+        depth = 0
+        for char in value:
+            if char in "\"'#":
+                raise _AmbiguousYaml
+            depth += (char in "[{") - (char in "]}")
+            if depth < 0:
+                raise _AmbiguousYaml
+        if depth != 0 or value[-1] not in "]}":
+            raise _AmbiguousYaml
+        return "closed"
+    if value[0] in "&*!%@`-?:,]}" or ": " in value or value.endswith(":"):
+        raise _AmbiguousYaml
+    return "plain"
+
+
+def _next_significant_line(lines: list[str], index: int) -> int:
+    while index < len(lines):
+        stripped = lines[index].strip()
+        if stripped and not stripped.startswith("#"):
+            break
+        index += 1
+    return index
+
+
+def _scan_python_blocks(
+    lines: list[str], python_keys: set[str]
+) -> list[tuple[int, str, str]]:
+    """Find literal block scalars under python_keys directly from the text.
+
+    Returns (key_line, key, value) tuples in line order, matching what a
+    ruamel round-trip load reports for those keys. The scanner follows block
+    mappings and sequences by indentation and raises _AmbiguousYaml for
+    anything else (multi-line quoted or flow values, anchors, aliases, tags,
+    complex or quoted keys, duplicate keys, folded or plain multi-line
+    Python values, indentation indicators, inconsistent indentation);
+    callers fall back to ruamel for those inputs.
+    """
+    blocks: list[tuple[int, str, str]] = []
+    # Open collections as (column, kind, keys seen); kind is "map" or "seq".
+    stack: list[tuple[int, str, set[str]]] = []
+    # Column of a key or "-" whose value starts on a later line.
+    pending: int | None = None
+    document_started = False
+    index = 0
+    while True:
+        index = _next_significant_line(lines, index)
+        if index >= len(lines):
+            break
+        line = lines[index].rstrip("\r\n")
+        if "\t" in line[: len(line) - len(line.lstrip(" \t"))]:
+            raise _AmbiguousYaml
+        if line.startswith("...") and line[3:4] in ("", " "):
+            raise _AmbiguousYaml
+        if line.startswith("---") and line[3:4] in ("", " "):
+            if line[3:].strip() and not line[3:].lstrip().startswith("#"):
+                raise _AmbiguousYaml
+            stack.clear()
+            pending = None
+            document_started = False
+            index += 1
+            continue
+        if line.startswith("%"):
+            raise _AmbiguousYaml
+
+        match = _SCAN_LINE_RE.fullmatch(line)
+        assert match is not None
+        indent = len(match.group("indent"))
+        dashes = match.group("dashes")
+        rest = match.group("rest")
+        if rest.startswith(("-", "?")) or (
+            not dashes and rest.startswith(("'", '"', "[", "{"))
+        ):
+            raise _AmbiguousYaml
+
+        # Close collections that this line dedents out of, then check that
+        # the line lands where YAML allows it.
+        while stack and stack[-1][0] > indent:
+            stack.pop()
+        top = stack[-1] if stack else None
+        if top is not None and top[0] == indent:
+            if dashes and top[1] == "map":
+                if pending != indent:
+                    raise _AmbiguousYaml
+                stack.append((indent, "seq", set()))
+            elif not dashes and top[1] == "seq":
+                stack.pop()
+                if not stack or stack[-1][0] != indent or stack[-1][1] != "map":
+                    raise _AmbiguousYaml
+        elif top is None and pending is None:
+            if document_started:
+                # Dedented below the document's root collection.
+                raise _AmbiguousYaml
+            stack.append((indent, "seq" if dashes else "map", set()))
+        elif pending is not None and indent > pending:
+            stack.append((indent, "seq" if dashes else "map", set()))
+        else:
+            raise _AmbiguousYaml
+        pending = None
+        document_started = True
+
+        # Nested "- - " items open one sequence per extra dash.
+        dash_columns = [
+            indent + dash_match.start() for dash_match in re.finditer(r"- *", dashes)
+        ]
+        for dash_column in dash_columns[1:]:
+            stack.append((dash_column, "seq", set()))
+        column = indent + len(dashes)
+
+        key_match = _SCAN_KEY_RE.match(rest)
+        key: str | None = None
+        if key_match is None:
+            if not dashes or ": " in rest:
+                raise _AmbiguousYaml
+            value_text = rest
+            owner_column = dash_columns[-1]
+        else:
+            key = key_match.group("key").rstrip()
+            if dashes:
+                stack.append((column, "map", set()))
+            keys_seen = stack[-1][2]
+            if key in keys_seen:
+                raise _AmbiguousYaml
+            keys_seen.add(key)
+            value_text = rest[key_match.end() :]
+            owner_column = column
+        kind = _classify_scalar(value_text)
+
+        if kind == "block":
+            header = _SCAN_BLOCK_HEADER_RE.match(value_text)
+            assert header is not None
+            body_start, body_end, body_indent = _find_block_body_span(lines, index)
+            if body_end >= body_start and body_indent <= owner_column:
+                raise _AmbiguousYaml
+            for body_line in lines[body_start : body_end + 1]:
+                if body_line.strip():
+                    break
+                if body_line.strip("\r\n"):
+                    # ruamel rejects indented blank lines before the first
+                    # content line of a block scalar.
+                    raise _AmbiguousYaml
+            if key in python_keys and body_end >= body_start:
+                if header.group("style") != "|":
+                    raise _AmbiguousYaml
+                value = _literal_block_value(
+                    lines, body_start, body_end, body_indent, header.group("chomp")
+                )
+                blocks.append((index, key, value))
+            index = max(body_end, index) + 1
+            continue
+
+        index += 1
+        next_index = _next_significant_line(lines, index)
+        next_indent = (
+            _count_leading_spaces(lines[next_index]) if next_index < len(lines) else -1
+        )
+        if kind == "empty":
+            pending = owner_column
+            if key in python_keys and next_indent > owner_column:
+                next_rest = lines[next_index].strip()
+                if not next_rest.startswith("-") and not _SCAN_KEY_RE.match(next_rest):
+                    # A plain multi-line string, which ruamel would format.
+                    raise _AmbiguousYaml
+            continue
+        if key in python_keys:
+            body_start, body_end, _ = _find_block_body_span(lines, index - 1)
+            if body_end >= body_start:
+                # ruamel formats inline Python values followed by blank or
+                # more indented lines; leave those cases to it.
+                raise _AmbiguousYaml
+        if next_indent > owner_column:
+            if kind != "plain":
+                raise _AmbiguousYaml
+            # Skip the continuation lines of a plain multi-line scalar.
+            while next_index < len(lines) and next_indent > owner_column:
+                continuation = lines[next_index].strip()
+                if (
+                    continuation.startswith(("-", "#"))
+                    or ": " in continuation
+                    or continuation.endswith(":")
+                ):
+                    raise _AmbiguousYaml
+                next_index = _next_significant_line(lines, next_index + 1)
+                next_indent = (
+                    _count_leading_spaces(lines[next_index])
+                    if next_index < len(lines)
+                    else -1
+                )
+            index = next_index
+    return blocks
+
+
 def _collect_text_replacements_for_doc(
-    doc: Any, lines: list[str], config: FormatterConfig, path: tuple[str, ...] = ()
+    doc: Any,
+    lines: list[str],
+    config: FormatterConfig,
+    path: tuple[str, ...] = (),
+    block_cache: MutableMapping[str, str] | None = None,
+    line_ranges: Sequence[tuple[int, int]] | None = None,
 ) -> list[tuple[int, int, str, tuple[str, ...]]]:
     """Walk a CommentedMap/CommentedSeq and collect textual replacements for
     block scalar bodies that need formatting.
@@ -271,29 +639,28 @@ def _collect_text_replacements_for_doc(
                     key_line = None
 
                 if key_line is not None:
-                    # Determine the body span in the original text
-                    body_start, body_end, body_indent = _find_block_body_span(
-                        lines, key_line
+                    replacement = _replacement_for_block(
+                        lines,
+                        key_line,
+                        value,
+                        config,
+                        current_path,
+                        block_cache,
+                        line_ranges,
                     )
-
-                    if body_end >= body_start:
-                        # Format using the detected body indent so we reinsert with the
-                        # same indentation level
-                        formatted = format_python_code(
-                            value, config, original_indent=body_indent
-                        )
-
-                        # Normalize newlines for comparison
-                        if _normalize_newlines(formatted) != _normalize_newlines(value):
-                            replacements.append(
-                                (body_start, body_end, formatted, current_path)
-                            )
+                    if replacement is not None:
+                        replacements.append(replacement)
             else:
                 # Recurse into nested structures
                 if isinstance(value, (CommentedMap, CommentedSeq)):
                     replacements.extend(
                         _collect_text_replacements_for_doc(
-                            value, lines, config, current_path
+                            value,
+                            lines,
+                            config,
+                            current_path,
+                            block_cache,
+                            line_ranges,
                         )
                     )
 
@@ -301,27 +668,69 @@ def _collect_text_replacements_for_doc(
         for idx, item in enumerate(doc):
             replacements.extend(
                 _collect_text_replacements_for_doc(
-                    item, lines, config, path + (str(idx),)
+                    item,
+                    lines,
+                    config,
+                    path + (str(idx),),
+                    block_cache,
+                    line_ranges,
                 )
             )
 
     return replacements
 
 
+def _collect_replacements_with_ruamel(
+    yaml_content: str,
+    lines: list[str],
+    config: FormatterConfig,
+    block_cache: MutableMapping[str, str] | None,
+    line_ranges: Sequence[tuple[int, int]] | None,
+) -> list[tuple[int, int, str, tuple[str, ...]]]:
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.width = 4096  # Prevent line wrapping in strings
+    # Use ruamel's parser to obtain position metadata; we'll replace text
+
+    # Load as a stream to handle multi-document YAML
+    documents = list(yaml.load_all(yaml_content))
+
+    replacements: list[tuple[int, int, str, tuple[str, ...]]] = []
+    for doc in documents:
+        if doc is None:
+            continue
+        replacements.extend(
+            _collect_text_replacements_for_doc(
+                doc, lines, config, block_cache=block_cache, line_ranges=line_ranges
+            )
+        )
+    return replacements
+
+
 def format_yaml_string(
     yaml_content: str,
     config: FormatterConfig | None = None,
+    *,
+    block_cache: MutableMapping[str, str] | None = None,
+    line_ranges: Sequence[tuple[int, int]] | None = None,
 ) -> tuple[str, bool]:
     """
     Format Python code blocks in a YAML string.
 
     This implementation prefers to perform in-place textual replacements for
     block scalar bodies so that unrelated YAML formatting (booleans, sequence
-    indentation, comments) is preserved exactly.
+    indentation, comments) is preserved exactly. The Python blocks are found
+    by scanning the text; only inputs the scanner cannot read unambiguously
+    are loaded with ruamel.
 
     Args:
         yaml_content: The YAML content as a string
         config: Formatter configuration (uses defaults if None)
+        block_cache: Formatted code blocks keyed by block and settings; blocks
+            found here skip Black and new results are added to it
+        line_ranges: Inclusive, 1-based (first, last) line ranges; when given,
+            only Python blocks whose key or body overlaps one of them are
+            formatted
 
     Returns:
         Tuple of (formatted YAML string, whether any changes were made)
@@ -329,22 +738,28 @@ def format_yaml_string(
     if config is None:
         config = FormatterConfig()
 
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.width = 4096  # Prevent line wrapping in strings
-    # Use ruamel's parser to obtain position metadata; we'll replace text
-
-    # Load as a stream to handle multi-document YAML
-    documents = list(yaml.load_all(yaml_content))
+    # Cheap pre-check: without any Python key there is nothing to format.
+    if not any(key in yaml_content for key in config.python_keys):
+        return yaml_content, False
 
     lines = yaml_content.splitlines(keepends=True)
     all_replacements: list[tuple[int, int, str, tuple[str, ...]]] = []
 
-    for doc in documents:
-        if doc is None:
-            continue
-        repls = _collect_text_replacements_for_doc(doc, lines, config)
-        all_replacements.extend(repls)
+    try:
+        if _NON_YAML_LINE_BREAKS.intersection(yaml_content):
+            raise _AmbiguousYaml
+        blocks = _scan_python_blocks(lines, config.python_keys)
+    except _AmbiguousYaml:
+        all_replacements = _collect_replacements_with_ruamel(
+            yaml_content, lines, config, block_cache, line_ranges
+        )
+    else:
+        for key_line, key, value in blocks:
+            replacement = _replacement_for_block(
+                lines, key_line, value, config, (key,), block_cache, line_ranges
+            )
+            if replacement is not None:
+                all_replacements.append(replacement)
 
     if all_replacements:
         # Apply replacements from bottom to top so indices don't shift
@@ -359,7 +774,8 @@ def format_yaml_string(
 
             lines[start : end + 1] = new_lines
 
-    return "".join(lines), bool(all_replacements)
+    formatted_content = "".join(lines)
+    return formatted_content, formatted_content != yaml_content
 
 
 def format_yaml_file(
@@ -445,10 +861,162 @@ def _collect_yaml_files(
     return sorted(result)
 
 
+@dataclass(frozen=True)
+class _FileOutcome:
+    """Result of formatting one file from the CLI, sent back from workers.
+
+    Workers only read the caches; new and reused cache entries travel back
+    here so the parent process can save them once at the end of the run.
+    """
+
+    path: Path
+    changed: bool = False
+    error: str | None = None
+    formatted_file_keys: tuple[str, ...] = ()
+    new_blocks: dict[str, str] = field(default_factory=dict)
+    used_block_keys: tuple[str, ...] = ()
+
+
+class _BlockCacheView(ChainMap[str, str]):
+    """New blocks over the loaded block cache, noting which cached blocks were used.
+
+    Writes go to *new_blocks*; reads answered from *cached* are kept in
+    :attr:`used_keys` so the parent process can mark them as used.
+    """
+
+    def __init__(self, new_blocks: dict[str, str], cached: dict[str, str]) -> None:
+        super().__init__(new_blocks, cached)
+        self.used_keys: set[str] = set()
+
+    def __getitem__(self, key: str) -> str:
+        value = super().__getitem__(key)
+        if key not in self.maps[0]:
+            self.used_keys.add(key)
+        return value
+
+
+@lru_cache(maxsize=None)
+def _load_formatter_caches(cache_dir: Path) -> tuple[JSONCache, JSONCache]:
+    """Return the (file, block) caches, loaded once per process."""
+    return (
+        JSONCache.load(
+            cache_dir / "formatter-files.json", version=_FORMATTER_CACHE_VERSION
+        ),
+        JSONCache.load(
+            cache_dir / "formatter-blocks.json", version=_FORMATTER_CACHE_VERSION
+        ),
+    )
+
+
+def _format_file_for_cli(
+    file_path: Path,
+    *,
+    config: FormatterConfig,
+    write: bool,
+    cache_dir: Path | None = None,
+    line_ranges: Sequence[tuple[int, int]] | None = None,
+) -> _FileOutcome:
+    if not file_path.exists():
+        return _FileOutcome(file_path, error=f"Error: File not found: {file_path}")
+    try:
+        content = file_path.read_text(encoding="utf-8")
+        if cache_dir is None:
+            formatted, changed = format_yaml_string(
+                content, config, line_ranges=line_ranges
+            )
+            if changed and write:
+                file_path.write_text(formatted, encoding="utf-8")
+            return _FileOutcome(file_path, changed=changed)
+
+        file_cache, block_cache = _load_formatter_caches(cache_dir)
+        config_fingerprint = _config_fingerprint(config)
+        file_key = cache_key(config_fingerprint, content)
+        if file_key in file_cache.entries:
+            return _FileOutcome(file_path, formatted_file_keys=(file_key,))
+        new_blocks: dict[str, str] = {}
+        block_view = _BlockCacheView(new_blocks, block_cache.entries)
+        formatted, changed = format_yaml_string(
+            content,
+            config,
+            block_cache=block_view,
+            line_ranges=line_ranges,
+        )
+        if changed and write:
+            file_path.write_text(formatted, encoding="utf-8")
+    except Exception as e:
+        return _FileOutcome(file_path, error=f"Error processing {file_path}: {e}")
+    # After a write the new content is known to be formatted; in --check mode
+    # only files that needed no changes are. Range formatting leaves blocks
+    # outside the ranges alone, so it proves nothing about the whole file.
+    formatted_file_keys = (
+        (cache_key(config_fingerprint, formatted),)
+        if line_ranges is None and (write or not changed)
+        else ()
+    )
+    return _FileOutcome(
+        file_path,
+        changed=changed,
+        formatted_file_keys=formatted_file_keys,
+        new_blocks=new_blocks,
+        used_block_keys=tuple(block_view.used_keys),
+    )
+
+
+def _parse_line_range(text: str) -> tuple[int, int]:
+    """Parse a --line-ranges value such as "10-25" into (10, 25)."""
+    first, sep, last = text.partition("-")
+    try:
+        if not sep:
+            raise ValueError
+        line_range = int(first), int(last)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid line range {text!r}; expected START-END, e.g. 10-25"
+        ) from None
+    if line_range[0] < 1 or line_range[1] < line_range[0]:
+        raise argparse.ArgumentTypeError(
+            f"invalid line range {text!r}; lines start at 1 and END must not "
+            "be before START"
+        )
+    return line_range
+
+
+def _format_stdin(
+    *,
+    config: FormatterConfig,
+    check: bool,
+    cache_dir: Path | None,
+    line_ranges: Sequence[tuple[int, int]] | None,
+) -> int:
+    """Format YAML read from stdin and write it to stdout, for editors."""
+    content = sys.stdin.read()
+    block_cache = None if cache_dir is None else _load_formatter_caches(cache_dir)[1]
+    new_blocks: dict[str, str] = {}
+    block_view = (
+        None
+        if block_cache is None
+        else _BlockCacheView(new_blocks, block_cache.entries)
+    )
+    try:
+        formatted, changed = format_yaml_string(
+            content, config, block_cache=block_view, line_ranges=line_ranges
+        )
+    except Exception as e:
+        print(f"Error processing -: {e}", file=sys.stderr)
+        return 1
+    if block_cache is not None and block_view is not None:
+        if new_blocks or block_view.used_keys:
+            block_cache.entries.update(new_blocks)
+            block_cache.touch(*block_view.used_keys)
+            block_cache.save()
+    if check:
+        return 1 if changed else 0
+    sys.stdout.write(formatted)
+    return 0
+
+
 def main() -> int:
     """CLI entry point."""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description="Format Python code blocks in docassemble YAML files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -457,6 +1025,9 @@ Examples:
     %(prog)s interview.yml
     %(prog)s --check interview.yml
     %(prog)s --line-length 79 interview.yml
+    %(prog)s --jobs 4 docassemble/      # Format files on 4 worker processes
+    %(prog)s - < interview.yml          # Read stdin, write the result to stdout
+    %(prog)s --line-ranges 40-60 -      # Only format blocks touching lines 40-60
     %(prog)s *.yml
     %(prog)s .                          # Format all YAML in current directory
     %(prog)s docassemble/MyRepo/        # Format all YAML in subdirectory
@@ -466,7 +1037,10 @@ Examples:
         "files",
         nargs="+",
         type=Path,
-        help="YAML files or directories to format (directories are searched recursively)",
+        help=(
+            "YAML files or directories to format (directories are searched "
+            "recursively); use - to read from stdin and write to stdout"
+        ),
     )
     parser.add_argument(
         "--check",
@@ -498,14 +1072,62 @@ Examples:
             "(.git*, .github*, sources)"
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the formatter cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory for the formatter cache (default: "
+            "$DAYAMLCHECKER_CACHE_DIR or $XDG_CACHE_HOME/dayamlchecker)"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for formatting files (default: 1)",
+    )
+    parser.add_argument(
+        "--line-ranges",
+        action="append",
+        type=_parse_line_range,
+        default=None,
+        metavar="START-END",
+        help=(
+            "Only format Python blocks overlapping these 1-based, inclusive "
+            "line ranges (repeatable; requires a single file or -)"
+        ),
+    )
 
     args = parser.parse_args()
+    reads_stdin = any(str(path) == "-" for path in args.files)
+    if reads_stdin and len(args.files) > 1:
+        parser.error("- cannot be combined with other files")
+    if args.line_ranges and (
+        len(args.files) > 1 or (not reads_stdin and args.files[0].is_dir())
+    ):
+        parser.error("--line-ranges requires a single file or -")
 
     config = FormatterConfig(
         black_line_length=args.line_length,
         convert_indent_4_to_2=not args.no_indent_conversion,
     )
 
+    cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir())
+    if reads_stdin:
+        return _format_stdin(
+            config=config,
+            check=args.check,
+            cache_dir=cache_dir,
+            line_ranges=args.line_ranges,
+        )
+
     # Collect all YAML files from paths (handles directories recursively)
     yaml_files = _collect_yaml_files(args.files, check_all=args.check_all)
     if not yaml_files:
@@ -517,36 +1139,57 @@ Examples:
     files_unchanged = 0
     files_error = 0
 
-    for file_path in yaml_files:
-        if not file_path.exists():
-            print(f"Error: File not found: {file_path}", file=sys.stderr)
-            files_error += 1
-            exit_code = 1
-            continue
-
-        try:
-            _, changed = format_yaml_file(
-                file_path,
-                config=config,
-                write=not args.check,
-            )
-
-            if changed:
+    format_file = partial(
+        _format_file_for_cli,
+        config=config,
+        write=not args.check,
+        cache_dir=cache_dir,
+        line_ranges=args.line_ranges,
+    )
+    formatted_file_keys: list[str] = []
+    new_blocks: dict[str, str] = {}
+    used_block_keys: set[str] = set()
+    with ExitStack() as stack:
+        outcomes: Iterable[_FileOutcome]
+        if args.jobs > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=args.jobs))
+            # map() yields results in input order, so output matches a serial run.
+            outcomes = executor.map(format_file, yaml_files)
+        else:
+            outcomes = map(format_file, yaml_files)
+
+        for outcome in outcomes:
+            formatted_file_keys.extend(outcome.formatted_file_keys)
+            new_blocks.update(outcome.new_blocks)
+            used_block_keys.update(outcome.used_block_keys)
+            if outcome.error is not None:
+                print(outcome.error, file=sys.stderr)
+                files_error += 1
+                exit_code = 1
+            elif outcome.changed:
                 files_changed += 1
                 if args.check:
-                    print(f"Would reformat: {file_path}")
+                    print(f"Would reformat: {outcome.path}")
                     exit_code = 1
                 elif not args.quiet:
-                    print(f"Reformatted: {file_path}")
+                    print(f"Reformatted: {outcome.path}")
             else:
                 files_unchanged += 1
                 if not args.quiet:
-                    print(f"Unchanged: {file_path}")
-
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}", file=sys.stderr)
-            files_error += 1
-            exit_code = 1
+                    print(f"Unchanged: {outcome.path}")
+
+    if cache_dir is not None:
+        file_cache, block_cache = _load_formatter_caches(cache_dir)
+        if formatted_file_keys:
+            file_cache.entries.update(dict.fromkeys(formatted_file_keys, True))
+            file_cache.touch(*formatted_file_keys)
+            file_cache.save()
+        # Blocks read from the cache are touched too, so blocks still in use
+        # do not age out and go back through Black.
+        if new_blocks or used_block_keys:
+            block_cache.entries.update(new_blocks)
+            block_cache.touch(*used_block_keys)
+            block_cache.save()
 
     if not args.quiet:
         total = files_changed + files_unchanged + files_error
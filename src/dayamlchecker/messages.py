@@ -181,6 +181,8 @@ class MessageId(StrEnum):
     URL_BROKEN_WARNING = "url_broken_warning"
     URL_UNREACHABLE_ERROR = "url_unreachable_error"
     URL_UNREACHABLE_WARNING = "url_unreachable_warning"
+    URL_SKIPPED_ERROR = "url_skipped_error"
+    URL_SKIPPED_WARNING = "url_skipped_warning"
 
 
 @dataclass(frozen=True, slots=True)
@@ -1145,6 +1147,26 @@ MESSAGE_DEFINITIONS: dict[str, MessageDefinition] = {
             "(found in: {sources})"
         ),
     ),
+    MessageId.URL_SKIPPED_ERROR: MessageDefinition(
+        code="EG604",
+        severity=Severity.ERROR,
+        finding_class=FindingClass.GENERAL,
+        summary="URL was not checked",
+        template=(
+            "did not check URL in {source_label} (out of time or not recorded): "
+            "{url} (found in: {sources})"
+        ),
+    ),
+    MessageId.URL_SKIPPED_WARNING: MessageDefinition(
+        code="WG604",
+        severity=Severity.WARNING,
+        finding_class=FindingClass.GENERAL,
+        summary="URL was not checked",
+        template=(
+            "did not check URL in {source_label} (out of time or not recorded): "
+            "{url} (found in: {sources})"
+        ),
+    ),
 }
 
 
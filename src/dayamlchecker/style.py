@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import ast
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
 from functools import lru_cache
-import html
 import importlib.resources
 import json
+import multiprocessing.util
 import os
+from pathlib import Path
 import re
+import threading
 from typing import Any, Iterable, Optional
 
 from dayamlchecker.accessibility import (
@@ -17,7 +22,16 @@ from dayamlchecker.accessibility import (
     _find_top_level_key_line,
     _iter_fields,
 )
+from dayamlchecker.cache import JSONCache, cache_key
 from dayamlchecker.messages import Finding, FindingDraft, MessageId, draft, make_finding
+from dayamlchecker.text_index import (
+    _MAKO_EXPR_RE,
+    _WORD_RE,
+    DocumentTextIndex,
+    IndexedText,
+    _plain_text,
+    _stringify,
+)
 import requests
 from ruamel.yaml import YAML
 
@@ -27,19 +41,12 @@ _OPENAI_API_KEY_ENV = "OPENAI_API_KEY"
 _OPENAI_MODEL_ENV = "OPENAI_MODEL"
 _DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 _DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
-_MAKO_EXPR_RE = re.compile(r"\$\{.*?\}", re.DOTALL)
-_MAKO_BLOCK_RE = re.compile(r"<%[\s\S]*?%>")
-_MAKO_CONTROL_RE = re.compile(r"(?m)^\s*%.*$")
-_MARKDOWN_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]+\)")
-_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
-_MARKDOWN_CODE_RE = re.compile(r"`([^`]+)`")
-_FILE_TAG_RE = re.compile(
-    r"\[FILE\s+([^,\]]+)(?:\s*,\s*([^,\]]+))?(?:\s*,\s*([^\]]+))?\]",
-    re.IGNORECASE,
-)
-_SENTENCE_RE = re.compile(r"[^.!?]+[.!?]")
-_WORD_RE = re.compile(r"\b\w+\b")
+_DEFAULT_LLM_CONCURRENCY = 4
+_DEFAULT_LLM_CHUNK_TOKENS = 3000
+# Rough size of a token for English prose and JSON; used only to size
+# requests, so no tokenizer is needed.
+_LLM_CHARS_PER_TOKEN = 4
+_LLM_CACHE_VERSION = 1
 _COMPOUND_QUESTION_RE = re.compile(
     r"\b(?:and|or)\s+"
     r"(?:who|what|when|where|why|how|do|does|did|is|are|am|was|were|"
@@ -119,8 +126,36 @@ class ParsedInterviewDocument:
     source_code: str
     document_start_line: int
     index: int
+    # Shared with the accessibility checks when the caller built one.
+    text_index: Optional[DocumentTextIndex] = field(
+        default=None, compare=False, repr=False
+    )
 
-    @property
+    @cached_property
+    def texts(self) -> DocumentTextIndex:
+        return self.text_index or DocumentTextIndex(self.doc, self.source_code)
+
+    @cached_property
+    def doc_text_entries(self) -> tuple[TextEntry, ...]:
+        return tuple(_iter_doc_text_entries(self))
+
+    @cached_property
+    def choice_text_entries(self) -> tuple[TextEntry, ...]:
+        return tuple(_iter_choice_text_entries(self))
+
+    @cached_property
+    def question_text_entries(self) -> tuple[TextEntry, ...]:
+        return tuple(_iter_question_text_entries(self))
+
+    @cached_property
+    def fields(self) -> list[dict[str, Any]]:
+        return _iter_fields(self.doc)
+
+    @cached_property
+    def variable_references(self) -> list[tuple[str, int]]:
+        return _variable_references(self)
+
+    @cached_property
     def screen_id(self) -> str:
         for key in ("id", "event"):
             value = _stringify(self.doc.get(key)).strip()
@@ -128,7 +163,17 @@ class ParsedInterviewDocument:
                 return value
         return f"block-{self.index}"
 
+    @cached_property
+    def _key_lines(self) -> dict[str, int]:
+        return {}
+
     def line_for_key(self, key: str) -> int:
+        line_number = self._key_lines.get(key)
+        if line_number is None:
+            line_number = self._key_lines[key] = self._find_line_for_key(key)
+        return line_number
+
+    def _find_line_for_key(self, key: str) -> int:
         key_line = _find_top_level_key_line(self.source_code, key)
         if key_line is not None:
             return _absolute_line_number(
@@ -156,10 +201,14 @@ class ParsedInterviewDocument:
 @dataclass(frozen=True)
 class TextEntry:
     location: str
-    text: str
+    indexed: IndexedText
     line_number: int
     screen_id: str
 
+    @property
+    def text(self) -> str:
+        return self.indexed.text
+
 
 @dataclass(frozen=True)
 class StyleLintOptions:
@@ -168,6 +217,11 @@ class StyleLintOptions:
     openai_base_url: str | None = None
     openai_api_key: str | None = None
     openai_model: str | None = None
+    llm_concurrency: int = _DEFAULT_LLM_CONCURRENCY
+    # Estimated tokens of screen text sent in one request.
+    llm_chunk_tokens: int = _DEFAULT_LLM_CHUNK_TOKENS
+    # Directory for the per-screen LLM result cache; None disables it.
+    llm_cache_dir: Path | None = None
 
     def llm_enabled(self) -> bool:
         return self.include_llm
@@ -211,50 +265,40 @@ def find_style_findings(
     docs: Iterable[ParsedInterviewDocument],
     input_file: str | None,
     options: Optional[StyleLintOptions] = None,
+    llm_screens: Optional[list[_LLMFileScreens]] = None,
 ) -> list[Finding]:
+    """Return the style and translatability findings for one file.
+
+    If ``llm_screens`` is given, the LLM rules are not run here; the file's
+    screens are appended to it for a package-wide ``review_llm_screens()``.
+    """
     resolved_options = options or StyleLintOptions()
     parsed_docs = list(docs)
-    deterministic: list[Finding] = []
-
-    for check in (
-        _check_choices_without_invariant_values,
-        _check_hardcoded_strings_in_code,
-        _check_ternary_conditional_text,
-        _check_conditional_sentence_fragments,
-        _check_subquestion_h1,
-        _check_language_en_flag,
-        _check_empty_screen_title,
-        _check_placeholder_language,
-        _check_plain_language_replacements,
-        _check_contractions,
-        _check_slash_alternatives,
-        _check_variable_conventions,
-        _check_long_sentences,
-        _check_compound_questions,
-        _check_overlong_labels,
-        _check_field_label_instruction_verbs,
-        _check_title_case_labels,
-        _check_other_choice_position,
-        _check_language_fields,
-        _check_pronoun_and_gender_fields,
-        _check_too_many_fields,
-        _check_wall_of_text,
-        _check_question_level_help,
-        _check_missing_help_on_complex_screens,
-        _check_exit_criteria_and_screen,
-        _check_theme_usage,
-        _check_review_screen_editability,
-        _check_prefer_person_objects,
-    ):
-        deterministic.extend(
-            finding.to_finding(file_name=input_file or "<string input>")
-            for finding in check(parsed_docs)
-        )
+    llm_api_key = ""
+    llm_review: _PendingLLMReview | None = None
+    if resolved_options.llm_enabled():
+        llm_api_key = resolved_options.resolved_openai_api_key()
+        if llm_api_key:
+            file_screens = _LLMFileScreens.from_docs(
+                parsed_docs, input_file=input_file, options=resolved_options
+            )
+            if llm_screens is not None:
+                if file_screens.screens:
+                    llm_screens.append(file_screens)
+            else:
+                # Sent before the deterministic rules run so the provider
+                # round trips overlap with them.
+                llm_review = _PendingLLMReview.submit(
+                    [file_screens], options=resolved_options
+                )
+    deterministic: list[Finding] = [
+        finding.to_finding(file_name=input_file or "<string input>")
+        for finding in _run_style_rules(parsed_docs)
+    ]
 
     if not resolved_options.llm_enabled():
         return _dedupe_findings(deterministic)
 
-    llm_api_key = resolved_options.resolved_openai_api_key()
     if not llm_api_key:
         deterministic.append(
             make_finding(
@@ -270,42 +314,140 @@ def find_style_findings(
         )
         return _dedupe_findings(deterministic)
 
-    deterministic.extend(
-        _run_llm_rules(
-            parsed_docs=parsed_docs,
-            input_file=input_file,
-            options=resolved_options,
-        )
-    )
+    if llm_review is not None:
+        deterministic.extend(llm_review.findings_by_file()[0])
     return _dedupe_findings(deterministic)
 
 
-# Translatability checks
-def _check_choices_without_invariant_values(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
+def review_llm_screens(
+    files: list[_LLMFileScreens], *, options: StyleLintOptions
+) -> list[list[Finding]]:
+    """Run the LLM rules over the screens of many files in shared requests.
+
+    Screens from all files are packed together up to the chunk budget, so a
+    package of short interviews needs a few requests per rule rather than a
+    few per file. Returns the LLM findings of each file, in order.
+    """
+    return [
+        _dedupe_findings(findings)
+        for findings in _PendingLLMReview.submit(
+            files, options=options
+        ).findings_by_file()
+    ]
+
+
+class _StyleRule:
+    """A style rule fed by the single traversal in _run_style_rules().
+
+    Each parsed document is visited once: visit_document(), then
+    visit_field() for each of its fields, then its text entries and
+    question text entries. Choice text entries follow once every
+    document has been visited, so every document's text comes before any
+    choice text. Rules only subscribe to the hooks they
+    override, and collect findings in their own list so the results come
+    out in rule order.
+    """
+
+    def __init__(self) -> None:
+        self.findings: list[FindingDraft] = []
+
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        pass
+
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        pass
+
+    def visit_doc_text(self, entry: TextEntry) -> None:
+        pass
+
+    def visit_question_text(self, entry: TextEntry) -> None:
+        pass
+
+    def visit_choice_text(self, entry: TextEntry) -> None:
+        pass
+
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        return self.findings
+
+
+class _UserFacingTextRule(_StyleRule, ABC):
+    """A rule over all user-facing text: doc text entries, then choice text."""
+
+    @abstractmethod
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
+        """Check one doc text or choice text entry."""
+
+    def visit_doc_text(self, entry: TextEntry) -> None:
+        self.visit_user_facing_text(entry)
+
+    def visit_choice_text(self, entry: TextEntry) -> None:
+        self.visit_user_facing_text(entry)
+
+
+def _run_style_rules(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+    rules = [rule_type() for rule_type in _STYLE_RULES]
+
+    def subscribers(hook: str) -> list[Any]:
+        return [
+            getattr(rule, hook)
+            for rule in rules
+            if getattr(type(rule), hook) is not getattr(_StyleRule, hook)
+        ]
+
+    on_document = subscribers("visit_document")
+    on_field = subscribers("visit_field")
+    on_doc_text = subscribers("visit_doc_text")
+    on_question_text = subscribers("visit_question_text")
+    on_choice_text = subscribers("visit_choice_text")
+
+    for parsed_doc in docs:
+        for visit_document in on_document:
+            visit_document(parsed_doc)
+        for index, field in enumerate(parsed_doc.fields):
+            for visit_field in on_field:
+                visit_field(parsed_doc, index, field)
+        for entry in parsed_doc.doc_text_entries:
+            for visit_doc_text in on_doc_text:
+                visit_doc_text(entry)
+        for entry in parsed_doc.question_text_entries:
+            for visit_question_text in on_question_text:
+                visit_question_text(entry)
+    for parsed_doc in docs:
+        for entry in parsed_doc.choice_text_entries:
+            for visit_choice_text in on_choice_text:
+                visit_choice_text(entry)
+
     findings: list[FindingDraft] = []
+    for rule in rules:
+        findings.extend(rule.finish(docs))
+    return findings
 
-    def has_noninvariant_choices(choices: Any) -> bool:
-        if not isinstance(choices, list):
-            return False
-        for item in choices:
-            if isinstance(item, str) and ": " not in item:
-                return True
-            if not isinstance(item, dict):
-                continue
-            if len(item) == 1 and "label" not in item and "value" not in item:
-                continue
-            if "label" in item and "value" not in item:
-                return True
+
+# Translatability checks
+def _has_noninvariant_choices(choices: Any) -> bool:
+    if not isinstance(choices, list):
         return False
+    for item in choices:
+        if isinstance(item, str) and ": " not in item:
+            return True
+        if not isinstance(item, dict):
+            continue
+        if len(item) == 1 and "label" not in item and "value" not in item:
+            continue
+        if "label" in item and "value" not in item:
+            return True
+    return False
 
-    for parsed_doc in docs:
+
+class _ChoicesWithoutInvariantValues(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
         for key in ("choices", "dropdown", "buttons"):
             value = parsed_doc.doc.get(key)
-            if not has_noninvariant_choices(value):
+            if not _has_noninvariant_choices(value):
                 continue
-            findings.append(
+            self.findings.append(
                 _style_draft(
                     MessageId.TRANSLATABILITY_CHOICES_WITHOUT_INVARIANT_VALUES,
                     line_number=parsed_doc.line_for_key(key),
@@ -314,34 +456,33 @@ def _check_choices_without_invariant_values(
                     snippet=_shorten(value),
                 )
             )
-        for field in _iter_fields(parsed_doc.doc):
-            choices = field.get("choices")
-            if not has_noninvariant_choices(choices):
-                continue
-            findings.append(
-                _style_draft(
-                    MessageId.TRANSLATABILITY_CHOICES_WITHOUT_INVARIANT_VALUES,
-                    line_number=parsed_doc.line_for_field(field),
-                    screen_id=parsed_doc.screen_id,
-                    origin="field choices",
-                    snippet=_shorten(choices),
-                )
+
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        choices = field.get("choices")
+        if not _has_noninvariant_choices(choices):
+            return
+        self.findings.append(
+            _style_draft(
+                MessageId.TRANSLATABILITY_CHOICES_WITHOUT_INVARIANT_VALUES,
+                line_number=parsed_doc.line_for_field(field),
+                screen_id=parsed_doc.screen_id,
+                origin="field choices",
+                snippet=_shorten(choices),
             )
-    return findings
+        )
 
 
-def _check_hardcoded_strings_in_code(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
+class _HardcodedStringsInCode(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
         code = _stringify(parsed_doc.doc.get("code"))
         if not code:
-            continue
+            return
         for content in _iter_user_facing_code_strings(code):
             normalized = content.strip()
             if _looks_user_facing_code_string(normalized):
-                findings.append(
+                self.findings.append(
                     _style_draft(
                         MessageId.TRANSLATABILITY_HARDCODED_USER_TEXT_IN_CODE,
                         line_number=parsed_doc.line_for_key("code"),
@@ -350,14 +491,10 @@ def _check_hardcoded_strings_in_code(
                     )
                 )
                 break
-    return findings
 
 
-def _check_ternary_conditional_text(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _user_facing_text_entries(docs):
+class _TernaryConditionalText(_UserFacingTextRule):
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
         for expression in _MAKO_EXPR_RE.findall(entry.text):
             source = expression[2:-1].strip()
             try:
@@ -366,7 +503,7 @@ def _check_ternary_conditional_text(
                 continue
             if not any(isinstance(node, ast.IfExp) for node in ast.walk(parsed)):
                 continue
-            findings.append(
+            self.findings.append(
                 _style_draft(
                     MessageId.TRANSLATABILITY_TERNARY_CONDITIONAL_TEXT,
                     line_number=entry.line_number,
@@ -376,18 +513,14 @@ def _check_ternary_conditional_text(
                 )
             )
             break
-    return findings
 
 
-def _check_conditional_sentence_fragments(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _user_facing_text_entries(docs):
+class _ConditionalSentenceFragments(_UserFacingTextRule):
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
         fragment = _find_conditional_sentence_fragment(entry.text)
         if fragment is None:
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.TRANSLATABILITY_CONDITIONAL_SENTENCE_FRAGMENT,
                 line_number=entry.line_number,
@@ -396,7 +529,6 @@ def _check_conditional_sentence_fragments(
                 snippet=_shorten(fragment),
             )
         )
-    return findings
 
 
 def _find_conditional_sentence_fragment(text: str) -> str | None:
@@ -437,14 +569,13 @@ def _is_sentence_fragment_context(before: str, after: str) -> bool:
     )
 
 
-def _check_subquestion_h1(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
+class _SubquestionH1(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
         subquestion = _stringify(parsed_doc.doc.get("subquestion"))
         match = re.search(r"(?m)^\s*#\s+.*$", subquestion)
         if not match:
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_SUBQUESTION_H1,
                 line_number=parsed_doc.line_for_key("subquestion"),
@@ -452,42 +583,34 @@ def _check_subquestion_h1(docs: list[ParsedInterviewDocument]) -> list[FindingDr
                 snippet=_shorten(match.group(0)),
             )
         )
-    return findings
 
 
-def _check_language_en_flag(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
+class _LanguageEnFlag(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
         if _stringify(parsed_doc.doc.get("language")).strip().lower() != "en":
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_REMOVE_LANGUAGE_EN,
                 line_number=parsed_doc.line_for_key("language"),
                 screen_id=parsed_doc.screen_id,
             )
         )
-    return findings
 
 
-def _check_empty_screen_title(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        question_text = _plain_text(
-            _visible_text(parsed_doc.doc.get("question"))
-        ).strip()
+class _EmptyScreenTitle(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        question_text = parsed_doc.texts.visible("question").plain.strip()
         if question_text:
-            continue
-        has_fields = len(_iter_fields(parsed_doc.doc)) > 0
+            return
+        has_fields = len(parsed_doc.fields) > 0
         supplemental = " ".join(
-            _plain_text(_visible_text(parsed_doc.doc.get(key)))
+            parsed_doc.texts.visible(key).plain
             for key in ("subquestion", "under", "help", "note", "html")
         ).strip()
         if not has_fields and len(supplemental) < 60:
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_MISSING_SCREEN_TITLE,
                 line_number=parsed_doc.default_line(),
@@ -495,20 +618,16 @@ def _check_empty_screen_title(
                 snippet=_shorten(supplemental or "question is blank"),
             )
         )
-    return findings
 
 
-def _check_placeholder_language(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _iter_doc_texts(docs):
-        plain = _plain_text(entry.text)
+class _PlaceholderLanguage(_StyleRule):
+    def visit_doc_text(self, entry: TextEntry) -> None:
+        plain = entry.indexed.plain
         for pattern in _PLACEHOLDER_PATTERNS:
             match = pattern.search(plain)
             if not match:
                 continue
-            findings.append(
+            self.findings.append(
                 _style_draft(
                     MessageId.STYLE_PLACEHOLDER_LANGUAGE,
                     line_number=entry.line_number,
@@ -518,21 +637,22 @@ def _check_placeholder_language(
                 )
             )
             break
-    return findings
 
 
-def _check_plain_language_replacements(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    seen: set[tuple[str, str, str]] = set()
-    for entry in _iter_doc_texts(docs):
-        for matched_text, replacement in _find_plain_language_suggestions(entry.text):
+class _PlainLanguageReplacements(_StyleRule):
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: set[tuple[str, str, str]] = set()
+
+    def visit_doc_text(self, entry: TextEntry) -> None:
+        for matched_text, replacement in _plain_language_suggestions(
+            entry.indexed.plain
+        ):
             key = (entry.screen_id, entry.location, matched_text.strip().lower())
-            if key in seen:
+            if key in self.seen:
                 continue
-            seen.add(key)
-            findings.append(
+            self.seen.add(key)
+            self.findings.append(
                 _style_draft(
                     MessageId.STYLE_PLAIN_LANGUAGE_REPLACEMENT,
                     line_number=entry.line_number,
@@ -542,21 +662,19 @@ def _check_plain_language_replacements(
                     replacement=_format_plain_language_replacement(replacement),
                 )
             )
-    return findings
 
 
-def _check_contractions(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _user_facing_text_entries(docs):
-        plain = _plain_text(entry.text)
+class _Contractions(_UserFacingTextRule):
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
+        plain = entry.indexed.plain
         match = _CONTRACTION_RE.search(plain)
         if not match:
-            continue
+            return
         if match.group(0).lower() == "don't" and re.search(
             r"\bi\s+don't\s+know\b", plain, re.IGNORECASE
         ):
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_CONTRACTION,
                 line_number=entry.line_number,
@@ -565,22 +683,18 @@ def _check_contractions(docs: list[ParsedInterviewDocument]) -> list[FindingDraf
                 matched_text=match.group(0),
             )
         )
-    return findings
 
 
-def _check_slash_alternatives(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _user_facing_text_entries(docs):
-        plain = _plain_text(entry.text)
+class _SlashAlternatives(_UserFacingTextRule):
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
+        plain = entry.indexed.plain
         for match in _SLASH_ALTERNATIVE_RE.finditer(plain):
             matched = match.group(0)
             if matched.lower() in _ALLOWED_SLASH_ALTERNATIVES:
                 continue
             if _looks_like_url_path_fragment(plain, match.start(), match.end()):
                 continue
-            findings.append(
+            self.findings.append(
                 _style_draft(
                     MessageId.STYLE_SLASH_ALTERNATIVE,
                     line_number=entry.line_number,
@@ -590,41 +704,44 @@ def _check_slash_alternatives(
                 )
             )
             break
-    return findings
 
 
-def _check_variable_conventions(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    valid_root_re = re.compile(r"^[a-z][a-z0-9_]*$")
-    bad_roots: dict[str, tuple[int, str]] = {}
-    for parsed_doc in docs:
-        for value, line_number in _variable_references(parsed_doc):
+class _VariableConventions(_StyleRule):
+    _VALID_ROOT_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bad_roots: dict[str, tuple[int, str]] = {}
+
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        for value, line_number in parsed_doc.variable_references:
             root = re.split(r"[.\[]", value, maxsplit=1)[0].strip()
-            if not root or valid_root_re.fullmatch(root):
+            if not root or self._VALID_ROOT_RE.fullmatch(root):
                 continue
-            bad_roots.setdefault(root, (line_number, parsed_doc.screen_id))
-    if not bad_roots:
-        return []
-    first_root = sorted(bad_roots.items(), key=lambda item: (item[1][0], item[0]))[0]
-    return [
-        _style_draft(
-            MessageId.STYLE_VARIABLE_ROOT_NOT_SNAKE_CASE,
-            line_number=first_root[1][0],
-            screen_id=first_root[1][1],
-            roots=", ".join(sorted(bad_roots)),
-        )
-    ]
+            self.bad_roots.setdefault(root, (line_number, parsed_doc.screen_id))
 
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        if not self.bad_roots:
+            return []
+        first_root = sorted(
+            self.bad_roots.items(), key=lambda item: (item[1][0], item[0])
+        )[0]
+        return [
+            _style_draft(
+                MessageId.STYLE_VARIABLE_ROOT_NOT_SNAKE_CASE,
+                line_number=first_root[1][0],
+                screen_id=first_root[1][1],
+                roots=", ".join(sorted(self.bad_roots)),
+            )
+        ]
 
-def _check_long_sentences(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _user_facing_text_entries(docs):
-        plain = _plain_text(entry.text)
-        for sentence in _SENTENCE_RE.findall(plain):
+
+class _LongSentences(_UserFacingTextRule):
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
+        for sentence in entry.indexed.sentences:
             if len(_WORD_RE.findall(sentence)) <= 20:
                 continue
-            findings.append(
+            self.findings.append(
                 _style_draft(
                     MessageId.STYLE_LONG_SENTENCE,
                     line_number=entry.line_number,
@@ -634,37 +751,39 @@ def _check_long_sentences(docs: list[ParsedInterviewDocument]) -> list[FindingDr
                 )
             )
             break
-    return findings
 
 
-def _check_compound_questions(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _question_text_entries(docs):
-        plain = _plain_text(entry.text).lower()
+class _CompoundQuestions(_StyleRule):
+    def visit_question_text(self, entry: TextEntry) -> None:
+        plain = entry.indexed.plain.lower()
         if "?" not in plain:
-            continue
+            return
         if "and/or" not in plain and not _COMPOUND_QUESTION_RE.search(plain):
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_COMPOUND_QUESTION,
                 line_number=entry.line_number,
                 screen_id=entry.screen_id,
                 location=entry.location,
-                snippet=_shorten(_plain_text(entry.text)),
+                snippet=_shorten(entry.indexed.plain),
             )
         )
-    return findings
 
 
-def _check_overlong_labels(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        question = _plain_text(_stringify(parsed_doc.doc.get("question")))
+class _OverlongLabels(_StyleRule):
+    def __init__(self) -> None:
+        super().__init__()
+        # Only the first overlong field label of each document is reported.
+        self.field_reported = False
+
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        self.field_reported = False
+        question = parsed_doc.texts.text(
+            _stringify(parsed_doc.doc.get("question"))
+        ).plain
         if len(question) > 120:
-            findings.append(
+            self.findings.append(
                 _style_draft(
                     MessageId.STYLE_OVERLONG_QUESTION_LABEL,
                     line_number=parsed_doc.line_for_key("question"),
@@ -672,75 +791,72 @@ def _check_overlong_labels(docs: list[ParsedInterviewDocument]) -> list[FindingD
                     snippet=_shorten(question),
                 )
             )
-        for field in _iter_fields(parsed_doc.doc):
-            field_label = _extract_field_label(field)
-            if len(field_label) <= 90:
-                continue
-            findings.append(
-                _style_draft(
-                    MessageId.STYLE_OVERLONG_FIELD_LABEL,
-                    line_number=parsed_doc.line_for_field(field),
-                    screen_id=parsed_doc.screen_id,
-                    snippet=_shorten(field_label),
-                )
+
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        if self.field_reported:
+            return
+        field_label = _extract_field_label(field)
+        if len(field_label) <= 90:
+            return
+        self.field_reported = True
+        self.findings.append(
+            _style_draft(
+                MessageId.STYLE_OVERLONG_FIELD_LABEL,
+                line_number=parsed_doc.line_for_field(field),
+                screen_id=parsed_doc.screen_id,
+                snippet=_shorten(field_label),
             )
-            break
-    return findings
+        )
 
 
-def _check_field_label_instruction_verbs(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        for field in _iter_fields(parsed_doc.doc):
-            label = _extract_field_label(field).strip()
-            if not label or not _FIELD_LABEL_INSTRUCTION_VERB_RE.search(label):
-                continue
-            findings.append(
-                _style_draft(
-                    MessageId.STYLE_FIELD_LABEL_INSTRUCTION_VERB,
-                    line_number=parsed_doc.line_for_field(field),
-                    screen_id=parsed_doc.screen_id,
-                    snippet=_shorten(label),
-                )
+class _FieldLabelInstructionVerbs(_StyleRule):
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        label = _extract_field_label(field).strip()
+        if not label or not _FIELD_LABEL_INSTRUCTION_VERB_RE.search(label):
+            return
+        self.findings.append(
+            _style_draft(
+                MessageId.STYLE_FIELD_LABEL_INSTRUCTION_VERB,
+                line_number=parsed_doc.line_for_field(field),
+                screen_id=parsed_doc.screen_id,
+                snippet=_shorten(label),
             )
-    return findings
+        )
 
 
-def _check_title_case_labels(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        for field in _iter_fields(parsed_doc.doc):
-            if _field_is_choice_style(field):
-                continue
-            label = _extract_field_label(field)
-            if not _looks_like_title_case_label(label):
-                continue
-            findings.append(
-                _style_draft(
-                    MessageId.STYLE_TITLE_CASE_LABEL,
-                    line_number=parsed_doc.line_for_field(field),
-                    screen_id=parsed_doc.screen_id,
-                    snippet=_shorten(label),
-                )
+class _TitleCaseLabels(_StyleRule):
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        if _field_is_choice_style(field):
+            return
+        label = _extract_field_label(field)
+        if not _looks_like_title_case_label(label):
+            return
+        self.findings.append(
+            _style_draft(
+                MessageId.STYLE_TITLE_CASE_LABEL,
+                line_number=parsed_doc.line_for_field(field),
+                screen_id=parsed_doc.screen_id,
+                snippet=_shorten(label),
             )
-    return findings
+        )
 
 
-def _check_other_choice_position(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
+class _OtherChoicePosition(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
         for origin, choices, line_number in _iter_choice_sources(parsed_doc):
             options = _choice_options(choices)
             if len(options) < 2:
                 continue
-            for index, option in enumerate(options[:-1]):
+            for option in options[:-1]:
                 if option["label"].strip().lower() != "other":
                     continue
-                findings.append(
+                self.findings.append(
                     _style_draft(
                         MessageId.STYLE_OTHER_CHOICE_NOT_LAST,
                         line_number=line_number,
@@ -749,52 +865,53 @@ def _check_other_choice_position(
                     )
                 )
                 break
-    return findings
 
 
-def _check_language_fields(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        for field in _iter_fields(parsed_doc.doc):
-            if not _is_language_field(field):
-                continue
-            label = _extract_field_label(field) or _extract_field_variable(field)
-            if _field_uses_dropdown(field):
-                findings.append(
-                    _style_draft(
-                        MessageId.STYLE_LANGUAGE_DROPDOWN,
-                        line_number=parsed_doc.line_for_field(field),
-                        screen_id=parsed_doc.screen_id,
-                        snippet=_shorten(label),
-                    )
+class _LanguageFields(_StyleRule):
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        if not _is_language_field(field):
+            return
+        label = _extract_field_label(field) or _extract_field_variable(field)
+        if _field_uses_dropdown(field):
+            self.findings.append(
+                _style_draft(
+                    MessageId.STYLE_LANGUAGE_DROPDOWN,
+                    line_number=parsed_doc.line_for_field(field),
+                    screen_id=parsed_doc.screen_id,
+                    snippet=_shorten(label),
                 )
-            for option in _choice_options(field.get("choices")):
-                value = option["value"].strip()
-                if not value or value.lower() == "other":
-                    continue
-                if re.fullmatch(r"[a-z]{2,3}", value):
-                    continue
-                findings.append(
-                    _style_draft(
-                        MessageId.STYLE_LANGUAGE_CHOICE_VALUE,
-                        line_number=parsed_doc.line_for_field(field),
-                        screen_id=parsed_doc.screen_id,
-                        snippet=_shorten(f'{option["label"]}: {value}'),
-                    )
+            )
+        for option in _choice_options(field.get("choices")):
+            value = option["value"].strip()
+            if not value or value.lower() == "other":
+                continue
+            if re.fullmatch(r"[a-z]{2,3}", value):
+                continue
+            self.findings.append(
+                _style_draft(
+                    MessageId.STYLE_LANGUAGE_CHOICE_VALUE,
+                    line_number=parsed_doc.line_for_field(field),
+                    screen_id=parsed_doc.screen_id,
+                    snippet=_shorten(f'{option["label"]}: {value}'),
                 )
-                break
-    return findings
+            )
+            break
 
 
-def _check_pronoun_and_gender_fields(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for entry in _user_facing_text_entries(docs):
-        plain = _plain_text(entry.text)
+class _PronounAndGenderFields(_UserFacingTextRule):
+    def __init__(self) -> None:
+        super().__init__()
+        # Text findings come before field findings, as in one pass over
+        # all text followed by one pass over all fields.
+        self.field_findings: list[FindingDraft] = []
+
+    def visit_user_facing_text(self, entry: TextEntry) -> None:
+        plain = entry.indexed.plain
         if not re.search(r"\bpreferred\s+pronouns\b", plain, re.IGNORECASE):
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_PREFERRED_PRONOUNS,
                 line_number=entry.line_number,
@@ -804,57 +921,57 @@ def _check_pronoun_and_gender_fields(
             )
         )
 
-    for parsed_doc in docs:
-        for field in _iter_fields(parsed_doc.doc):
-            label = _extract_field_label(field)
-            variable = _extract_field_variable(field)
-            combined = f"{label} {variable}".lower()
-            if re.search(r"\bpronouns?\b", combined) and _is_truthy(
-                field.get("required")
-            ):
-                findings.append(
-                    _style_draft(
-                        MessageId.STYLE_REQUIRED_PRONOUN_FIELD,
-                        line_number=parsed_doc.line_for_field(field),
-                        screen_id=parsed_doc.screen_id,
-                        snippet=_shorten(label or variable),
-                    )
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        label = _extract_field_label(field)
+        variable = _extract_field_variable(field)
+        combined = f"{label} {variable}".lower()
+        if re.search(r"\bpronouns?\b", combined) and _is_truthy(field.get("required")):
+            self.field_findings.append(
+                _style_draft(
+                    MessageId.STYLE_REQUIRED_PRONOUN_FIELD,
+                    line_number=parsed_doc.line_for_field(field),
+                    screen_id=parsed_doc.screen_id,
+                    snippet=_shorten(label or variable),
                 )
-            if not re.search(r"\bgender\b", combined):
-                continue
-            labels = [
-                option["label"].strip().lower()
-                for option in _choice_options(field.get("choices"))
-                if option["label"].strip()
-            ]
-            if "other" in labels:
-                findings.append(
-                    _style_draft(
-                        MessageId.STYLE_GENDER_OTHER_CHOICE,
-                        line_number=parsed_doc.line_for_field(field),
-                        screen_id=parsed_doc.screen_id,
-                        snippet=_shorten(label or variable),
-                    )
+            )
+        if not re.search(r"\bgender\b", combined):
+            return
+        labels = [
+            option["label"].strip().lower()
+            for option in _choice_options(field.get("choices"))
+            if option["label"].strip()
+        ]
+        if "other" in labels:
+            self.field_findings.append(
+                _style_draft(
+                    MessageId.STYLE_GENDER_OTHER_CHOICE,
+                    line_number=parsed_doc.line_for_field(field),
+                    screen_id=parsed_doc.screen_id,
+                    snippet=_shorten(label or variable),
                 )
-            if set(labels) == {"female", "male"}:
-                findings.append(
-                    _style_draft(
-                        MessageId.STYLE_GENDER_BINARY_ONLY,
-                        line_number=parsed_doc.line_for_field(field),
-                        screen_id=parsed_doc.screen_id,
-                        snippet=_shorten(label or variable),
-                    )
+            )
+        if set(labels) == {"female", "male"}:
+            self.field_findings.append(
+                _style_draft(
+                    MessageId.STYLE_GENDER_BINARY_ONLY,
+                    line_number=parsed_doc.line_for_field(field),
+                    screen_id=parsed_doc.screen_id,
+                    snippet=_shorten(label or variable),
                 )
-    return findings
+            )
 
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        return self.findings + self.field_findings
 
-def _check_too_many_fields(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        field_count = len(_iter_fields(parsed_doc.doc))
+
+class _TooManyFields(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        field_count = len(parsed_doc.fields)
         if field_count <= 6:
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_TOO_MANY_FIELDS_ON_SCREEN,
                 line_number=parsed_doc.default_line(),
@@ -862,22 +979,21 @@ def _check_too_many_fields(docs: list[ParsedInterviewDocument]) -> list[FindingD
                 field_count=field_count,
             )
         )
-    return findings
 
 
-def _check_wall_of_text(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        subquestion = _stringify(parsed_doc.doc.get("subquestion"))
-        plain = _plain_text(subquestion)
-        word_count = len(_WORD_RE.findall(plain))
+class _WallOfText(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        indexed = parsed_doc.texts.text(_stringify(parsed_doc.doc.get("subquestion")))
+        subquestion = indexed.text
+        plain = indexed.plain
+        word_count = indexed.word_count
         has_structure = bool(
             re.search(r"(?m)^\s*[-*]\s+", subquestion)
             or re.search(r"(?m)^\s*#{2,6}\s+", subquestion)
         )
         if word_count <= 120 or has_structure:
-            continue
-        findings.append(
+            return
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_WALL_OF_TEXT,
                 line_number=parsed_doc.line_for_key("subquestion"),
@@ -885,24 +1001,20 @@ def _check_wall_of_text(docs: list[ParsedInterviewDocument]) -> list[FindingDraf
                 snippet=_shorten(plain),
             )
         )
-    return findings
 
 
-def _check_question_level_help(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
+class _QuestionLevelHelp(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
         help_value = parsed_doc.doc.get("help")
         if help_value is None:
-            continue
+            return
         if not any(
             _stringify(parsed_doc.doc.get(key)).strip()
             for key in ("question", "subquestion", "field")
         ) and not parsed_doc.doc.get("fields"):
-            continue
+            return
         help_text = _stringify(help_value).strip()
-        findings.append(
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_QUESTION_LEVEL_HELP,
                 line_number=parsed_doc.line_for_key("help"),
@@ -910,29 +1022,25 @@ def _check_question_level_help(
                 snippet=_shorten(help_text or "help"),
             )
         )
-    return findings
 
 
-def _check_missing_help_on_complex_screens(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    findings: list[FindingDraft] = []
-    for parsed_doc in docs:
-        fields = _iter_fields(parsed_doc.doc)
+class _MissingHelpOnComplexScreens(_StyleRule):
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        fields = parsed_doc.fields
         if len(fields) < 5:
-            continue
+            return
         has_help = bool(parsed_doc.doc.get("help"))
         for field in fields:
             if field.get("help") or field.get("hint") or field.get("note"):
                 has_help = True
                 break
         if has_help:
-            continue
+            return
         sample_labels = [
             _extract_field_label(field) or _extract_field_variable(field)
             for field in fields
         ]
-        findings.append(
+        self.findings.append(
             _style_draft(
                 MessageId.STYLE_COMPLEX_SCREEN_MISSING_HELP,
                 line_number=parsed_doc.default_line(),
@@ -943,237 +1051,421 @@ def _check_missing_help_on_complex_screens(
                 ),
             )
         )
-    return findings
 
 
-def _check_exit_criteria_and_screen(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    metadata = _find_metadata(docs)
-    screening_signal = bool(_stringify(metadata.get("can_I_use_this_form")).strip())
-    for parsed_doc in docs:
-        combined = " ".join(
-            _stringify(parsed_doc.doc.get(key))
-            for key in ("question", "subquestion", "id", "event")
-        ).lower()
-        if any(
-            marker in combined
-            for marker in (
-                "can i use",
-                "eligible",
-                "qualify",
-                "right form",
-                "wrong form",
+class _ExitCriteriaAndScreen(_StyleRule):
+    _SCREENING_MARKERS = (
+        "can i use",
+        "eligible",
+        "qualify",
+        "right form",
+        "wrong form",
+    )
+    _EXIT_MARKERS = (
+        "not eligible",
+        "may not be able",
+        "cannot help",
+        "can't help",
+        "wrong form",
+        "stop here",
+        "exit",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.metadata: dict[str, Any] = {}
+        self.screening_marker_seen = False
+        self.exit_screen_seen = False
+
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        block = parsed_doc.doc.get("metadata")
+        if isinstance(block, dict):
+            self.metadata.update(block)
+        if not self.screening_marker_seen:
+            combined = " ".join(
+                _stringify(parsed_doc.doc.get(key))
+                for key in ("question", "subquestion", "id", "event")
+            ).lower()
+            self.screening_marker_seen = any(
+                marker in combined for marker in self._SCREENING_MARKERS
             )
-        ):
-            screening_signal = True
-            break
-    if not screening_signal:
-        return []
-    for parsed_doc in docs:
-        combined = " ".join(
-            _stringify(parsed_doc.doc.get(key))
-            for key in ("question", "subquestion", "under", "id", "event")
-        ).lower()
-        if any(
-            marker in combined
-            for marker in (
-                "not eligible",
-                "may not be able",
-                "cannot help",
-                "can't help",
-                "wrong form",
-                "stop here",
-                "exit",
+        if not self.exit_screen_seen:
+            combined = " ".join(
+                _stringify(parsed_doc.doc.get(key))
+                for key in ("question", "subquestion", "under", "id", "event")
+            ).lower()
+            self.exit_screen_seen = any(
+                marker in combined for marker in self._EXIT_MARKERS
             )
-        ):
-            return []
-    line_number = docs[0].default_line() if docs else 1
-    return [
-        _style_draft(
-            MessageId.STYLE_MISSING_EXIT_CRITERIA_SCREEN,
-            line_number=line_number,
-            screen_id=docs[0].screen_id if docs else None,
+
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        screening_signal = self.screening_marker_seen or bool(
+            _stringify(self.metadata.get("can_I_use_this_form")).strip()
         )
-    ]
+        if not screening_signal or self.exit_screen_seen:
+            return []
+        line_number = docs[0].default_line() if docs else 1
+        return [
+            _style_draft(
+                MessageId.STYLE_MISSING_EXIT_CRITERIA_SCREEN,
+                line_number=line_number,
+                screen_id=docs[0].screen_id if docs else None,
+            )
+        ]
 
 
-def _check_theme_usage(docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
-    metadata_docs = [
-        parsed_doc
-        for parsed_doc in docs
-        if isinstance(parsed_doc.doc.get("metadata"), dict)
-    ]
-    if not metadata_docs:
-        return []
-    theme_references: set[str] = set()
-    for parsed_doc in docs:
+class _ThemeUsage(_StyleRule):
+    def __init__(self) -> None:
+        super().__init__()
+        self.metadata_docs: list[ParsedInterviewDocument] = []
+        self.theme_references: set[str] = set()
+
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        if isinstance(parsed_doc.doc.get("metadata"), dict):
+            self.metadata_docs.append(parsed_doc)
         include_value = parsed_doc.doc.get("include")
-        theme_references.update(_iter_include_values(include_value))
+        self.theme_references.update(_iter_include_values(include_value))
         css_value = _stringify(parsed_doc.doc.get("css")).strip().lower()
         if css_value:
-            theme_references.add(css_value)
+            self.theme_references.add(css_value)
         features = parsed_doc.doc.get("features")
         if isinstance(features, dict):
             bootstrap_theme = (
                 _stringify(features.get("bootstrap theme")).strip().lower()
             )
             if bootstrap_theme:
-                theme_references.add(bootstrap_theme)
-    if any(
-        marker in reference
-        for reference in theme_references
-        for marker in ("theme", "css", "bootstrap")
-    ):
-        return []
-    metadata_doc = metadata_docs[0]
-    return [
-        _style_draft(
-            MessageId.STYLE_MISSING_CUSTOM_THEME,
-            line_number=metadata_doc.line_for_key("metadata"),
-            screen_id=metadata_doc.screen_id,
-        )
-    ]
+                self.theme_references.add(bootstrap_theme)
 
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        if not self.metadata_docs:
+            return []
+        if any(
+            marker in reference
+            for reference in self.theme_references
+            for marker in ("theme", "css", "bootstrap")
+        ):
+            return []
+        metadata_doc = self.metadata_docs[0]
+        return [
+            _style_draft(
+                MessageId.STYLE_MISSING_CUSTOM_THEME,
+                line_number=metadata_doc.line_for_key("metadata"),
+                screen_id=metadata_doc.screen_id,
+            )
+        ]
 
-def _check_review_screen_editability(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    review_docs = [parsed_doc for parsed_doc in docs if _is_review_screen(parsed_doc)]
-    if not review_docs:
-        return []
 
-    editable_variables: set[str] = set()
-    for parsed_doc in review_docs:
-        editable_variables.update(_review_edit_variables(parsed_doc.doc.get("review")))
+class _ReviewScreenEditability(_StyleRule):
+    def __init__(self) -> None:
+        super().__init__()
+        self.review_docs: list[ParsedInterviewDocument] = []
+        self.editable_variables: set[str] = set()
+        self.key_choice_variables: set[str] = set()
 
-    findings: list[FindingDraft] = []
-    if not editable_variables:
-        review_doc = review_docs[0]
-        findings.append(
-            _style_draft(
-                MessageId.STYLE_REVIEW_SCREEN_MISSING_EDIT_LINKS,
-                line_number=review_doc.default_line(),
-                screen_id=review_doc.screen_id,
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        if _is_review_screen(parsed_doc):
+            self.review_docs.append(parsed_doc)
+            self.editable_variables.update(
+                _review_edit_variables(parsed_doc.doc.get("review"))
             )
+
+    def visit_field(
+        self, parsed_doc: ParsedInterviewDocument, index: int, field: dict[str, Any]
+    ) -> None:
+        if not _field_looks_like_key_choice(field):
+            return
+        field_var = _extract_field_variable(field).strip()
+        if field_var:
+            self.key_choice_variables.add(field_var)
+
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        if not self.review_docs:
+            return []
+        review_doc = self.review_docs[0]
+        if not self.editable_variables:
+            return [
+                _style_draft(
+                    MessageId.STYLE_REVIEW_SCREEN_MISSING_EDIT_LINKS,
+                    line_number=review_doc.default_line(),
+                    screen_id=review_doc.screen_id,
+                )
+            ]
+        key_choice_variables = sorted(self.key_choice_variables)
+        if key_choice_variables and not any(
+            _variable_name_matches(edit_name, key_choice)
+            for edit_name in self.editable_variables
+            for key_choice in key_choice_variables
+        ):
+            return [
+                _style_draft(
+                    MessageId.STYLE_REVIEW_SCREEN_MISSING_KEY_CHOICE_EDITS,
+                    line_number=review_doc.default_line(),
+                    screen_id=review_doc.screen_id,
+                    snippet=", ".join(key_choice_variables[:4]),
+                )
+            ]
+        return []
+
+
+class _PreferPersonObjects(_StyleRule):
+    def __init__(self) -> None:
+        super().__init__()
+        self.references: list[tuple[str, int, str]] = []
+
+    def visit_document(self, parsed_doc: ParsedInterviewDocument) -> None:
+        self.references.extend(
+            (reference, line_number, parsed_doc.screen_id)
+            for reference, line_number in parsed_doc.variable_references
         )
-        return findings
 
-    key_choice_variables = sorted(
-        {
-            field_var
-            for parsed_doc in docs
-            for field in _iter_fields(parsed_doc.doc)
-            if _field_looks_like_key_choice(field)
-            for field_var in [_extract_field_variable(field).strip()]
-            if field_var
-        }
-    )
-    if key_choice_variables and not any(
-        _variable_name_matches(edit_name, key_choice)
-        for edit_name in editable_variables
-        for key_choice in key_choice_variables
-    ):
-        review_doc = review_docs[0]
-        findings.append(
+    def finish(self, docs: list[ParsedInterviewDocument]) -> list[FindingDraft]:
+        references = self.references
+        if not references:
+            return []
+        if any(
+            marker in reference
+            for reference, _, _ in references
+            for marker in (".name.", ".address.", ".birthdate", ".gender")
+        ):
+            return []
+        name_parts = [
+            item
+            for item in references
+            if re.search(r"(first|middle|last|full)_name$", item[0])
+        ]
+        address_parts = [
+            item
+            for item in references
+            if re.search(r"(address|street|unit|city|state|zip|postal_code)$", item[0])
+        ]
+        if len(name_parts) < 2 and len(address_parts) < 3:
+            return []
+        first_reference, line_number, screen_id = sorted(
+            name_parts + address_parts,
+            key=lambda item: (item[1], item[0]),
+        )[0]
+        return [
             _style_draft(
-                MessageId.STYLE_REVIEW_SCREEN_MISSING_KEY_CHOICE_EDITS,
-                line_number=review_doc.default_line(),
-                screen_id=review_doc.screen_id,
-                snippet=", ".join(key_choice_variables[:4]),
+                MessageId.STYLE_PREFER_PERSON_OBJECTS,
+                line_number=line_number,
+                screen_id=screen_id,
+                snippet=first_reference,
             )
-        )
-    return findings
+        ]
 
 
-def _check_prefer_person_objects(
-    docs: list[ParsedInterviewDocument],
-) -> list[FindingDraft]:
-    references = [
-        (reference, line_number, parsed_doc.screen_id)
-        for parsed_doc in docs
-        for reference, line_number in _variable_references(parsed_doc)
-    ]
-    if not references:
-        return []
-    if any(
-        marker in reference
-        for reference, _, _ in references
-        for marker in (".name.", ".address.", ".birthdate", ".gender")
-    ):
-        return []
-    name_parts = [
-        item
-        for item in references
-        if re.search(r"(first|middle|last|full)_name$", item[0])
-    ]
-    address_parts = [
-        item
-        for item in references
-        if re.search(r"(address|street|unit|city|state|zip|postal_code)$", item[0])
-    ]
-    if len(name_parts) < 2 and len(address_parts) < 3:
-        return []
-    first_reference, line_number, screen_id = sorted(
-        name_parts + address_parts,
-        key=lambda item: (item[1], item[0]),
-    )[0]
-    return [
-        _style_draft(
-            MessageId.STYLE_PREFER_PERSON_OBJECTS,
-            line_number=line_number,
-            screen_id=screen_id,
-            snippet=first_reference,
-        )
-    ]
+_STYLE_RULES: tuple[type[_StyleRule], ...] = (
+    _ChoicesWithoutInvariantValues,
+    _HardcodedStringsInCode,
+    _TernaryConditionalText,
+    _ConditionalSentenceFragments,
+    _SubquestionH1,
+    _LanguageEnFlag,
+    _EmptyScreenTitle,
+    _PlaceholderLanguage,
+    _PlainLanguageReplacements,
+    _Contractions,
+    _SlashAlternatives,
+    _VariableConventions,
+    _LongSentences,
+    _CompoundQuestions,
+    _OverlongLabels,
+    _FieldLabelInstructionVerbs,
+    _TitleCaseLabels,
+    _OtherChoicePosition,
+    _LanguageFields,
+    _PronounAndGenderFields,
+    _TooManyFields,
+    _WallOfText,
+    _QuestionLevelHelp,
+    _MissingHelpOnComplexScreens,
+    _ExitCriteriaAndScreen,
+    _ThemeUsage,
+    _ReviewScreenEditability,
+    _PreferPersonObjects,
+)
 
 
-def _run_llm_rules(
-    *,
-    parsed_docs: list[ParsedInterviewDocument],
-    input_file: str | None,
-    options: StyleLintOptions,
-) -> list[Finding]:
-    prompts = _load_llm_prompt_templates()
-    llm_rules = prompts.get("llm_rules")
-    if not isinstance(llm_rules, list):
-        return []
-    screen_payload = _build_screen_payload(parsed_docs)
-    if not screen_payload:
-        return []
-    findings: list[Finding] = []
-    for rule in llm_rules:
-        if not isinstance(rule, dict):
-            continue
-        rule_id = _stringify(rule.get("rule_id")).strip()
-        system_prompt = _stringify(rule.get("system_prompt"))
-        user_prompt = _stringify(rule.get("user_prompt")).replace(
-            "{screens_json}", screen_payload
-        )
-        raw_response, error_detail = _call_openai_chat_completion(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            base_url=options.resolved_openai_base_url(),
-            api_key=options.resolved_openai_api_key(),
-            model=options.resolved_openai_model(),
-        )
-        if error_detail is not None:
-            findings.append(
-                make_finding(
-                    MessageId.STYLE_LLM_REQUEST_FAILED,
-                    file_name=input_file,
-                    line_number=parsed_docs[0].default_line() if parsed_docs else 1,
-                    screen_id=parsed_docs[0].screen_id if parsed_docs else "",
-                    rule_id=rule_id or "style-llm",
-                    detail=error_detail,
+# Files may be linted on several threads, so the process-wide LLM pools and
+# caches are created under a lock rather than with lru_cache, which can run
+# the factory twice and hand out an instance it then drops.
+_LLM_SHARED_LOCK = threading.Lock()
+_LLM_REQUEST_POOLS: dict[int, ThreadPoolExecutor] = {}
+_LLM_RESULT_CACHES: dict[Path, _LLMResultCache] = {}
+
+
+def _llm_request_pool(concurrency: int) -> ThreadPoolExecutor:
+    """Return the process-wide pool that bounds in-flight LLM requests.
+
+    Every file linted in this process submits to the same pool, so
+    ``concurrency`` limits the requests across files and rules together.
+    """
+    with _LLM_SHARED_LOCK:
+        pool = _LLM_REQUEST_POOLS.get(concurrency)
+        if pool is None:
+            pool = _LLM_REQUEST_POOLS[concurrency] = ThreadPoolExecutor(
+                max_workers=max(1, concurrency),
+                thread_name_prefix="dayamlchecker-llm",
+            )
+        return pool
+
+
+class _LLMResultCache:
+    """LLM findings for each screen, reused while the screen is unchanged.
+
+    Entries map a key built from the rule, its prompt templates, the model
+    and the screen to the raw finding items the provider returned for that
+    screen, so only new or edited screens are sent again. One instance is
+    shared by every file and rule request in a process, and reviews only
+    change it in memory; see :func:`save_llm_result_caches`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._cache = JSONCache.load(path, version=_LLM_CACHE_VERSION)
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        items = self._cache.entries.get(key)
+        if not isinstance(items, list):
+            return None
+        with self._lock:
+            self._cache.touch(key)
+            self._changed = True
+        return items
+
+    def put(self, key: str, items: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._cache.entries[key] = items
+            self._changed = True
+
+    def save(self) -> None:
+        """Merge into the file, keeping other processes' entries.
+
+        Screens that were neither reviewed nor reused for a while are dropped
+        by :meth:`JSONCache.save`.
+        """
+        with self._lock:
+            if not self._changed:
+                return
+            self._cache.save()
+            self._changed = False
+
+
+def _llm_result_cache(cache_dir: Path) -> _LLMResultCache:
+    with _LLM_SHARED_LOCK:
+        cache = _LLM_RESULT_CACHES.get(cache_dir)
+        if cache is None:
+            cache = _LLM_RESULT_CACHES[cache_dir] = _LLMResultCache(
+                cache_dir / "style-llm.json"
+            )
+            # Worker processes exit without running atexit handlers, but
+            # multiprocessing runs its own finalizers in every process.
+            multiprocessing.util.Finalize(None, cache.save, exitpriority=0)
+        return cache
+
+
+def save_llm_result_caches() -> None:
+    """Write the LLM results this process reviewed or reused to disk.
+
+    Call this once a run is done. Caches that are still unsaved when the
+    process exits, e.g. in worker processes, are saved then.
+    """
+    with _LLM_SHARED_LOCK:
+        caches = list(_LLM_RESULT_CACHES.values())
+    for cache in caches:
+        cache.save()
+
+
+@dataclass(frozen=True)
+class _LLMFileScreens:
+    """The screens of one file for the LLM rules, and how to place findings.
+
+    Plain data, so worker processes can hand it back to the parent for a
+    package-wide review.
+    """
+
+    input_file: str | None
+    screens: tuple[dict[str, str], ...]
+    screen_lines: dict[str, int]
+    default_line: int = 1
+    default_screen_id: str = ""
+
+    @classmethod
+    def from_docs(
+        cls,
+        parsed_docs: list[ParsedInterviewDocument],
+        *,
+        input_file: str | None,
+        options: StyleLintOptions,
+    ) -> _LLMFileScreens:
+        screen_lines: dict[str, int] = {}
+        for parsed_doc in parsed_docs:
+            screen_lines.setdefault(parsed_doc.screen_id, parsed_doc.default_line())
+        return cls(
+            input_file=input_file,
+            screens=tuple(
+                _build_screen_payload(
+                    parsed_docs,
+                    max_screen_chars=max(1, options.llm_chunk_tokens)
+                    * _LLM_CHARS_PER_TOKEN,
                 )
+            ),
+            screen_lines=screen_lines,
+            default_line=parsed_docs[0].default_line() if parsed_docs else 1,
+            default_screen_id=parsed_docs[0].screen_id if parsed_docs else "",
+        )
+
+
+class _LLMRuleResult:
+    """What one LLM rule returned for the screens of one file."""
+
+    def __init__(
+        self,
+        *,
+        rule_id: str,
+        file: _LLMFileScreens,
+        screen_keys: list[str],
+        items_by_screen: list[list[dict[str, Any]] | None],
+        cache: _LLMResultCache | None,
+    ) -> None:
+        self.rule_id = rule_id
+        self.file = file
+        self.screen_keys = screen_keys
+        self.items_by_screen = items_by_screen
+        self.cache = cache
+        self.errors: list[str] = []
+        # Items naming none of the file's screens; reported, never cached.
+        self.uncached_items: list[dict[str, Any]] = []
+
+    def record(self, screen_index: int, items: list[dict[str, Any]]) -> None:
+        self.items_by_screen[screen_index] = items
+        if self.cache is not None:
+            self.cache.put(self.screen_keys[screen_index], items)
+
+    def findings(self) -> list[Finding]:
+        file = self.file
+        findings = [
+            make_finding(
+                MessageId.STYLE_LLM_REQUEST_FAILED,
+                file_name=file.input_file,
+                line_number=file.default_line,
+                screen_id=file.default_screen_id,
+                rule_id=self.rule_id or "style-llm",
+                detail=error_detail,
             )
-            continue
-        for item in _safe_parse_llm_json(raw_response):
+            for error_detail in dict.fromkeys(self.errors)
+        ]
+        # Cached and fresh items are combined in screen order; items that
+        # belong to no screen come last.
+        all_items = [item for items in self.items_by_screen if items for item in items]
+        for item in all_items + self.uncached_items:
             finding = _build_llm_finding(
-                parsed_docs=parsed_docs,
-                input_file=input_file,
-                rule_id=_stringify(item.get("rule_id")).strip() or rule_id,
+                screen_lines=file.screen_lines,
+                default_line=file.default_line,
+                input_file=file.input_file,
+                rule_id=_stringify(item.get("rule_id")).strip() or self.rule_id,
                 message=_stringify(item.get("message")).strip()
                 or "LLM identified a potential style issue.",
                 problematic_text=_stringify(item.get("problematic_text")).strip(),
@@ -1181,12 +1473,220 @@ def _run_llm_rules(
             )
             if finding is not None:
                 findings.append(finding)
-    return findings
+        return findings
+
+
+class _PendingLLMReview:
+    """LLM requests for every rule over the screens of one or more files.
+
+    Screens with a cached result are not sent. The rest are packed, in
+    order, into chunks of about ``llm_chunk_tokens`` tokens, and each chunk
+    is its own request on the shared pool, so large interviews are reviewed
+    in full by several bounded requests running side by side. When screens
+    of several files share a request, their ids are prefixed with the file's
+    position so the answers can be routed back.
+    """
+
+    def __init__(
+        self,
+        *,
+        file_count: int,
+        results: list[list[_LLMRuleResult]],
+        requests: list[
+            tuple[int, list[tuple[str, int, int]], Future[tuple[Any, str | None]]]
+        ],
+        cache: _LLMResultCache | None,
+    ) -> None:
+        self.file_count = file_count
+        # results[rule][file]; each request is (rule, targets, future), where
+        # a target is (screen id sent, file index, screen index).
+        self.results = results
+        self.requests = requests
+        self.cache = cache
+
+    @classmethod
+    def submit(
+        cls, files: list[_LLMFileScreens], *, options: StyleLintOptions
+    ) -> _PendingLLMReview:
+        prompts = _load_llm_prompt_templates()
+        llm_rules = prompts.get("llm_rules")
+        if not isinstance(llm_rules, list):
+            llm_rules = []
+        pool = _llm_request_pool(options.llm_concurrency)
+        cache = (
+            _llm_result_cache(options.llm_cache_dir)
+            if options.llm_cache_dir is not None
+            else None
+        )
+        model = options.resolved_openai_model()
+        prefix_ids = len(files) > 1
+
+        results: list[list[_LLMRuleResult]] = []
+        requests: list[
+            tuple[int, list[tuple[str, int, int]], Future[tuple[Any, str | None]]]
+        ] = []
+        for rule in llm_rules:
+            if not isinstance(rule, dict):
+                continue
+            rule_id = _stringify(rule.get("rule_id")).strip()
+            system_prompt = _stringify(rule.get("system_prompt"))
+            user_prompt_template = _stringify(rule.get("user_prompt"))
+            prompt_hash = cache_key(system_prompt, user_prompt_template)
+
+            rule_results: list[_LLMRuleResult] = []
+            pending: list[dict[str, str]] = []
+            targets: list[tuple[str, int, int]] = []
+            for file_index, file in enumerate(files):
+                screen_keys = [
+                    cache_key(
+                        rule_id,
+                        prompt_hash,
+                        model,
+                        cache_key(
+                            json.dumps(screen, ensure_ascii=False, sort_keys=True)
+                        ),
+                    )
+                    for screen in file.screens
+                ]
+                items_by_screen = [
+                    cache.get(key) if cache is not None else None for key in screen_keys
+                ]
+                rule_results.append(
+                    _LLMRuleResult(
+                        rule_id=rule_id,
+                        file=file,
+                        screen_keys=screen_keys,
+                        items_by_screen=items_by_screen,
+                        cache=cache,
+                    )
+                )
+                for screen_index, screen in enumerate(file.screens):
+                    if items_by_screen[screen_index] is not None:
+                        continue
+                    sent_id = (
+                        f"{file_index}/{screen['screen_id']}"
+                        if prefix_ids
+                        else screen["screen_id"]
+                    )
+                    pending.append({"screen_id": sent_id, "text": screen["text"]})
+                    targets.append((sent_id, file_index, screen_index))
+
+            rule_index = len(results)
+            results.append(rule_results)
+            start = 0
+            for chunk in _plan_screen_chunks(pending, options.llm_chunk_tokens):
+                requests.append(
+                    (
+                        rule_index,
+                        targets[start : start + len(chunk)],
+                        pool.submit(
+                            _call_openai_chat_completion,
+                            system_prompt=system_prompt,
+                            user_prompt=user_prompt_template.replace(
+                                "{screens_json}",
+                                json.dumps(chunk, ensure_ascii=False),
+                            ),
+                            base_url=options.resolved_openai_base_url(),
+                            api_key=options.resolved_openai_api_key(),
+                            model=model,
+                        ),
+                    )
+                )
+                start += len(chunk)
+        return cls(
+            file_count=len(files), results=results, requests=requests, cache=cache
+        )
+
+    def findings_by_file(self) -> list[list[Finding]]:
+        """Wait for the requests and return each file's findings in rule order."""
+        for rule_index, targets, request in self.requests:
+            rule_results = self.results[rule_index]
+            raw_response, error_detail = request.result()
+            if error_detail is not None:
+                # The screens stay uncached and are sent again next run.
+                for file_index in dict.fromkeys(target[1] for target in targets):
+                    rule_results[file_index].errors.append(error_detail)
+                continue
+            sent_items: dict[str, list[dict[str, Any]]] = {
+                sent_id: [] for sent_id, _, _ in targets
+            }
+            # An answer that left out the file prefix still names its screen
+            # when exactly one screen of the request has that id.
+            sent_ids_by_screen_id: dict[str, list[str]] = {}
+            for sent_id, file_index, screen_index in targets:
+                screen_id = rule_results[file_index].file.screens[screen_index][
+                    "screen_id"
+                ]
+                sent_ids_by_screen_id.setdefault(screen_id, []).append(sent_id)
+            request_files = list(dict.fromkeys(target[1] for target in targets))
+            for item in _safe_parse_llm_json(raw_response):
+                item_screen_id = _stringify(item.get("screen_id")).strip()
+                screen_items = sent_items.get(item_screen_id)
+                matching_ids = sent_ids_by_screen_id.get(item_screen_id, [])
+                if screen_items is None and len(matching_ids) == 1:
+                    screen_items = sent_items[matching_ids[0]]
+                if screen_items is not None:
+                    screen_items.append(item)
+                elif len(request_files) == 1:
+                    # There is no screen to cache it under, but the file is
+                    # known, so it is still reported.
+                    rule_results[request_files[0]].uncached_items.append(item)
+                # Otherwise the item cannot be placed in a file and is dropped.
+            for sent_id, file_index, screen_index in targets:
+                result = rule_results[file_index]
+                screen_id = result.file.screens[screen_index]["screen_id"]
+                result.record(
+                    screen_index,
+                    [
+                        (
+                            item
+                            if sent_id == screen_id
+                            else {**item, "screen_id": screen_id}
+                        )
+                        for item in sent_items[sent_id]
+                    ],
+                )
+        return [
+            [
+                finding
+                for rule_results in self.results
+                for finding in rule_results[file_index].findings()
+            ]
+            for file_index in range(self.file_count)
+        ]
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _LLM_CHARS_PER_TOKEN + 1
+
+
+def _plan_screen_chunks(
+    screens: list[dict[str, str]], token_budget: int
+) -> list[list[dict[str, str]]]:
+    """Split screens, in order, into chunks of at most token_budget tokens.
+
+    A screen larger than the budget on its own gets a chunk to itself.
+    """
+    chunks: list[list[dict[str, str]]] = []
+    current: list[dict[str, str]] = []
+    used = 0
+    for screen in screens:
+        cost = _estimate_tokens(json.dumps(screen, ensure_ascii=False))
+        if current and used + cost > token_budget:
+            chunks.append(current)
+            current = []
+            used = 0
+        current.append(screen)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 def _build_llm_finding(
     *,
-    parsed_docs: list[ParsedInterviewDocument],
+    screen_lines: dict[str, int],
+    default_line: int,
     input_file: str | None,
     rule_id: str,
     message: str,
@@ -1200,14 +1700,7 @@ def _build_llm_finding(
         message_id = MessageId.STYLE_PLAIN_LANGUAGE_REWRITE_OPPORTUNITY
     else:
         return None
-    line_number = next(
-        (
-            parsed_doc.default_line()
-            for parsed_doc in parsed_docs
-            if parsed_doc.screen_id == screen_id
-        ),
-        parsed_docs[0].default_line() if parsed_docs else 1,
-    )
+    line_number = screen_lines.get(screen_id, default_line)
     rendered_message = message
     if problematic_text:
         rendered_message = f'{message} Quote: "{_shorten(problematic_text, limit=220)}"'
@@ -1221,113 +1714,114 @@ def _build_llm_finding(
     )
 
 
-def _iter_doc_texts(docs: list[ParsedInterviewDocument]) -> list[TextEntry]:
+def _iter_doc_text_entries(parsed_doc: ParsedInterviewDocument) -> list[TextEntry]:
     values: list[TextEntry] = []
-    for parsed_doc in docs:
-        for key in VISIBLE_TEXT_KEYS:
-            value = parsed_doc.doc.get(key)
-            line_number = parsed_doc.line_for_key(key)
-            if isinstance(value, dict):
-                content = _stringify(value.get("content"))
-                label = _stringify(value.get("label"))
-                if content:
-                    values.append(
-                        TextEntry(
-                            location=f"{key}.content",
-                            text=content,
-                            line_number=line_number,
-                            screen_id=parsed_doc.screen_id,
-                        )
-                    )
-                if label:
-                    values.append(
-                        TextEntry(
-                            location=f"{key}.label",
-                            text=label,
-                            line_number=line_number,
-                            screen_id=parsed_doc.screen_id,
-                        )
-                    )
-            else:
-                rendered = _stringify(value)
-                if rendered:
-                    values.append(
-                        TextEntry(
-                            location=key,
-                            text=rendered,
-                            line_number=line_number,
-                            screen_id=parsed_doc.screen_id,
-                        )
-                    )
-        for index, field in enumerate(_iter_fields(parsed_doc.doc)):
-            line_number = parsed_doc.line_for_field(field)
-            for field_key in ("label", "help", "hint", "note", "html"):
-                rendered = _stringify(field.get(field_key))
-                if not rendered:
-                    continue
+    texts = parsed_doc.texts
+    for key in VISIBLE_TEXT_KEYS:
+        value = parsed_doc.doc.get(key)
+        line_number = parsed_doc.line_for_key(key)
+        if isinstance(value, dict):
+            content = _stringify(value.get("content"))
+            label = _stringify(value.get("label"))
+            if content:
                 values.append(
                     TextEntry(
-                        location=f"fields[{index}].{field_key}",
-                        text=rendered,
+                        location=f"{key}.content",
+                        indexed=texts.text(content),
                         line_number=line_number,
                         screen_id=parsed_doc.screen_id,
                     )
                 )
-            if not field.get("label") and field:
-                first_key = _stringify(next(iter(field.keys())))
-                if first_key:
-                    values.append(
-                        TextEntry(
-                            location=f"fields[{index}].first_key",
-                            text=first_key,
-                            line_number=line_number,
-                            screen_id=parsed_doc.screen_id,
-                        )
+            if label:
+                values.append(
+                    TextEntry(
+                        location=f"{key}.label",
+                        indexed=texts.text(label),
+                        line_number=line_number,
+                        screen_id=parsed_doc.screen_id,
                     )
-    return values
-
-
-def _user_facing_text_entries(docs: list[ParsedInterviewDocument]) -> list[TextEntry]:
-    entries = _iter_doc_texts(docs)
-    for parsed_doc in docs:
-        for key in ("choices", "dropdown", "buttons"):
-            for label in _extract_choice_display_text(parsed_doc.doc.get(key)):
-                entries.append(
+                )
+        else:
+            rendered = _stringify(value)
+            if rendered:
+                values.append(
                     TextEntry(
                         location=key,
-                        text=label,
-                        line_number=parsed_doc.line_for_key(key),
+                        indexed=texts.text(rendered),
+                        line_number=line_number,
                         screen_id=parsed_doc.screen_id,
                     )
                 )
-        for index, field in enumerate(_iter_fields(parsed_doc.doc)):
-            for label in _extract_choice_display_text(field.get("choices")):
-                entries.append(
+    for index, field in enumerate(parsed_doc.fields):
+        line_number = parsed_doc.line_for_field(field)
+        for field_key in ("label", "help", "hint", "note", "html"):
+            rendered = _stringify(field.get(field_key))
+            if not rendered:
+                continue
+            values.append(
+                TextEntry(
+                    location=f"fields[{index}].{field_key}",
+                    indexed=texts.text(rendered),
+                    line_number=line_number,
+                    screen_id=parsed_doc.screen_id,
+                )
+            )
+        if not field.get("label") and field:
+            first_key = _stringify(next(iter(field.keys())))
+            if first_key:
+                values.append(
                     TextEntry(
-                        location=f"fields[{index}].choices",
-                        text=label,
-                        line_number=parsed_doc.line_for_field(field),
+                        location=f"fields[{index}].first_key",
+                        indexed=texts.text(first_key),
+                        line_number=line_number,
                         screen_id=parsed_doc.screen_id,
                     )
                 )
-    return entries
+    return values
 
 
-def _question_text_entries(docs: list[ParsedInterviewDocument]) -> list[TextEntry]:
+def _iter_choice_text_entries(parsed_doc: ParsedInterviewDocument) -> list[TextEntry]:
     entries: list[TextEntry] = []
-    for parsed_doc in docs:
-        for key in ("question", "subquestion"):
-            value = _stringify(parsed_doc.doc.get(key))
-            if not value:
-                continue
+    texts = parsed_doc.texts
+    for key in ("choices", "dropdown", "buttons"):
+        for label in _extract_choice_display_text(parsed_doc.doc.get(key)):
             entries.append(
                 TextEntry(
                     location=key,
-                    text=value,
+                    indexed=texts.text(label),
                     line_number=parsed_doc.line_for_key(key),
                     screen_id=parsed_doc.screen_id,
                 )
             )
+    for index, field in enumerate(parsed_doc.fields):
+        for label in _extract_choice_display_text(field.get("choices")):
+            entries.append(
+                TextEntry(
+                    location=f"fields[{index}].choices",
+                    indexed=texts.text(label),
+                    line_number=parsed_doc.line_for_field(field),
+                    screen_id=parsed_doc.screen_id,
+                )
+            )
+    return entries
+
+
+def _iter_question_text_entries(
+    parsed_doc: ParsedInterviewDocument,
+) -> list[TextEntry]:
+    entries: list[TextEntry] = []
+    for key in ("question", "subquestion"):
+        value = _stringify(parsed_doc.doc.get(key))
+        if not value:
+            continue
+        entries.append(
+            TextEntry(
+                location=key,
+                indexed=parsed_doc.texts.text(value),
+                line_number=parsed_doc.line_for_key(key),
+                screen_id=parsed_doc.screen_id,
+            )
+        )
     return entries
 
 
@@ -1359,7 +1853,7 @@ def _iter_choice_sources(
     for key in ("choices", "dropdown", "buttons"):
         if parsed_doc.doc.get(key) is not None:
             sources.append((key, parsed_doc.doc.get(key), parsed_doc.line_for_key(key)))
-    for index, field in enumerate(_iter_fields(parsed_doc.doc)):
+    for index, field in enumerate(parsed_doc.fields):
         if field.get("choices") is not None:
             sources.append(
                 (
@@ -1488,7 +1982,7 @@ def _variable_references(
         value = _stringify(parsed_doc.doc.get(key)).strip()
         if value and _looks_like_variable_reference(value):
             references.append((value, parsed_doc.line_for_key(key)))
-    for field in _iter_fields(parsed_doc.doc):
+    for field in parsed_doc.fields:
         value = _extract_field_variable(field)
         if value and _looks_like_variable_reference(value):
             references.append((value, parsed_doc.line_for_field(field)))
@@ -1638,15 +2132,6 @@ def _is_user_facing_code_name(name: str) -> bool:
     return any(part in _USER_FACING_CODE_NAME_PARTS for part in parts)
 
 
-def _find_metadata(docs: list[ParsedInterviewDocument]) -> dict[str, Any]:
-    metadata: dict[str, Any] = {}
-    for parsed_doc in docs:
-        block = parsed_doc.doc.get("metadata")
-        if isinstance(block, dict):
-            metadata.update(block)
-    return metadata
-
-
 def _iter_include_values(value: Any) -> list[str]:
     if isinstance(value, str):
         return [_stringify(value).strip().lower()]
@@ -1706,44 +2191,6 @@ def _variable_name_matches(left: str, right: str) -> bool:
     return left_text.split(".")[0] == right_text.split(".")[0]
 
 
-def _plain_text(text: str) -> str:
-    rendered = _strip_mako(text)
-    rendered = _FILE_TAG_RE.sub(" ", rendered)
-    rendered = _MARKDOWN_IMAGE_RE.sub(r" \1 ", rendered)
-    rendered = _MARKDOWN_LINK_RE.sub(r" \1 ", rendered)
-    rendered = _MARKDOWN_CODE_RE.sub(r" \1 ", rendered)
-    rendered = _HTML_TAG_RE.sub(" ", rendered)
-    rendered = html.unescape(rendered)
-    rendered = re.sub(r"(?m)^\s*#{1,6}\s+", "", rendered)
-    rendered = re.sub(r"(?m)^\s*[-*+]\s+", "", rendered)
-    return re.sub(r"\s+", " ", rendered).strip()
-
-
-def _strip_mako(text: str) -> str:
-    rendered = _MAKO_BLOCK_RE.sub(" ", text)
-    rendered = _MAKO_EXPR_RE.sub(" ", rendered)
-    rendered = _MAKO_CONTROL_RE.sub(" ", rendered)
-    return rendered
-
-
-def _stringify(item: Any) -> str:
-    if item is None:
-        return ""
-    if isinstance(item, str):
-        return item
-    return str(item)
-
-
-def _visible_text(item: Any) -> str:
-    if isinstance(item, dict):
-        return " ".join(
-            part
-            for part in (_stringify(item.get("label")), _stringify(item.get("content")))
-            if part
-        )
-    return _stringify(item)
-
-
 def _shorten(text: Any, limit: int = 180) -> str:
     value = re.sub(r"\s+", " ", _stringify(text)).strip()
     if len(value) <= limit:
@@ -1778,56 +2225,145 @@ def _load_plain_language_replacements() -> dict[str, str]:
     return normalized
 
 
-@lru_cache(maxsize=None)
-def _compiled_plain_language_patterns() -> list[tuple[str, str, re.Pattern[str]]]:
-    compiled: list[tuple[str, str, re.Pattern[str]]] = []
-    sorted_terms = sorted(
-        _load_plain_language_replacements().items(),
-        key=lambda item: len(item[0]),
-        reverse=True,
-    )
-    for term, replacement in sorted_terms:
-        if not re.search(r"[a-z0-9]", term):
-            continue
-        compiled.append(
-            (
-                term,
-                replacement,
-                re.compile(
-                    rf"(?<![A-Za-z0-9_]){re.escape(term)}(?![A-Za-z0-9_])",
-                    re.IGNORECASE,
-                ),
+_PLAIN_LANGUAGE_WORD_CLASS = "[A-Za-z0-9_]"
+_PLAIN_LANGUAGE_WORD_CHAR_RE = re.compile(_PLAIN_LANGUAGE_WORD_CLASS, re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _is_plain_language_word_char(char: str) -> bool:
+    # Matches what the term boundaries (?<![A-Za-z0-9_]) and (?![A-Za-z0-9_])
+    # treat as word characters under re.IGNORECASE, e.g. KELVIN SIGN.
+    return _PLAIN_LANGUAGE_WORD_CHAR_RE.fullmatch(char) is not None
+
+
+@dataclass(frozen=True)
+class _PlainLanguageMatcher:
+    """All plain-language terms compiled into one regex plus a character trie.
+
+    ``terms`` holds (term, replacement) pairs longest first, the order in
+    which terms claim matches. The regex only finds the offsets where at
+    least one term matches; the trie then lists every term matching there.
+    Terms are lowercase and matched case-insensitively, so text characters
+    are folded onto the term character that re.IGNORECASE would match.
+    """
+
+    terms: tuple[tuple[str, str], ...]
+    trie: dict[str, Any]
+    starts: re.Pattern[str]
+    term_chars: frozenset[str]
+
+    @classmethod
+    def from_replacements(cls, replacements: dict[str, str]) -> "_PlainLanguageMatcher":
+        terms = tuple(
+            (term, replacement)
+            for term, replacement in sorted(
+                replacements.items(), key=lambda item: len(item[0]), reverse=True
             )
+            if re.search(r"[a-z0-9]", term)
         )
-    return compiled
+        trie: dict[str, Any] = {}
+        for index, (term, _) in enumerate(terms):
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            # "" never labels an edge, so it marks the end of a term.
+            node.setdefault("", index)
+        starts = re.compile(
+            rf"(?<!{_PLAIN_LANGUAGE_WORD_CLASS})(?={cls._trie_regex(trie)})",
+            re.IGNORECASE,
+        )
+        term_chars = frozenset(char for term, _ in terms for char in term)
+        return cls(terms, trie, starts, term_chars)
+
+    @classmethod
+    def _trie_regex(cls, node: dict[str, Any]) -> str:
+        alternatives = [
+            re.escape(char) + cls._trie_regex(child)
+            for char, child in node.items()
+            if char
+        ]
+        if "" in node:
+            alternatives.append(f"(?!{_PLAIN_LANGUAGE_WORD_CLASS})")
+        return "(?:" + "|".join(alternatives) + ")"
+
+    def _fold(self, char: str) -> str:
+        if char in self.term_chars:
+            return char
+        return _fold_plain_language_char(char, self.term_chars)
+
+    def occurrences(self, text: str) -> dict[int, list[tuple[int, int]]]:
+        """Map each term index to the (start, end) spans where it matches."""
+        found: dict[int, list[tuple[int, int]]] = {}
+        text_length = len(text)
+        for start_match in self.starts.finditer(text):
+            start = start_match.start()
+            node = self.trie
+            for end in range(start + 1, text_length + 1):
+                next_node = node.get(self._fold(text[end - 1]))
+                if next_node is None:
+                    break
+                node = next_node
+                index = node.get("")
+                if index is not None and (
+                    end == text_length or not _is_plain_language_word_char(text[end])
+                ):
+                    found.setdefault(index, []).append((start, end))
+        return found
+
+
+@lru_cache(maxsize=4096)
+def _fold_plain_language_char(char: str, term_chars: frozenset[str]) -> str:
+    for term_char in sorted(term_chars):
+        if re.fullmatch(re.escape(term_char), char, re.IGNORECASE):
+            return term_char
+    return char
+
+
+@lru_cache(maxsize=None)
+def _plain_language_matcher() -> _PlainLanguageMatcher:
+    return _PlainLanguageMatcher.from_replacements(_load_plain_language_replacements())
 
 
 def _find_plain_language_suggestions(
     text: str, max_matches: int = 8
 ) -> list[tuple[str, str]]:
-    plain = _plain_text(text)
+    return _plain_language_suggestions(_plain_text(text), max_matches)
+
+
+def _plain_language_suggestions(
+    plain: str, max_matches: int = 8
+) -> list[tuple[str, str]]:
     if not plain:
         return []
+    matcher = _plain_language_matcher()
     occupied: list[tuple[int, int]] = []
     seen_terms: set[str] = set()
     matches: list[tuple[int, str, str]] = []
-    for _, replacement, pattern in _compiled_plain_language_patterns():
+    # Longer terms claim text first, and each term keeps at most its first
+    # match that does not overlap a longer one. Like re.finditer, a term's
+    # occurrences are only considered if they do not overlap the previous
+    # occurrence of the same term.
+    for index, spans in sorted(matcher.occurrences(plain).items()):
         if len(matches) >= max_matches:
             break
-        for found in pattern.finditer(plain):
-            span = (found.start(), found.end())
+        previous_end = 0
+        for span in spans:
+            if span[0] < previous_end:
+                continue
+            previous_end = span[1]
             overlaps = any(
                 not (span[1] <= used_start or span[0] >= used_end)
                 for used_start, used_end in occupied
             )
             if overlaps:
                 continue
-            seen_key = found.group(0).strip().lower()
+            matched_text = plain[span[0] : span[1]]
+            seen_key = matched_text.strip().lower()
             if seen_key in seen_terms:
                 continue
             seen_terms.add(seen_key)
             occupied.append(span)
-            matches.append((found.start(), found.group(0), replacement))
+            matches.append((span[0], matched_text, matcher.terms[index][1]))
             break
     matches.sort(key=lambda item: item[0])
     return [(match_text, replacement) for _, match_text, replacement in matches]
@@ -1840,19 +2376,16 @@ def _format_plain_language_replacement(value: str) -> str:
     return formatted
 
 
-def _build_screen_payload(parsed_docs: list[ParsedInterviewDocument]) -> str:
+def _build_screen_payload(
+    parsed_docs: list[ParsedInterviewDocument], *, max_screen_chars: int
+) -> list[dict[str, str]]:
     payload = []
-    for parsed_doc in parsed_docs[:40]:
-        screen_text = "\n\n".join(
-            _visible_text(parsed_doc.doc.get(key))
-            for key in ("question", "subquestion", "under", "help", "note", "html")
-            if _visible_text(parsed_doc.doc.get(key)).strip()
-        )
-        screen_text = _shorten(_plain_text(screen_text), limit=800)
+    for parsed_doc in parsed_docs:
+        screen_text = _shorten(parsed_doc.texts.screen_text, limit=max_screen_chars)
         if not screen_text:
             continue
         payload.append({"screen_id": parsed_doc.screen_id, "text": screen_text})
-    return json.dumps(payload, ensure_ascii=False)
+    return payload
 
 
 def _call_openai_chat_completion(
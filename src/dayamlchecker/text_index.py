@@ -0,0 +1,137 @@
+"""
+Per-document index of user-facing text.
+
+Accessibility checks, style checks and the LLM screen payload all look at
+the same question, subquestion, help and field text, and several of them
+derive the same plain text, sentences or word counts from it. A
+``DocumentTextIndex`` is built once for each parsed document and hands out
+``IndexedText`` values whose derived forms are computed on first use and
+then reused by every consumer.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from dayamlchecker.accessibility import TextSection, _iter_text_sections
+
+__all__ = ["DocumentTextIndex", "IndexedText"]
+
+SCREEN_TEXT_KEYS = ("question", "subquestion", "under", "help", "note", "html")
+_MAKO_EXPR_RE = re.compile(r"\$\{.*?\}", re.DOTALL)
+_MAKO_BLOCK_RE = re.compile(r"<%[\s\S]*?%>")
+_MAKO_CONTROL_RE = re.compile(r"(?m)^\s*%.*$")
+_MARKDOWN_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]+\)")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_MARKDOWN_CODE_RE = re.compile(r"`([^`]+)`")
+_FILE_TAG_RE = re.compile(
+    r"\[FILE\s+([^,\]]+)(?:\s*,\s*([^,\]]+))?(?:\s*,\s*([^\]]+))?\]",
+    re.IGNORECASE,
+)
+_SENTENCE_RE = re.compile(r"[^.!?]+[.!?]")
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+def _stringify(item: Any) -> str:
+    if item is None:
+        return ""
+    if isinstance(item, str):
+        return item
+    return str(item)
+
+
+def _visible_text(item: Any) -> str:
+    if isinstance(item, dict):
+        return " ".join(
+            part
+            for part in (_stringify(item.get("label")), _stringify(item.get("content")))
+            if part
+        )
+    return _stringify(item)
+
+
+def _strip_mako(text: str) -> str:
+    rendered = _MAKO_BLOCK_RE.sub(" ", text)
+    rendered = _MAKO_EXPR_RE.sub(" ", rendered)
+    rendered = _MAKO_CONTROL_RE.sub(" ", rendered)
+    return rendered
+
+
+def _markup_to_plain(rendered: str) -> str:
+    rendered = _FILE_TAG_RE.sub(" ", rendered)
+    rendered = _MARKDOWN_IMAGE_RE.sub(r" \1 ", rendered)
+    rendered = _MARKDOWN_LINK_RE.sub(r" \1 ", rendered)
+    rendered = _MARKDOWN_CODE_RE.sub(r" \1 ", rendered)
+    rendered = _HTML_TAG_RE.sub(" ", rendered)
+    rendered = html.unescape(rendered)
+    rendered = re.sub(r"(?m)^\s*#{1,6}\s+", "", rendered)
+    rendered = re.sub(r"(?m)^\s*[-*+]\s+", "", rendered)
+    return re.sub(r"\s+", " ", rendered).strip()
+
+
+def _plain_text(text: str) -> str:
+    return _markup_to_plain(_strip_mako(text))
+
+
+@dataclass(frozen=True)
+class IndexedText:
+    """One text value and the forms derived from it, each computed once."""
+
+    text: str
+
+    @cached_property
+    def mako_stripped(self) -> str:
+        return _strip_mako(self.text)
+
+    @cached_property
+    def plain(self) -> str:
+        return _markup_to_plain(self.mako_stripped)
+
+    @cached_property
+    def sentences(self) -> tuple[str, ...]:
+        return tuple(_SENTENCE_RE.findall(self.plain))
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(_WORD_RE.findall(self.plain))
+
+
+class DocumentTextIndex:
+    """User-facing text of one interview document, shared by all checks."""
+
+    def __init__(self, doc: dict[str, Any], source_code: str) -> None:
+        self.doc = doc
+        self.source_code = source_code
+        self._texts: dict[str, IndexedText] = {}
+
+    def text(self, value: str) -> IndexedText:
+        """Return the shared ``IndexedText`` for value."""
+        indexed = self._texts.get(value)
+        if indexed is None:
+            indexed = self._texts[value] = IndexedText(value)
+        return indexed
+
+    def visible(self, key: str) -> IndexedText:
+        """Return the visible text of a top-level key (label and content)."""
+        return self.text(_visible_text(self.doc.get(key)))
+
+    @cached_property
+    def sections(self) -> list[TextSection]:
+        """Text sections checked by the accessibility rules."""
+        return _iter_text_sections(self.doc, self.source_code)
+
+    @cached_property
+    def screen_text(self) -> str:
+        """Plain text of the whole screen, as sent in the LLM screen payload."""
+        return _plain_text(
+            "\n\n".join(
+                self.visible(key).text
+                for key in SCREEN_TEXT_KEYS
+                if self.visible(key).text.strip()
+            )
+        )
@@ -1,7 +1,15 @@
 # Each doc, apply this to each block
 import ast
 import argparse
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import ExitStack
 from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
 from pyexpat import features
 import re
@@ -12,12 +20,19 @@ from dayamlchecker.accessibility import (
     AccessibilityLintOptions,
     find_accessibility_findings,
 )
+from dayamlchecker.cache import default_cache_dir
 from dayamlchecker.messages import Finding, FindingClass, MessageId, draft, make_finding
 from dayamlchecker.style import (
+    _DEFAULT_LLM_CHUNK_TOKENS,
+    _DEFAULT_LLM_CONCURRENCY,
     ParsedInterviewDocument,
     StyleLintOptions,
+    _LLMFileScreens,
     find_style_findings,
+    review_llm_screens,
+    save_llm_result_caches,
 )
+from dayamlchecker.text_index import DocumentTextIndex
 from mako.template import Template as MakoTemplate  # type: ignore[import-untyped]
 from mako.exceptions import (  # type: ignore[import-untyped]
     SyntaxException,
@@ -28,11 +43,18 @@ from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.error import MarkedYAMLError
 from dayamlchecker.check_questions_urls import (
+    URLCassette,
+    URLCassetteMiss,
+    URLCheckHistory,
+    _url_check_stats_from_args,
+    URLExtractionOptions,
+    collect_urls,
     infer_package_dirs,
     infer_root as infer_url_check_root,
     parse_ignore_urls,
     print_url_check_report,
     run_url_check,
+    write_url_manifest,
 )
 
 # TODO(brycew):
@@ -61,6 +83,12 @@ class RuntimeOptions:
     style_openai_base_url: str | None = None
     style_openai_api_key: str | None = None
     style_openai_model: str | None = None
+    style_llm_concurrency: int = _DEFAULT_LLM_CONCURRENCY
+    style_llm_chunk_tokens: int = _DEFAULT_LLM_CHUNK_TOKENS
+    style_llm_cache_dir: Path | None = None
+    # Review the screens of all files together after linting, in shared
+    # requests, instead of per file; see review_llm_screens().
+    style_llm_coalesce: bool = False
 
     def accessibility_options(self) -> AccessibilityLintOptions:
         return AccessibilityLintOptions(
@@ -74,6 +102,9 @@ class RuntimeOptions:
             openai_base_url=self.style_openai_base_url,
             openai_api_key=self.style_openai_api_key,
             openai_model=self.style_openai_model,
+            llm_concurrency=self.style_llm_concurrency,
+            llm_chunk_tokens=self.style_llm_chunk_tokens,
+            llm_cache_dir=self.style_llm_cache_dir,
         )
 
 
@@ -1685,11 +1716,14 @@ def find_errors_from_string(
     input_file: Optional[str] = None,
     lint_mode: str = DEFAULT_LINT_MODE,
     runtime_options: Optional[RuntimeOptions] = None,
+    llm_screens: Optional[list[_LLMFileScreens]] = None,
 ) -> list[YAMLError]:
     """Return list of findings found in the given full_content string
 
     Args:
         full_content (str): Full YAML content as a string.
+        llm_screens (list, optional): If given, LLM style rules are not run;
+            the file's screens are appended for review_llm_screens().
     Returns:
         list[YAMLError]: List of findings found in the content.
     """
@@ -1748,6 +1782,8 @@ def find_errors_from_string(
             line_number += lines_in_code
             continue
 
+        # Built once per document and shared by accessibility and style.
+        text_index = DocumentTextIndex(doc, source_code)
         if lint_mode == ACCESSIBILITY_LINT_MODE:
             accessibility_findings = find_accessibility_findings(
                 doc=doc,
@@ -1755,6 +1791,7 @@ def find_errors_from_string(
                 document_start_line=line_number,
                 input_file=input_file,
                 options=runtime_options.accessibility_options(),
+                sections=text_index.sections,
             )
             all_errors.extend(accessibility_findings)
 
@@ -1904,6 +1941,7 @@ def find_errors_from_string(
                 source_code=source_code,
                 document_start_line=line_number,
                 index=len(parsed_docs),
+                text_index=text_index,
             )
         )
 
@@ -1919,6 +1957,7 @@ def find_errors_from_string(
                 docs=parsed_docs,
                 input_file=input_file,
                 options=style_options,
+                llm_screens=llm_screens,
             )
         )
     return all_errors
@@ -2065,6 +2104,8 @@ def find_errors(
     input_file: str,
     lint_mode: str = DEFAULT_LINT_MODE,
     runtime_options: Optional[RuntimeOptions] = None,
+    full_content: Optional[str] = None,
+    llm_screens: Optional[list[_LLMFileScreens]] = None,
 ) -> list[YAMLError]:
     """Return list of findings found in the given input_file
 
@@ -2073,12 +2114,15 @@ def find_errors(
 
     Args:
         input_file (str): Path to the YAML file to check.
+        full_content (str, optional): Contents of input_file if the caller has
+            already read it; the file is read from disk otherwise.
 
     Returns:
         list[YAMLError]: List of findings found in the file.
     """
-    with open(input_file, "r") as f:
-        full_content = f.read()
+    if full_content is None:
+        with open(input_file, "r") as f:
+            full_content = f.read()
 
     if full_content[:12] == "# use jinja\n":
         print()
@@ -2090,6 +2134,7 @@ def find_errors(
         input_file=input_file,
         lint_mode=lint_mode,
         runtime_options=runtime_options,
+        llm_screens=llm_screens,
     )
 
 
@@ -2123,32 +2168,161 @@ def _collect_yaml_files(
     return _formatter_collect(paths, include_default_ignores=include_default_ignores)
 
 
+# Files docassemble generates or ships as documentation; never linted or fixed.
+_DUMB_DA_FILES = (
+    "pgcodecache.yml",
+    "title_documentation.yml",
+    "documentation.yml",
+    "docstring.yml",
+    "example-list.yml",
+    "examples.yml",
+)
+
+
+def _is_dumb_da_file(input_file: str) -> bool:
+    return input_file.endswith(_DUMB_DA_FILES)
+
+
 def process_file(
     input_file,
     lint_mode: str = DEFAULT_LINT_MODE,
     runtime_options: Optional[RuntimeOptions] = None,
+    full_content: Optional[str] = None,
+    llm_screens: Optional[list[_LLMFileScreens]] = None,
 ) -> list[Finding]:
     """
     Returns:
         list[Finding]: the list of findings found in the input_file
     """
-    for dumb_da_file in [
-        "pgcodecache.yml",
-        "title_documentation.yml",
-        "documentation.yml",
-        "docstring.yml",
-        "example-list.yml",
-        "examples.yml",
-    ]:
-        if input_file.endswith(dumb_da_file):
-            return []
+    if _is_dumb_da_file(input_file):
+        return []
 
     all_errors = find_errors(
-        input_file, lint_mode=lint_mode, runtime_options=runtime_options
+        input_file,
+        lint_mode=lint_mode,
+        runtime_options=runtime_options,
+        full_content=full_content,
+        llm_screens=llm_screens,
     )
     return all_errors
 
 
+def _process_file_with_content(
+    input_file: str,
+    full_content: Optional[str],
+    *,
+    lint_mode: str,
+    runtime_options: RuntimeOptions,
+) -> list[Finding]:
+    # Positional form of process_file() for Executor.map over files and texts.
+    return process_file(
+        input_file,
+        lint_mode=lint_mode,
+        runtime_options=runtime_options,
+        full_content=full_content,
+    )
+
+
+def _process_file_collecting_llm_screens(
+    input_file: str,
+    full_content: Optional[str],
+    *,
+    lint_mode: str,
+    runtime_options: RuntimeOptions,
+) -> tuple[list[Finding], list[_LLMFileScreens]]:
+    # Like _process_file_with_content(), for --style-llm-coalesce: the LLM
+    # rules are left out and the file's screens are returned for the
+    # package-wide review instead.
+    llm_screens: list[_LLMFileScreens] = []
+    findings = process_file(
+        input_file,
+        lint_mode=lint_mode,
+        runtime_options=runtime_options,
+        full_content=full_content,
+        llm_screens=llm_screens,
+    )
+    return findings, llm_screens
+
+
+@dataclass(frozen=True)
+class _FixedFileFindings:
+    """Result of formatting and then linting one file for --fix."""
+
+    findings: list[Finding]
+    reformatted: bool = False
+    format_error: Optional[str] = None
+    # Screens for the package-wide LLM review with --style-llm-coalesce.
+    llm_screens: list[_LLMFileScreens] = field(default_factory=list)
+
+
+def _fix_and_process_file(
+    input_file: str,
+    full_content: Optional[str],
+    *,
+    lint_mode: str,
+    runtime_options: RuntimeOptions,
+    line_length: int = 88,
+    convert_indent_4_to_2: bool = True,
+) -> _FixedFileFindings:
+    """Format the Python blocks of one file, write it back and lint the result.
+
+    The text read for linting is the one that gets formatted, and the
+    formatter finds its blocks without building YAML, so each file is read
+    and parsed once. Files that cannot be formatted are linted unchanged;
+    files process_file() skips are neither formatted nor linted.
+    """
+    # Deferred like _collect_yaml_files(), so plain lint runs never load Black.
+    from dayamlchecker.code_formatter import FormatterConfig, format_yaml_string
+
+    if _is_dumb_da_file(input_file):
+        return _FixedFileFindings([])
+    reformatted = False
+    format_error = None
+    if full_content is not None and full_content[:12] != "# use jinja\n":
+        try:
+            formatted, reformatted = format_yaml_string(
+                full_content,
+                FormatterConfig(
+                    black_line_length=line_length,
+                    convert_indent_4_to_2=convert_indent_4_to_2,
+                ),
+            )
+            if reformatted:
+                Path(input_file).write_text(formatted, encoding="utf-8")
+                full_content = formatted
+        except Exception as exc:
+            reformatted = False
+            format_error = f"Could not format {input_file}: {exc}"
+    llm_screens: list[_LLMFileScreens] = []
+    return _FixedFileFindings(
+        process_file(
+            input_file,
+            lint_mode=lint_mode,
+            runtime_options=runtime_options,
+            full_content=full_content,
+            llm_screens=llm_screens if runtime_options.style_llm_coalesce else None,
+        ),
+        reformatted=reformatted,
+        format_error=format_error,
+        llm_screens=llm_screens,
+    )
+
+
+def _read_file_texts(paths: list[Path]) -> dict[Path, str]:
+    """Read each file once so linting and URL extraction share the text.
+
+    Files that are not valid UTF-8 are left out and read by each consumer
+    as before.
+    """
+    file_texts: dict[Path, str] = {}
+    for path in paths:
+        try:
+            file_texts[path] = path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            continue
+    return file_texts
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Validate Docassemble YAML files",
@@ -2216,6 +2390,48 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=None,
         help="Model name for --style-llm (default: OPENAI_MODEL env var or gpt-4o-mini)",
     )
+    parser.add_argument(
+        "--style-llm-concurrency",
+        type=int,
+        default=_DEFAULT_LLM_CONCURRENCY,
+        help=(
+            "Maximum number of --style-llm requests in flight at once, across "
+            f"all rules and files (default: {_DEFAULT_LLM_CONCURRENCY})"
+        ),
+    )
+    parser.add_argument(
+        "--style-llm-chunk-tokens",
+        type=int,
+        default=_DEFAULT_LLM_CHUNK_TOKENS,
+        help=(
+            "Approximate tokens of screen text per --style-llm request; larger "
+            "interviews are split into several requests "
+            f"(default: {_DEFAULT_LLM_CHUNK_TOKENS})"
+        ),
+    )
+    parser.add_argument(
+        "--style-llm-coalesce",
+        action="store_true",
+        help=(
+            "Send --style-llm requests once every file is linted, packing the "
+            "screens of many files into shared requests; suits packages with "
+            "many short interview files"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the --style-llm result cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory for the --style-llm result cache (default: "
+            "$DAYAMLCHECKER_CACHE_DIR or $XDG_CACHE_HOME/dayamlchecker)"
+        ),
+    )
     parser.add_argument(
         "--url-check",
         action=argparse.BooleanOptionalAction,
@@ -2243,7 +2459,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument(
         "--url-check-ignore-urls",
         default="",
-        help="Comma/newline-separated absolute URLs to ignore during URL checking",
+        help=(
+            "Comma/newline-separated absolute URLs or URL globs such as "
+            "'https://docs.example.org/*' to ignore during URL checking"
+        ),
     )
     parser.add_argument(
         "--url-check-skip-templates",
@@ -2257,6 +2476,88 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help=argparse.SUPPRESS,
     )
+    parser.add_argument(
+        "--url-check-pdf-max-pages",
+        type=int,
+        default=None,
+        help="Extract text from at most this many pages per PDF template (default: all)",
+    )
+    parser.add_argument(
+        "--url-check-pdf-time-budget",
+        type=float,
+        default=None,
+        help="Seconds to spend extracting text from each PDF template (default: no limit)",
+    )
+    parser.add_argument(
+        "--url-check-collapse-trailing-slashes",
+        action="store_true",
+        help="Check URLs that differ only by a trailing slash once (default: off)",
+    )
+    parser.add_argument(
+        "--url-check-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help=(
+            "Stop checking URLs after this many seconds and report the rest as "
+            "skipped (default: no limit)"
+        ),
+    )
+    parser.add_argument(
+        "--url-check-history",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help=(
+            "JSON file remembering past URL check results, so previously broken "
+            "and never-checked URLs are checked first; updated after each run"
+        ),
+    )
+    parser.add_argument(
+        "--url-check-stats-json",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Write per-URL timings, retries and redirects plus per-host latency "
+            "percentiles and failure counts for the URL check to a JSON file"
+        ),
+    )
+    url_cassette_mode = parser.add_mutually_exclusive_group()
+    url_cassette_mode.add_argument(
+        "--url-check-record",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Record every URL check outcome to a JSON cassette at PATH",
+    )
+    url_cassette_mode.add_argument(
+        "--url-check-replay",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Answer URL checks from a cassette at PATH without network access",
+    )
+    parser.add_argument(
+        "--url-check-replay-miss",
+        choices=("error", "skip"),
+        default="error",
+        help=(
+            "What to do with URLs missing from the --url-check-replay cassette: "
+            "fail the run or report them as skipped (default: error)"
+        ),
+    )
+    parser.add_argument(
+        "--url-manifest-out",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Write the extracted URLs to a JSON manifest at PATH instead of "
+            "checking them, even with --no-url-check; verify it later with "
+            "python -m dayamlchecker.check_questions_urls --verify-manifest PATH"
+        ),
+    )
     parser.add_argument(
         "--question-url-severity",
         "--yaml-url-severity",
@@ -2296,7 +2597,42 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=None,
         help="Maximum number of warnings allowed before failing with a non-zero exit code",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes shared by file linting and URL "
+            "extraction (default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--fix",
+        action="store_true",
+        help=(
+            "Format Python code blocks like dayamlchecker-fmt, write the files "
+            "back and lint the formatted text in the same pass"
+        ),
+    )
+    parser.add_argument(
+        "--fix-line-length",
+        type=int,
+        default=88,
+        help=(
+            "Black line length for --fix, like dayamlchecker-fmt --line-length "
+            "(default: 88)"
+        ),
+    )
+    parser.add_argument(
+        "--fix-no-indent-conversion",
+        action="store_true",
+        help="Disable 4-to-2 space indentation conversion for --fix",
+    )
     args = parser.parse_args(argv)
+    if args.style_llm_concurrency < 1:
+        parser.error("--style-llm-concurrency must be at least 1")
+    if args.style_llm_chunk_tokens < 1:
+        parser.error("--style-llm-chunk-tokens must be at least 1")
 
     lint_mode = ACCESSIBILITY_LINT_MODE if args.wcag else DEFAULT_LINT_MODE
     runtime_options = RuntimeOptions(
@@ -2310,6 +2646,12 @@ def main(argv: Optional[list[str]] = None) -> int:
         style_openai_base_url=args.openai_base_url,
         style_openai_api_key=args.openai_api_key,
         style_openai_model=args.openai_model,
+        style_llm_concurrency=args.style_llm_concurrency,
+        style_llm_chunk_tokens=args.style_llm_chunk_tokens,
+        style_llm_cache_dir=(
+            None if args.no_cache else (args.cache_dir or default_cache_dir())
+        ),
+        style_llm_coalesce=args.style_llm and args.style_llm_coalesce,
     )
 
     yaml_files = _collect_yaml_files(
@@ -2321,33 +2663,191 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     from dayamlchecker.messages import print_github_annotation
 
-    all_findings = []
-    for input_file in yaml_files:
-        findings = process_file(
-            str(input_file),
-            lint_mode=lint_mode,
-            runtime_options=runtime_options,
-        )
-        all_findings.extend(findings)
-
-    if args.url_check:
-        url_check_root = (
-            args.url_check_root.resolve()
-            if args.url_check_root is not None
-            else infer_url_check_root(yaml_files, fallback=Path.cwd())
-        )
-        url_check_result = run_url_check(
-            root=url_check_root,
-            question_files=yaml_files,
-            package_dirs=infer_package_dirs(yaml_files),
-            timeout=args.url_check_timeout,
-            check_documents=not args.url_check_skip_documents,
-            ignore_urls=parse_ignore_urls(args.url_check_ignore_urls),
-            yaml_severity=args.yaml_url_severity,
-            document_severity=args.document_url_severity,
-            unreachable_severity=args.unreachable_url_severity,
-        )
-        all_findings.extend(url_check_result.issues)
+    url_cassette: URLCassette | None = None
+    if args.url_check and args.url_check_replay is not None:
+        try:
+            url_cassette = URLCassette.load(
+                args.url_check_replay, on_miss=args.url_check_replay_miss
+            )
+        except (OSError, ValueError) as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+    elif args.url_check and args.url_check_record is not None:
+        url_cassette = URLCassette(mode="record")
+    url_check_history: URLCheckHistory | None = None
+    if args.url_check and args.url_check_history is not None:
+        try:
+            url_check_history = URLCheckHistory.load(args.url_check_history)
+        except (OSError, ValueError) as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+
+    all_findings: list[Finding] = []
+    with ExitStack() as stack:
+        executor: Executor | None = None
+        if args.jobs > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=args.jobs))
+        file_texts = _read_file_texts(yaml_files)
+
+        def check_urls_in_background() -> list[Finding]:
+            url_check_root = (
+                args.url_check_root.resolve()
+                if args.url_check_root is not None
+                else infer_url_check_root(yaml_files, fallback=Path.cwd())
+            )
+            extraction_options = URLExtractionOptions(
+                pdf_max_pages=args.url_check_pdf_max_pages,
+                pdf_time_budget=args.url_check_pdf_time_budget,
+            )
+            if args.url_manifest_out is not None:
+                write_url_manifest(
+                    args.url_manifest_out,
+                    collect_urls(
+                        root=url_check_root,
+                        question_files=yaml_files,
+                        package_dirs=infer_package_dirs(yaml_files),
+                        check_documents=not args.url_check_skip_documents,
+                        executor=executor,
+                        extraction_options=extraction_options,
+                        file_texts=file_texts,
+                    ),
+                )
+                print(
+                    f"Wrote URL manifest to {args.url_manifest_out}.",
+                    file=sys.stderr,
+                )
+                return []
+            url_check_stats = _url_check_stats_from_args(args.url_check_stats_json)
+            url_check_result = run_url_check(
+                root=url_check_root,
+                question_files=yaml_files,
+                package_dirs=infer_package_dirs(yaml_files),
+                timeout=args.url_check_timeout,
+                check_documents=not args.url_check_skip_documents,
+                ignore_urls=parse_ignore_urls(args.url_check_ignore_urls),
+                yaml_severity=args.yaml_url_severity,
+                document_severity=args.document_url_severity,
+                unreachable_severity=args.unreachable_url_severity,
+                executor=executor,
+                extraction_options=extraction_options,
+                file_texts=file_texts,
+                collapse_trailing_slashes=args.url_check_collapse_trailing_slashes,
+                cassette=url_cassette,
+                budget=args.url_check_budget,
+                history=url_check_history,
+                stats=url_check_stats,
+            )
+            if url_cassette is not None and args.url_check_record is not None:
+                url_cassette.save(args.url_check_record)
+            if url_check_history is not None:
+                url_check_history.save(args.url_check_history)
+            if url_check_stats is not None and args.url_check_stats_json is not None:
+                url_check_stats.save(args.url_check_stats_json)
+            return list(url_check_result.issues)
+
+        # URL checks are mostly network waits, so they run on a background
+        # thread while the files are linted. The thread pool is entered last
+        # so it is joined before the shared process pool shuts down.
+        url_findings: Future[list[Finding]] | None = None
+        if args.url_check or args.url_manifest_out is not None:
+            url_findings = stack.enter_context(
+                ThreadPoolExecutor(max_workers=1)
+            ).submit(check_urls_in_background)
+
+        # Without worker processes, LLM style requests would hold up the
+        # files behind them, so files are linted on threads that overlap one
+        # file's provider round trips with the linting of the next. map()
+        # keeps the results in file order either way.
+        lint_executor = executor
+        if (
+            lint_executor is None
+            and args.style_llm
+            and not runtime_options.style_llm_coalesce
+            and len(yaml_files) > 1
+        ):
+            lint_executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=args.style_llm_concurrency)
+            )
+        input_files = [str(input_file) for input_file in yaml_files]
+        contents = [file_texts.get(input_file) for input_file in yaml_files]
+        file_llm_screens: list[list[_LLMFileScreens]] = []
+        if args.fix:
+            fix_file = partial(
+                _fix_and_process_file,
+                lint_mode=lint_mode,
+                runtime_options=runtime_options,
+                line_length=args.fix_line_length,
+                convert_indent_4_to_2=not args.fix_no_indent_conversion,
+            )
+            if lint_executor is not None:
+                fixed_files = list(lint_executor.map(fix_file, input_files, contents))
+            else:
+                fixed_files = [
+                    fix_file(input_file, content)
+                    for input_file, content in zip(input_files, contents)
+                ]
+            file_findings = []
+            for input_file, fixed in zip(input_files, fixed_files):
+                if fixed.format_error is not None:
+                    print(fixed.format_error, file=sys.stderr)
+                elif fixed.reformatted:
+                    print(f"Reformatted: {input_file}", file=sys.stderr)
+                file_findings.append(fixed.findings)
+                file_llm_screens.append(fixed.llm_screens)
+        elif runtime_options.style_llm_coalesce:
+            lint_file_collecting = partial(
+                _process_file_collecting_llm_screens,
+                lint_mode=lint_mode,
+                runtime_options=runtime_options,
+            )
+            if lint_executor is not None:
+                linted_files = list(
+                    lint_executor.map(lint_file_collecting, input_files, contents)
+                )
+            else:
+                linted_files = [
+                    lint_file_collecting(input_file, content)
+                    for input_file, content in zip(input_files, contents)
+                ]
+            file_findings = [findings for findings, _ in linted_files]
+            file_llm_screens = [llm_screens for _, llm_screens in linted_files]
+        else:
+            lint_file = partial(
+                _process_file_with_content,
+                lint_mode=lint_mode,
+                runtime_options=runtime_options,
+            )
+            if lint_executor is not None:
+                file_findings = list(
+                    lint_executor.map(lint_file, input_files, contents)
+                )
+            else:
+                file_findings = [
+                    lint_file(input_file, content)
+                    for input_file, content in zip(input_files, contents)
+                ]
+        if any(file_llm_screens):
+            # Each file's LLM findings follow its other findings, as they do
+            # when the files are reviewed one at a time.
+            reviewed = iter(
+                review_llm_screens(
+                    [screens for per_file in file_llm_screens for screens in per_file],
+                    options=runtime_options.style_options(),
+                )
+            )
+            for findings, per_file in zip(file_findings, file_llm_screens):
+                for _ in per_file:
+                    findings.extend(next(reviewed))
+        save_llm_result_caches()
+        for findings in file_findings:
+            all_findings.extend(findings)
+
+        if url_findings is not None:
+            try:
+                all_findings.extend(url_findings.result())
+            except URLCassetteMiss as exc:
+                print(f"Error: {exc} in {args.url_check_replay}", file=sys.stderr)
+                return 1
 
     had_error = False
     warning_count = sum(1 for f in all_findings if f.severity == "warning")
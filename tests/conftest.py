@@ -1,8 +1,181 @@
+"""Shared pytest setup.
+
+``url_stand_in_server`` is a local HTTP server that stands in for the sites
+the URL checker visits. Paths are built from segments that are applied left
+to right, so one URL can combine several behaviours:
+
+- ``/delay/<ms>``: wait before answering
+- ``/status/<code>``: answer with that status code instead of 200
+- ``/redirect/<n>``: redirect ``n`` times before applying the rest of the path
+- ``/slow-body/<ms>``: send the headers at once, then trickle the body out
+  over that many milliseconds
+- ``/reset``: close the connection without answering
+- ``/no-head``: reject ``HEAD`` requests with 405
+
+Any other segment is ignored, so ``/status/404/page-17`` gives unique URLs
+with the same behaviour. Set ``latency`` on the server to a callable
+returning seconds to delay every request, e.g. for latency distributions
+across many URLs. ``request_counts`` counts requests per path.
+"""
+
+import socket
+import struct
 import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+_SLOW_BODY_CHUNKS = 10
+
+
+class URLStandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many connections in a burst.
+    request_queue_size = 128
+
+    def __init__(self, latency: Callable[[], float] | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.latency = latency
+        self.request_counts: Counter[str] = Counter()
+        self._counts_lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def start(self) -> "URLStandInServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # The URL checker closes streamed responses without reading them,
+        # which shows up here as a reset from the client.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def count_request(self, path: str) -> None:
+        with self._counts_lock:
+            self.request_counts[path] += 1
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: URLStandInServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+    def do_HEAD(self) -> None:
+        self._respond(head=True)
+
+    def do_GET(self) -> None:
+        self._respond(head=False)
+
+    def _respond(self, *, head: bool) -> None:
+        self.server.count_request(self.path)
+        if self.server.latency is not None:
+            time.sleep(self.server.latency())
+        segments = self.path.strip("/").split("/")
+        status = 200
+        body_seconds = 0.0
+        index = 0
+        while index < len(segments):
+            segment = segments[index]
+            argument = segments[index + 1] if index + 1 < len(segments) else ""
+            if segment == "delay":
+                time.sleep(int(argument) / 1000)
+                index += 2
+            elif segment == "status":
+                status = int(argument)
+                index += 2
+            elif segment == "redirect":
+                remaining = int(argument)
+                rest = "/".join(segments[index + 2 :])
+                location = (
+                    f"/redirect/{remaining - 1}/{rest}" if remaining > 1 else f"/{rest}"
+                )
+                self._send_empty(302, head=head, location=location)
+                return
+            elif segment == "slow-body":
+                body_seconds = int(argument) / 1000
+                index += 2
+            elif segment == "reset":
+                self._reset_connection()
+                return
+            elif segment == "no-head" and head:
+                self._send_empty(405, head=head)
+                return
+            else:
+                index += 1
+
+        body = b"x" * 1024 * _SLOW_BODY_CHUNKS
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if head:
+            return
+        chunk_size = len(body) // _SLOW_BODY_CHUNKS
+        try:
+            for start in range(0, len(body), chunk_size):
+                self.wfile.write(body[start : start + chunk_size])
+                self.wfile.flush()
+                if body_seconds:
+                    time.sleep(body_seconds / _SLOW_BODY_CHUNKS)
+        except (BrokenPipeError, ConnectionResetError):
+            # The URL checker streams responses and closes them unread.
+            self.close_connection = True
+
+    def _send_empty(self, status: int, *, head: bool, location: str = "") -> None:
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _reset_connection(self) -> None:
+        # SO_LINGER with a zero timeout makes close() send a TCP RST.
+        self.connection.setsockopt(
+            socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+        )
+        self.close_connection = True
+        self.connection.close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch) -> None:
+    """Keep tests from reading or writing the user's dayamlchecker cache."""
+    monkeypatch.setenv(
+        "DAYAMLCHECKER_CACHE_DIR", str(tmp_path_factory.mktemp("dayamlchecker-cache"))
+    )
+
+
+@pytest.fixture
+def url_stand_in_server() -> Iterator[URLStandInServer]:
+    server = URLStandInServer().start()
+    try:
+        yield server
+    finally:
+        server.stop()
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+
+from dayamlchecker import cache
+from dayamlchecker.cache import JSONCache
+
+
+def test_json_cache_save_keeps_entries_saved_by_other_runs(tmp_path: Path) -> None:
+    path = tmp_path / "cache.json"
+    first = JSONCache.load(path, version=1)
+    second = JSONCache.load(path, version=1)
+
+    first.entries["a"] = 1
+    first.save()
+    second.entries["b"] = 2
+    second.save()
+
+    assert JSONCache.load(path, version=1).entries == {"a": 1, "b": 2}
+
+
+def test_json_cache_save_drops_stale_and_least_recently_used_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "cache.json"
+    clock = [0.0]
+    monkeypatch.setattr(cache.time, "time", lambda: clock[0])
+    for now, key in ((0.0, "stale"), (60.0, "older"), (70.0, "newer")):
+        clock[0] = now
+        cache_file = JSONCache.load(path, version=1)
+        cache_file.entries[key] = now
+        cache_file.save()
+
+    clock[0] = 100.0
+    cache_file = JSONCache.load(path, version=1, max_entries=2, max_age=50)
+    cache_file.entries["newest"] = 100.0
+    cache_file.save()
+
+    assert JSONCache.load(path, version=1).entries == {"newest": 100.0, "newer": 70.0}
+
+
+def test_json_cache_save_keeps_loaded_times_for_entries_pruned_elsewhere(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "cache.json"
+    clock = [0.0]
+    monkeypatch.setattr(cache.time, "time", lambda: clock[0])
+    cache_file = JSONCache.load(path, version=1)
+    cache_file.entries["old"] = 1
+    cache_file.save()
+
+    clock[0] = 100.0
+    loaded_before_prune = JSONCache.load(path, version=1, max_age=50)
+    pruning = JSONCache.load(path, version=1, max_age=50)
+    pruning.entries["new"] = 2
+    pruning.save()
+    assert JSONCache.load(path, version=1).entries == {"new": 2}
+
+    # The other run still holds "old" in memory, but it has not been used
+    # since it was stored, so saving does not bring it back as fresh.
+    loaded_before_prune.save()
+
+    assert JSONCache.load(path, version=1).entries == {"new": 2}
+
+
+def test_json_cache_touch_keeps_read_entries_alive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "cache.json"
+    clock = [0.0]
+    monkeypatch.setattr(cache.time, "time", lambda: clock[0])
+    cache_file = JSONCache.load(path, version=1)
+    cache_file.entries.update(read=1, unread=2)
+    cache_file.save()
+
+    clock[0] = 100.0
+    cache_file = JSONCache.load(path, version=1, max_age=50)
+    cache_file.touch("read")
+    cache_file.save()
+
+    assert JSONCache.load(path, version=1).entries == {"read": 1}
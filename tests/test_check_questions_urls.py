@@ -1,15 +1,26 @@
+import io
+import json
+import time
 import warnings
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import cast
 
+import pytest
+import requests
 from linkify_it import LinkifyIt  # type: ignore[attr-defined,import-untyped]
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import RequestHistory, Retry
 
 import dayamlchecker.check_questions_urls as check_questions_urls
 from dayamlchecker.check_questions_urls import (
     check_urls,
     extract_text_from_docx,
     extract_text_from_pdf,
+    extract_url_text_from_docx,
     extract_urls_from_file,
     parse_url_token,
 )
@@ -290,6 +301,185 @@ def test_extract_text_from_docx_does_not_suppress_other_warnings(
     assert "unexpected DOCX warning" in capsys.readouterr().err
 
 
+def test_extract_urls_from_pdf_reads_link_annotations_past_page_budget(
+    tmp_path: Path, capsys
+) -> None:
+    from pypdf import PdfWriter
+    from pypdf.annotations import Link
+
+    file_path = tmp_path / "form.pdf"
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=200, height=200)
+    writer.add_annotation(
+        page_number=2,
+        annotation=Link(
+            rect=(10, 10, 100, 30), url="https://link.suffolklitlab.org/form"
+        ),
+    )
+    with file_path.open("wb") as handle:
+        writer.write(handle)
+
+    urls, concatenated, repairs = check_questions_urls._extract_urls_from_file_detailed(
+        file_path,
+        LinkifyIt(options={"fuzzy_link": False}),
+        check_questions_urls.URLExtractionOptions(pdf_max_pages=1),
+    )
+
+    assert urls == ["https://link.suffolklitlab.org/form"]
+    assert concatenated == []
+    assert repairs == {}
+    assert "page budget of 1" in capsys.readouterr().err
+
+
+def test_extract_urls_from_pdf_streams_pages_and_repairs_from_annotations(
+    tmp_path: Path, monkeypatch
+) -> None:
+    file_path = tmp_path / "form.pdf"
+    file_path.write_bytes(b"%PDF-1.4\n")
+    extracted_pages: list[int] = []
+
+    class FakeURI:
+        def __init__(self, uri: str) -> None:
+            self.uri = uri
+
+        def get_object(self) -> str:
+            return self.uri
+
+    class FakePage(dict):
+        def __init__(self, number: int, text: str, uri: str | None = None) -> None:
+            super().__init__()
+            self.number = number
+            self.text = text
+            if uri is not None:
+                self["/Annots"] = FakeAnnotations(
+                    [
+                        FakeAnnotation(
+                            {"/Subtype": "/Link", "/A": {"/URI": FakeURI(uri)}}
+                        )
+                    ]
+                )
+
+        def extract_text(self) -> str:
+            extracted_pages.append(self.number)
+            return self.text
+
+    class FakeAnnotation(dict):
+        def get_object(self) -> "FakeAnnotation":
+            return self
+
+    class FakeAnnotations(list):
+        def get_object(self) -> "FakeAnnotations":
+            return self
+
+    class FakeReader:
+        def __init__(self, _: Path) -> None:
+            self.pages = [
+                FakePage(
+                    1,
+                    "Visit https://www.courts.michigan.gov/forms/scao\napproved.",
+                    uri="https://www.courts.michigan.gov/forms/scao-approved/dhs.pdf",
+                ),
+                FakePage(2, "Also https://second.suffolklitlab.org/page"),
+                FakePage(3, "Never https://third.suffolklitlab.org/page"),
+            ]
+
+    monkeypatch.setattr(check_questions_urls, "PdfReader", FakeReader)
+
+    urls, _, repairs = check_questions_urls._extract_urls_from_file_detailed(
+        file_path,
+        LinkifyIt(options={"fuzzy_link": False}),
+        check_questions_urls.URLExtractionOptions(pdf_max_pages=2),
+    )
+
+    assert extracted_pages == [1, 2]
+    assert urls == [
+        "https://www.courts.michigan.gov/forms/scao-approved/dhs.pdf",
+        "https://www.courts.michigan.gov/forms/scao",
+        "https://second.suffolklitlab.org/page",
+    ]
+    assert repairs == {
+        "https://www.courts.michigan.gov/forms/scao": {
+            "https://www.courts.michigan.gov/forms/scao-approved/dhs.pdf"
+        }
+    }
+
+
+def _write_docx(file_path: Path, document_xml: str, rels_xml: str) -> None:
+    with zipfile.ZipFile(file_path, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", document_xml)
+        archive.writestr("word/_rels/document.xml.rels", rels_xml)
+
+
+def test_extract_urls_from_docx_reads_hyperlink_relationships_and_text_runs(
+    tmp_path: Path,
+) -> None:
+    file_path = tmp_path / "template.docx"
+    _write_docx(
+        file_path,
+        (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+            'wordprocessingml/2006/main" xmlns:r="http://schemas.openxmlformats.org/'
+            'officeDocument/2006/relationships"><w:body>'
+            '<w:p><w:hyperlink r:id="rId7"><w:r><w:t>our website</w:t></w:r>'
+            "</w:hyperlink></w:p>"
+            "<w:p><w:r><w:t>Visit https://live.suffolklitlab.org/</w:t></w:r>"
+            "<w:r><w:t>split-run for help.</w:t></w:r></w:p>"
+            "</w:body></w:document>"
+        ),
+        (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships">'
+            '<Relationship Id="rId7" TargetMode="External" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/hyperlink" '
+            'Target="https://link.suffolklitlab.org/display?a=1&amp;b=2"/>'
+            '<Relationship Id="rId8" TargetMode="External" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/image" Target="https://images.suffolklitlab.org/logo.png"/>'
+            "</Relationships>"
+        ),
+    )
+
+    urls, concatenated = extract_urls_from_file(
+        file_path, LinkifyIt(options={"fuzzy_link": False})
+    )
+
+    assert urls == [
+        "https://link.suffolklitlab.org/display?a=1&b=2",
+        "https://live.suffolklitlab.org/split-run",
+    ]
+    assert concatenated == []
+
+
+def test_extract_url_text_from_docx_warns_on_invalid_archive(
+    tmp_path: Path, capsys
+) -> None:
+    file_path = tmp_path / "template.docx"
+    file_path.write_bytes(b"placeholder")
+
+    assert extract_url_text_from_docx(file_path) == ""
+    assert "could not extract text from DOCX" in capsys.readouterr().err
+
+
+def test_extract_url_text_from_docx_warns_on_encrypted_archive(
+    tmp_path: Path, capsys
+) -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document/>")
+    data = bytearray(buffer.getvalue())
+    # Set the "encrypted" flag bit in both the local and central headers.
+    data[6] |= 0x1
+    data[data.find(b"PK\x01\x02") + 8] |= 0x1
+    file_path = tmp_path / "template.docx"
+    file_path.write_bytes(bytes(data))
+
+    assert extract_url_text_from_docx(file_path) == ""
+    assert "could not extract text from DOCX" in capsys.readouterr().err
+
+
 def test_extract_wrapped_pdf_url_repairs_finds_joined_candidate() -> None:
     repairs = check_questions_urls._extract_wrapped_pdf_url_repairs(
         "Visit https://www.courts.michigan.gov/49752a/siteassets/forms/scao-\n"
@@ -344,3 +534,715 @@ def test_check_urls_tries_pdf_repair_candidates_after_dead_link() -> None:
         "https://www.courts.michigan.gov/49752a/siteassets/forms/scao-",
         "https://www.courts.michigan.gov/49752a/siteassets/forms/scao-approved/dhs1201d.pdf",
     ]
+
+
+def test_collect_urls_from_files_merges_parallel_results_in_file_order(
+    tmp_path: Path,
+) -> None:
+    file_paths = []
+    for index in range(6):
+        file_path = tmp_path / f"interview_{index}.yml"
+        file_path.write_text(
+            "\n".join(
+                [
+                    'shared: "https://shared.suffolklitlab.org/page"',
+                    f'own: "https://live.suffolklitlab.org/{index}"',
+                    f'bad: "https://a.suffolklitlab.org/helphttps://b.suffolklitlab.org/{index}"',
+                    "",
+                ]
+            ),
+            encoding="utf-8",
+        )
+        file_paths.append(file_path)
+
+    serial = check_questions_urls.collect_urls_from_files(file_paths, tmp_path)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = check_questions_urls.collect_urls_from_files(
+            file_paths, tmp_path, executor=executor
+        )
+
+    assert parallel == serial
+    assert list(parallel[0]) == list(serial[0])
+    assert parallel[0]["https://shared.suffolklitlab.org/page"] == {
+        f"interview_{index}.yml" for index in range(6)
+    }
+    assert len(parallel[1]) == 6
+
+
+def test_collect_urls_from_files_uses_preloaded_text(tmp_path: Path) -> None:
+    loaded = tmp_path / "loaded.yml"
+    loaded.write_text('url: "https://disk.suffolklitlab.org/"\n', encoding="utf-8")
+    unloaded = tmp_path / "unloaded.yml"
+    unloaded.write_text('url: "https://other.suffolklitlab.org/"\n', encoding="utf-8")
+
+    url_sources, _, _ = check_questions_urls.collect_urls_from_files(
+        [loaded, unloaded],
+        tmp_path,
+        file_texts={loaded: 'url: "https://memory.suffolklitlab.org/"\n'},
+    )
+
+    assert url_sources == {
+        "https://memory.suffolklitlab.org/": {"loaded.yml"},
+        "https://other.suffolklitlab.org/": {"unloaded.yml"},
+    }
+
+
+def test_url_manifests_round_trip_and_merge_shards(tmp_path: Path) -> None:
+    first = tmp_path / "first.yml"
+    first.write_text(
+        "\n".join(
+            [
+                'shared: "https://shared.suffolklitlab.org/"',
+                'bad: "https://a.suffolklitlab.org/helphttps://b.suffolklitlab.org/"',
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    second = tmp_path / "second.yml"
+    second.write_text('shared: "https://shared.suffolklitlab.org/"\n', encoding="utf-8")
+    first_shard = check_questions_urls.collect_urls(
+        tmp_path, question_files=[first], check_documents=False
+    )
+    second_shard = replace(
+        check_questions_urls.collect_urls(
+            tmp_path, question_files=[second], check_documents=False
+        ),
+        document_urls={"https://form.suffolklitlab.org/scao-": {"form.pdf"}},
+        document_repairs={
+            "https://form.suffolklitlab.org/scao-": {
+                "https://form.suffolklitlab.org/scao-approved.pdf"
+            }
+        },
+    )
+
+    first_manifest = tmp_path / "first.json"
+    second_manifest = tmp_path / "second.json"
+    check_questions_urls.write_url_manifest(first_manifest, first_shard)
+    check_questions_urls.write_url_manifest(second_manifest, second_shard)
+    merged = check_questions_urls.read_url_manifests([first_manifest, second_manifest])
+
+    assert merged == check_questions_urls.merge_url_sources([first_shard, second_shard])
+    assert merged.yaml_urls == {
+        "https://shared.suffolklitlab.org/": {"first.yml", "second.yml"}
+    }
+    assert merged.yaml_concatenated == {
+        "https://a.suffolklitlab.org/helphttps://b.suffolklitlab.org/": {"first.yml"}
+    }
+    assert merged.document_repairs == second_shard.document_repairs
+
+
+def test_read_url_manifests_rejects_unknown_versions(tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text('{"version": 99, "urls": []}', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="unsupported URL manifest version 99"):
+        check_questions_urls.read_url_manifests([manifest])
+
+
+def test_check_collected_urls_requests_each_unique_url_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeResponse:
+        status_code = 404
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            self.calls.append(url)
+            return FakeResponse()
+
+    session = FakeSession()
+    monkeypatch.setattr(check_questions_urls, "build_session", lambda: session)
+    collected = check_questions_urls.URLSourceCollection(
+        yaml_urls={"https://gone.suffolklitlab.org/": {"a.yml", "b.yml"}},
+        document_urls={"https://gone.suffolklitlab.org/": {"form.docx"}},
+        yaml_concatenated={},
+        document_concatenated={},
+        yaml_repairs={},
+        document_repairs={},
+    )
+
+    result = check_questions_urls.check_collected_urls(collected)
+
+    assert session.calls == ["https://gone.suffolklitlab.org/"]
+    assert [(issue.source_kind, issue.sources) for issue in result.issues] == [
+        ("yaml", ("a.yml", "b.yml")),
+        ("template", ("form.docx",)),
+    ]
+
+
+def test_canonicalize_url_normalizes_fetch_target() -> None:
+    canonicalize_url = check_questions_urls.canonicalize_url
+
+    assert (
+        canonicalize_url("HTTPS://Courts.Suffolklitlab.ORG:443/Page?a=1#section")
+        == "https://courts.suffolklitlab.org/Page?a=1"
+    )
+    assert (
+        canonicalize_url("http://user@x.suffolklitlab.org:80")
+        == "http://user@x.suffolklitlab.org/"
+    )
+    assert (
+        canonicalize_url("https://x.suffolklitlab.org:8443/a/")
+        == "https://x.suffolklitlab.org:8443/a/"
+    )
+    assert (
+        canonicalize_url(
+            "https://x.suffolklitlab.org/a//", collapse_trailing_slash=True
+        )
+        == "https://x.suffolklitlab.org/a"
+    )
+    assert canonicalize_url("http://x.suffolklitlab.org/") != canonicalize_url(
+        "https://x.suffolklitlab.org/"
+    )
+
+
+@pytest.mark.parametrize(
+    ("collapse_trailing_slashes", "expected_calls"),
+    [
+        (
+            False,
+            [
+                "http://x.suffolklitlab.org/page",
+                "https://x.suffolklitlab.org/page",
+                "https://x.suffolklitlab.org/page/",
+            ],
+        ),
+        (
+            True,
+            ["http://x.suffolklitlab.org/page", "https://x.suffolklitlab.org/page"],
+        ),
+    ],
+)
+def test_check_urls_fetches_each_canonical_url_once(
+    collapse_trailing_slashes: bool, expected_calls: list[str]
+) -> None:
+    class FakeResponse:
+        status_code = 404
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            self.calls.append(url)
+            return FakeResponse()
+
+    urls = [
+        "https://x.suffolklitlab.org/page",
+        "https://X.suffolklitlab.org/page#intro",
+        "https://x.suffolklitlab.org/page/",
+        "http://x.suffolklitlab.org/page",
+    ]
+    session = FakeSession()
+    broken, unreachable = check_urls(
+        cast(Session, session),
+        urls,
+        timeout=10,
+        collapse_trailing_slashes=collapse_trailing_slashes,
+    )
+
+    assert sorted(session.calls) == expected_calls
+    assert broken == [(url, 404) for url in sorted(urls)]
+    assert unreachable == []
+
+
+def test_check_urls_fetches_urls_as_written() -> None:
+    class FakeResponse:
+        status_code = 200
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            self.calls.append(url)
+            return FakeResponse()
+
+    session = FakeSession()
+    check_urls(
+        cast(Session, session),
+        [
+            "https://x.suffolklitlab.org/page/",
+            "https://x.suffolklitlab.org/page/#top",
+            "https://Y.suffolklitlab.org:443",
+        ],
+        timeout=10,
+        collapse_trailing_slashes=True,
+    )
+
+    assert sorted(session.calls) == [
+        "https://Y.suffolklitlab.org:443",
+        "https://x.suffolklitlab.org/page/",
+    ]
+
+
+def test_url_cassette_records_and_replays_without_network(
+    tmp_path: Path,
+) -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class RecordingSession:
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            if "offline" in url:
+                raise requests.ConnectionError("offline")
+            return FakeResponse(404 if "gone" in url else 200)
+
+    class NoNetworkSession:
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            raise AssertionError(url)
+
+    urls = [
+        "https://gone.suffolklitlab.org/",
+        "https://live.suffolklitlab.org/",
+        "https://offline.suffolklitlab.org/",
+    ]
+    recorder = check_questions_urls.URLCassette(mode="record")
+    recorded = check_urls(
+        cast(Session, RecordingSession()), urls, timeout=10, cassette=recorder
+    )
+    cassette_path = tmp_path / "urls.cassette.json"
+    recorder.save(cassette_path)
+
+    replayer = check_questions_urls.URLCassette.load(cassette_path)
+    replayed = check_urls(
+        cast(Session, NoNetworkSession()), urls, timeout=10, cassette=replayer
+    )
+
+    assert replayed == recorded
+    assert recorded == (
+        [("https://gone.suffolklitlab.org/", 404)],
+        ["https://offline.suffolklitlab.org/"],
+    )
+
+    with pytest.raises(check_questions_urls.URLCassetteMiss):
+        check_urls(
+            cast(Session, NoNetworkSession()),
+            ["https://new.suffolklitlab.org/"],
+            timeout=10,
+            cassette=replayer,
+        )
+
+    skipping = check_questions_urls.URLCassette.load(cassette_path, on_miss="skip")
+    assert check_urls(
+        cast(Session, NoNetworkSession()),
+        ["https://new.suffolklitlab.org/"],
+        timeout=10,
+        cassette=skipping,
+    ) == ([], [])
+
+
+def test_check_collected_urls_orders_by_source_and_history_and_skips_past_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = [0.0]
+
+    class FakeResponse:
+        status_code = 200
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, float]] = []
+
+        def get(self, url: str, *, timeout: float, **kwargs) -> FakeResponse:
+            self.calls.append((url, timeout))
+            clock[0] += 4.0
+            return FakeResponse()
+
+    session = FakeSession()
+    monkeypatch.setattr(check_questions_urls, "build_session", lambda: session)
+    monkeypatch.setattr(check_questions_urls.time, "monotonic", lambda: clock[0])
+    history_path = tmp_path / "history.json"
+    history = check_questions_urls.URLCheckHistory(
+        entries={
+            "https://healthy.suffolklitlab.org/": ("healthy", 100.0),
+            "https://broken.suffolklitlab.org/": ("broken", 200.0),
+        }
+    )
+    collected = check_questions_urls.URLSourceCollection(
+        yaml_urls={
+            "https://healthy.suffolklitlab.org/": {"a.yml"},
+            "https://broken.suffolklitlab.org/": {"a.yml"},
+            "https://new.suffolklitlab.org/": {"a.yml"},
+        },
+        document_urls={"https://template.suffolklitlab.org/": {"form.docx"}},
+        yaml_concatenated={},
+        document_concatenated={},
+        yaml_repairs={},
+        document_repairs={},
+    )
+
+    result = check_questions_urls.check_collected_urls(
+        collected, budget=10, history=history
+    )
+
+    assert session.calls == [
+        ("https://broken.suffolklitlab.org/", 10),
+        ("https://new.suffolklitlab.org/", 6.0),
+        ("https://healthy.suffolklitlab.org/", 2.0),
+    ]
+    assert result.checked_url_count == 3
+    assert [(issue.code, issue.url) for issue in result.issues] == [
+        ("WG604", "https://template.suffolklitlab.org/")
+    ]
+    assert history.entries["https://broken.suffolklitlab.org/"][0] == "healthy"
+    assert "https://template.suffolklitlab.org/" not in history.entries
+
+    history.save(history_path)
+    assert (
+        check_questions_urls.URLCheckHistory.load(history_path).entries
+        == history.entries
+    )
+    assert not check_questions_urls.URLCheckHistory.load(tmp_path / "missing").entries
+
+
+def test_check_collected_urls_reports_replay_misses_as_skipped(
+    monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
+    monkeypatch.setattr(check_questions_urls, "build_session", lambda: None)
+    cassette = check_questions_urls.URLCassette(
+        mode="replay",
+        on_miss="skip",
+        responses={"https://recorded.suffolklitlab.org/": (200, False)},
+    )
+    history = check_questions_urls.URLCheckHistory()
+    collected = check_questions_urls.URLSourceCollection(
+        yaml_urls={
+            "https://recorded.suffolklitlab.org/": {"a.yml"},
+            "https://new.suffolklitlab.org/": {"a.yml"},
+        },
+        document_urls={},
+        yaml_concatenated={},
+        document_concatenated={},
+        yaml_repairs={},
+        document_repairs={},
+    )
+
+    result = check_questions_urls.check_collected_urls(
+        collected, cassette=cassette, history=history
+    )
+
+    assert result.checked_url_count == 1
+    assert [(issue.code, issue.url) for issue in result.issues] == [
+        ("WG604", "https://new.suffolklitlab.org/")
+    ]
+    assert list(history.entries) == ["https://recorded.suffolklitlab.org/"]
+    assert "no recorded response for https://new.suffolklitlab.org/" in (
+        capsys.readouterr().err
+    )
+
+
+def test_url_matcher_matches_prefixes_globs_and_host_suffixes() -> None:
+    matcher = check_questions_urls.URLMatcher(
+        exact={"https://courts.suffolklitlab.org/exact"},
+        prefixes={"https://api.suffolklitlab.org/v1/"},
+        globs={
+            "https://docs.suffolklitlab.org/*",
+            "https://*.suffolklitlab.org/forms/*.pdf",
+            "*://mirror.suffolklitlab.org/?",
+        },
+        host_suffixes={"internal.suffolklitlab.org"},
+    )
+
+    assert matcher.matches("https://courts.suffolklitlab.org/exact")
+    assert not matcher.matches("https://courts.suffolklitlab.org/exact/more")
+    assert matcher.matches("https://api.suffolklitlab.org/v1/chat")
+    assert not matcher.matches("https://api.suffolklitlab.org/v2/chat")
+    assert matcher.matches("https://docs.suffolklitlab.org/a/b")
+    assert matcher.matches("https://courts.suffolklitlab.org/forms/a/b.pdf")
+    assert not matcher.matches("https://courts.suffolklitlab.org/forms/a.docx")
+    assert matcher.matches("http://mirror.suffolklitlab.org/x")
+    assert not matcher.matches("http://mirror.suffolklitlab.org/xy")
+    assert matcher.matches("https://a.b.internal.suffolklitlab.org/page")
+    assert not matcher.matches("https://notinternal.suffolklitlab.org/page")
+
+
+def test_ignore_url_globs_skip_matching_urls(monkeypatch: pytest.MonkeyPatch) -> None:
+    checked: list[str] = []
+
+    def fake_check_url_targets(session, urls, timeout, *args, **kwargs):
+        checked.extend(sorted(urls))
+        return {}, []
+
+    monkeypatch.setattr(check_questions_urls, "build_session", lambda: None)
+    monkeypatch.setattr(
+        check_questions_urls, "_check_url_targets", fake_check_url_targets
+    )
+    ignore_urls = check_questions_urls.parse_ignore_urls(
+        "https://docs.suffolklitlab.org/*, https://courts.suffolklitlab.org/a"
+    )
+    collected = check_questions_urls.URLSourceCollection(
+        yaml_urls={
+            "https://docs.suffolklitlab.org/guide": {"a.yml"},
+            "https://courts.suffolklitlab.org/a": {"a.yml"},
+            "https://courts.suffolklitlab.org/b": {"a.yml"},
+        },
+        document_urls={},
+        yaml_concatenated={},
+        document_concatenated={},
+        yaml_repairs={},
+        document_repairs={},
+    )
+
+    result = check_questions_urls.check_collected_urls(
+        collected, ignore_urls=ignore_urls
+    )
+
+    assert ignore_urls == {
+        "https://docs.suffolklitlab.org/*",
+        "https://courts.suffolklitlab.org/a",
+    }
+    assert result.ignored_url_count == 2
+    assert checked == ["https://courts.suffolklitlab.org/b"]
+
+
+def test_ignore_urls_with_query_strings_match_literally() -> None:
+    ignore_urls = check_questions_urls.parse_ignore_urls(
+        "https://courts.suffolklitlab.org/search?q=1,"
+        "https://courts.suffolklitlab.org/form?id=[a]&page=*"
+    )
+    matcher = check_questions_urls.URLMatcher.from_patterns(ignore_urls)
+
+    assert "https://courts.suffolklitlab.org/search?q=1" in ignore_urls
+    assert matcher.matches("https://courts.suffolklitlab.org/search?q=1")
+    assert not matcher.matches("https://courts.suffolklitlab.org/searchXq=1")
+    assert matcher.matches("https://courts.suffolklitlab.org/form?id=[a]&page=2")
+    assert not matcher.matches("https://courts.suffolklitlab.org/formXid=a&page=2")
+
+
+def test_url_check_stats_record_requests_hosts_and_progress(
+    tmp_path: Path,
+) -> None:
+    class FakeRaw:
+        def __init__(self, retries: int, body_bytes: int) -> None:
+            self.retries = Retry(
+                total=2,
+                history=tuple(
+                    RequestHistory("GET", None, None, None, None)
+                    for _ in range(retries)
+                ),
+            )
+            self.body_bytes = body_bytes
+
+        def tell(self) -> int:
+            return self.body_bytes
+
+    class FakeResponse:
+        def __init__(
+            self,
+            status_code: int,
+            raw: FakeRaw,
+            history: list["FakeResponse"],
+            content_length: int = 0,
+        ) -> None:
+            self.status_code = status_code
+            self.raw = raw
+            self.history = history
+            self.headers = {"Content-Length": str(content_length)}
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class FakeSession:
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            if "gone" in url:
+                return FakeResponse(404, FakeRaw(0, 0), [])
+            if "down" in url:
+                raise requests.ConnectionError("connection refused")
+            redirect = FakeResponse(301, FakeRaw(1, 120), [])
+            return FakeResponse(200, FakeRaw(0, 0), [redirect], content_length=900)
+
+    progress = io.StringIO()
+    stats = check_questions_urls.URLCheckStats(progress_stream=progress)
+    broken, unreachable = check_questions_urls._split_check_results(
+        check_questions_urls._check_url_targets(
+            cast(Session, FakeSession()),
+            [
+                "https://courts.suffolklitlab.org/moved",
+                "https://courts.suffolklitlab.org/gone",
+                "https://down.suffolklitlab.org/",
+            ],
+            10,
+            stats=stats,
+        )[0]
+    )
+    stats_path = tmp_path / "stats.json"
+    stats.save(stats_path)
+    data = json.loads(stats_path.read_text(encoding="utf-8"))
+
+    assert broken == [("https://courts.suffolklitlab.org/gone", 404)]
+    assert unreachable == ["https://down.suffolklitlab.org/"]
+    assert progress.getvalue().endswith("Checking URLs: 3/3, ETA 0s\n")
+    assert data["checked"] == data["total"] == 3
+    assert data["hosts"]["courts.suffolklitlab.org"]["count"] == 2
+    assert data["hosts"]["courts.suffolklitlab.org"]["failures"] == 1
+    assert data["hosts"]["down.suffolklitlab.org"]["failures"] == 1
+    assert set(data["hosts"]["down.suffolklitlab.org"]) == {
+        "count",
+        "p50",
+        "p95",
+        "failures",
+    }
+    moved = next(
+        request for request in data["requests"] if request["url"].endswith("moved")
+    )
+    assert (moved["redirects"], moved["retries"], moved["bytes_read"]) == (
+        1,
+        1,
+        1020,
+    )
+
+
+def test_retries_within_disables_retries_that_could_pass_the_deadline() -> None:
+    session = check_questions_urls.build_session()
+    url = "https://courts.suffolklitlab.org/"
+    adapter = cast(HTTPAdapter, session.get_adapter(url))
+    retry = adapter.max_retries
+
+    # Three 10s attempts plus a 0.8s backoff do not fit in 20s.
+    with check_questions_urls._retries_within(session, url, 10, 20):
+        assert adapter.max_retries.total == 0
+    assert adapter.max_retries is retry
+
+    with check_questions_urls._retries_within(session, url, 10, 31):
+        assert adapter.max_retries is retry
+
+
+def test_check_url_targets_skips_dead_urls_whose_repairs_ran_out_of_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [0.0]
+
+    class FakeResponse:
+        status_code = 404
+        history: list["FakeResponse"] = []
+        raw = None
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    class FakeSession:
+        def get(self, url: str, **kwargs) -> FakeResponse:
+            clock[0] += 6.0
+            return FakeResponse()
+
+    monkeypatch.setattr(check_questions_urls.time, "monotonic", lambda: clock[0])
+    stats = check_questions_urls.URLCheckStats()
+    results, skipped = check_questions_urls._check_url_targets(
+        cast(Session, FakeSession()),
+        [
+            "https://courts.suffolklitlab.org/a",
+            "https://courts.suffolklitlab.org/b",
+        ],
+        10,
+        repair_candidates={
+            "https://courts.suffolklitlab.org/a": {
+                "https://courts.suffolklitlab.org/a-1",
+                "https://courts.suffolklitlab.org/a-2",
+            }
+        },
+        budget=10,
+        stats=stats,
+    )
+
+    assert results == {}
+    assert skipped == [
+        "https://courts.suffolklitlab.org/a",
+        "https://courts.suffolklitlab.org/b",
+    ]
+    assert (stats.done, stats.skipped, stats.total) == (2, 2, 2)
+    assert stats.to_json()["checked"] == 0
+
+
+def _write_question_urls(root: Path, urls: list[str]) -> Path:
+    question = root / "docassemble" / "Demo" / "data" / "questions" / "urls.yml"
+    question.parent.mkdir(parents=True)
+    question.write_text(
+        "question: Links\nsubquestion: |\n" + "".join(f"  * {url}\n" for url in urls),
+        encoding="utf-8",
+    )
+    return question
+
+
+def test_run_url_check_against_stand_in_server(
+    tmp_path: Path, url_stand_in_server
+) -> None:
+    server = url_stand_in_server
+    urls = {
+        "ok": server.url("ok"),
+        "gone": server.url("status/404"),
+        "removed": server.url("status/410"),
+        "moved": server.url("redirect/3/status/404"),
+        "slow_body": server.url("slow-body/5000"),
+        "no_head": server.url("no-head"),
+        "reset": server.url("reset"),
+    }
+    question = _write_question_urls(tmp_path, list(urls.values()))
+    stats = check_questions_urls.URLCheckStats()
+
+    started = time.monotonic()
+    result = check_questions_urls.run_url_check(
+        root=tmp_path,
+        question_files=[question],
+        check_documents=False,
+        timeout=5,
+        stats=stats,
+    )
+
+    assert time.monotonic() - started < 5
+    assert {(issue.category, issue.url) for issue in result.issues} == {
+        ("broken", urls["gone"]),
+        ("broken", urls["removed"]),
+        ("broken", urls["moved"]),
+        ("unreachable", urls["reset"]),
+    }
+    assert result.checked_url_count == len(urls)
+    by_url = {request.url: request for request in stats.requests}
+    assert by_url[urls["moved"]].redirects == 3
+    # Every stand-in page is 10 KiB and redirects have empty bodies.
+    assert by_url[urls["ok"]].bytes_read == 10 * 1024
+    assert by_url[urls["moved"]].bytes_read == 10 * 1024
+    assert by_url[urls["reset"]].bytes_read == 0
+    assert by_url[urls["reset"]].retries == 2
+    assert server.request_counts["/reset"] == 3
@@ -3,7 +3,9 @@ from dayamlchecker.code_formatter import (
     format_python_code,
     format_yaml_string,
     FormatterConfig,
+    _AmbiguousYaml,
     _convert_indent_4_to_2,
+    _scan_python_blocks,
     _strip_common_indent,
 )
 
@@ -230,6 +232,58 @@ code: |
         self.assertIn("if True:\n    x = 1", result)
 
 
+class TestBlockScanner(unittest.TestCase):
+    def _scan(self, yaml_content):
+        return _scan_python_blocks(
+            yaml_content.splitlines(keepends=True), FormatterConfig().python_keys
+        )
+
+    def test_finds_blocks_in_mappings_and_sequences(self):
+        yaml_content = """---
+code: |
+  x=1
+---
+fields:
+  - Name: value
+    validation code: |-
+      if not ok:
+          fail()
+
+other: |
+  not python
+"""
+        self.assertEqual(
+            self._scan(yaml_content),
+            [
+                (1, "code", "x=1\n"),
+                (6, "validation code", "if not ok:\n    fail()"),
+            ],
+        )
+
+    def test_ambiguous_inputs_raise(self):
+        for yaml_content in (
+            "code: &anchor |\n  x=1\n",
+            "code: >\n  x=1\n",
+            'code: "x=1\n  y=2"\n',
+            "code: |2\n   x=1\n",
+            "code: |\n  x=1\ncode: |\n  y=2\n",
+        ):
+            with self.subTest(yaml_content=yaml_content):
+                with self.assertRaises(_AmbiguousYaml):
+                    self._scan(yaml_content)
+
+    def test_ambiguous_inputs_fall_back_to_ruamel(self):
+        result, changed = format_yaml_string('---\ncode: "x=1"\n')
+        self.assertFalse(changed)
+        result, changed = format_yaml_string("---\nfoo: &a {}\ncode: |\n  x=1\n")
+        self.assertTrue(changed)
+        self.assertIn("x = 1", result)
+
+    def test_files_without_python_keys_are_not_parsed(self):
+        yaml_content = "question: [unclosed\n"
+        self.assertEqual(format_yaml_string(yaml_content), (yaml_content, False))
+
+
 class TestFormatterConfig(unittest.TestCase):
     def test_default_config(self):
         config = FormatterConfig()
@@ -1,6 +1,8 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 from dayamlchecker.code_formatter import _collect_yaml_files
 
 
@@ -74,3 +76,223 @@ def test_formatter_collect_yaml_files_can_disable_default_ignores():
                 sources_file,
             ]
         )
+
+
+def test_formatter_jobs_keeps_output_order_and_check_exit_code(
+    tmp_path, monkeypatch, capsys
+):
+    import sys
+
+    from dayamlchecker import code_formatter
+
+    messy = "---\ncode: |\n  x=1\n"
+    clean = "---\nquestion: Hello\n"
+    files = []
+    for index in range(6):
+        path = tmp_path / f"interview_{index}.yml"
+        path.write_text(messy if index % 2 else clean, encoding="utf-8")
+        files.append(path)
+    broken = tmp_path / "interview_9.yml"
+    broken.write_text("---\ncode: |\n  if True\n", encoding="utf-8")
+
+    def run(*args: str) -> tuple[int, str, str]:
+        monkeypatch.setattr(sys, "argv", ["dayamlchecker-fmt", *args])
+        exit_code = code_formatter.main()
+        captured = capsys.readouterr()
+        return exit_code, captured.out, captured.err
+
+    serial = run("--check", str(tmp_path))
+    parallel = run("--check", "--jobs", "3", str(tmp_path))
+
+    assert parallel == serial
+    exit_code, out, err = parallel
+    assert exit_code == 1
+    assert out.splitlines()[:3] == [
+        f"Unchanged: {files[0]}",
+        f"Would reformat: {files[1]}",
+        f"Unchanged: {files[2]}",
+    ]
+    assert "Summary: 3 reformatted, 3 unchanged, 1 errors (7 total)" in out
+    assert f"Error processing {broken}" in err
+    assert files[1].read_text(encoding="utf-8") == messy
+
+
+def test_formatter_cache_skips_known_formatted_files_and_blocks(
+    tmp_path, monkeypatch, capsys
+):
+    import sys
+
+    import black
+
+    from dayamlchecker import code_formatter
+
+    cache_dir = tmp_path / "cache"
+    interview = tmp_path / "interview.yml"
+    interview.write_text("---\ncode: |\n  x=1\n---\ncode: |\n  y = 2\n")
+    black_calls = []
+    real_format_file_contents = black.format_file_contents
+
+    def counting_format_file_contents(*args, **kwargs):
+        black_calls.append(args[0])
+        return real_format_file_contents(*args, **kwargs)
+
+    monkeypatch.setattr(black, "format_file_contents", counting_format_file_contents)
+
+    def run(*args: str) -> int:
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["dayamlchecker-fmt", "--cache-dir", str(cache_dir), *args],
+        )
+        code_formatter._load_formatter_caches.cache_clear()
+        exit_code = code_formatter.main()
+        capsys.readouterr()
+        return exit_code
+
+    assert run("--check", str(interview)) == 1
+    assert len(black_calls) == 2
+    # Both blocks are cached now, so the write does not run Black again.
+    assert run(str(interview)) == 0
+    assert len(black_calls) == 2
+    assert interview.read_text() == "---\ncode: |\n  x = 1\n---\ncode: |\n  y = 2\n"
+    # The written file is known to be formatted and is not even parsed.
+    monkeypatch.setattr(
+        code_formatter,
+        "format_yaml_string",
+        lambda *args, **kwargs: pytest.fail("cached file was formatted again"),
+    )
+    assert run("--check", str(interview)) == 0
+    with pytest.raises(pytest.fail.Exception):
+        run("--check", "--no-cache", str(interview))
+
+
+def test_formatter_cache_keeps_blocks_read_from_it_alive(tmp_path, monkeypatch, capsys):
+    import json
+    import sys
+
+    from dayamlchecker import cache, code_formatter
+
+    cache_dir = tmp_path / "cache"
+    interview = tmp_path / "interview.yml"
+    interview.write_text("---\ncode: |\n  x=1\n")
+    clock = [0.0]
+    monkeypatch.setattr(cache.time, "time", lambda: clock[0])
+
+    def run() -> int:
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["dayamlchecker-fmt", "--cache-dir", str(cache_dir), "--check"]
+            + [str(interview)],
+        )
+        code_formatter._load_formatter_caches.cache_clear()
+        exit_code = code_formatter.main()
+        capsys.readouterr()
+        return exit_code
+
+    def block_times() -> list[float]:
+        data = json.loads((cache_dir / "formatter-blocks.json").read_text())
+        return list(data["used"].values())
+
+    assert run() == 1
+    assert block_times() == [0.0]
+    # The file still needs formatting, so only the block cache answers.
+    clock[0] = 100.0
+    assert run() == 1
+    assert block_times() == [100.0]
+
+
+def test_formatter_cache_is_invalidated_by_formatter_changes(
+    tmp_path, monkeypatch, capsys
+):
+    import sys
+
+    from dayamlchecker import code_formatter
+
+    cache_dir = tmp_path / "cache"
+    interview = tmp_path / "interview.yml"
+    interview.write_text("---\ncode: |\n  x = 1\n")
+    formatted_files = []
+    real_format_yaml_string = code_formatter.format_yaml_string
+
+    def counting_format_yaml_string(*args, **kwargs):
+        formatted_files.append(args[0])
+        return real_format_yaml_string(*args, **kwargs)
+
+    monkeypatch.setattr(
+        code_formatter, "format_yaml_string", counting_format_yaml_string
+    )
+
+    def run() -> int:
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["dayamlchecker-fmt", "--cache-dir", str(cache_dir), "--check"]
+            + [str(interview)],
+        )
+        code_formatter._load_formatter_caches.cache_clear()
+        exit_code = code_formatter.main()
+        capsys.readouterr()
+        return exit_code
+
+    assert run() == 0
+    assert run() == 0
+    assert len(formatted_files) == 1
+    # A new version of the formatter does not trust the old results.
+    monkeypatch.setattr(code_formatter, "_formatter_source_hash", lambda: "changed")
+    assert run() == 0
+    assert len(formatted_files) == 2
+
+
+def test_formatter_reads_stdin_and_formats_only_requested_line_ranges(
+    tmp_path, monkeypatch, capsys
+):
+    import io
+    import sys
+
+    import black
+
+    from dayamlchecker import code_formatter
+
+    content = "---\ncode: |\n  a=1\n---\nquestion: Hi\n---\ncode: |\n  b=2\n  c=3\n"
+    black_calls = []
+    real_format_file_contents = black.format_file_contents
+
+    def counting_format_file_contents(*args, **kwargs):
+        black_calls.append(args[0])
+        return real_format_file_contents(*args, **kwargs)
+
+    monkeypatch.setattr(black, "format_file_contents", counting_format_file_contents)
+
+    def run(*args: str) -> tuple[int, str]:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(content))
+        monkeypatch.setattr(sys, "argv", ["dayamlchecker-fmt", "--no-cache", *args])
+        exit_code = code_formatter.main()
+        return exit_code, capsys.readouterr().out
+
+    assert run("-") == (
+        0,
+        "---\ncode: |\n  a = 1\n---\nquestion: Hi\n---\ncode: |\n  b = 2\n  c = 3\n",
+    )
+    black_calls.clear()
+    # Line 9 is inside the second block, so only that block reaches Black.
+    assert run("--line-ranges", "9-9", "-") == (
+        0,
+        "---\ncode: |\n  a=1\n---\nquestion: Hi\n---\ncode: |\n  b = 2\n  c = 3\n",
+    )
+    assert black_calls == ["b=2\nc=3\n"]
+    assert run("--check", "--line-ranges", "4-6", "-") == (0, "")
+    assert run("--check", "--line-ranges", "2-2", "--line-ranges", "5-5", "-") == (
+        1,
+        "",
+    )
+
+    interview = tmp_path / "interview.yml"
+    interview.write_text(content, encoding="utf-8")
+    with pytest.raises(SystemExit):
+        run("--line-ranges", "3-1", str(interview))
+    with pytest.raises(SystemExit):
+        run("--line-ranges", "1-3", str(interview), str(interview))
+    assert run("--line-ranges", "1-3", str(interview))[0] == 0
+    assert interview.read_text(encoding="utf-8").startswith("---\ncode: |\n  a = 1\n")
+    assert "b=2\n  c=3" in interview.read_text(encoding="utf-8")
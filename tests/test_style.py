@@ -1,8 +1,14 @@
 import io
+import json
+import random
+import re
 from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 import dayamlchecker
 import dayamlchecker.style as style_module
 from dayamlchecker.messages import FindingClass, MessageId, Severity
@@ -770,3 +776,590 @@ def test_style_checks_report_binary_only_gender_choices():
     assert any(
         finding.message_id == MessageId.STYLE_GENDER_BINARY_ONLY for finding in findings
     )
+
+
+@lru_cache(maxsize=None)
+def _per_term_plain_language_patterns() -> list[tuple[str, re.Pattern[str]]]:
+    terms = sorted(
+        style_module._load_plain_language_replacements().items(),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+    return [
+        (
+            replacement,
+            re.compile(
+                rf"(?<![A-Za-z0-9_]){re.escape(term)}(?![A-Za-z0-9_])",
+                re.IGNORECASE,
+            ),
+        )
+        for term, replacement in terms
+        if re.search(r"[a-z0-9]", term)
+    ]
+
+
+def _per_term_plain_language_suggestions(
+    text: str, max_matches: int = 8
+) -> list[tuple[str, str]]:
+    # The original implementation: one regex per term, longest term first.
+    plain = style_module._plain_text(text)
+    if not plain:
+        return []
+    occupied: list[tuple[int, int]] = []
+    seen_terms: set[str] = set()
+    matches: list[tuple[int, str, str]] = []
+    for replacement, pattern in _per_term_plain_language_patterns():
+        if len(matches) >= max_matches:
+            break
+        for found in pattern.finditer(plain):
+            span = (found.start(), found.end())
+            if any(
+                not (span[1] <= used_start or span[0] >= used_end)
+                for used_start, used_end in occupied
+            ):
+                continue
+            seen_key = found.group(0).strip().lower()
+            if seen_key in seen_terms:
+                continue
+            seen_terms.add(seen_key)
+            occupied.append(span)
+            matches.append((found.start(), found.group(0), replacement))
+            break
+    matches.sort(key=lambda item: item[0])
+    return [(match_text, replacement) for _, match_text, replacement in matches]
+
+
+def test_plain_language_matcher_matches_per_term_regexes():
+    terms = list(style_module._load_plain_language_replacements())
+    fillers = ["the", "a", "-", ",", ".", "_", "x1", "K", "ſ", "Ab", "\n", "'"]
+    rng = random.Random(2026)
+    texts = [
+        "Commence the interview in accordance with the rules.",
+        "IN ACCORDANCE WITH, in accordance with and In Accordance With",
+        "a number of a number of numbers",
+        "commencecommence commence_ commence1 commence",
+    ]
+    for _ in range(2000):
+        words = [
+            rng.choice(terms) if rng.random() < 0.4 else rng.choice(fillers)
+            for _ in range(rng.randint(1, 30))
+        ]
+        words = [word.upper() if rng.random() < 0.2 else word for word in words]
+        texts.append(rng.choice(["", " ", "  "]).join(words))
+
+    for text in texts:
+        assert style_module._find_plain_language_suggestions(
+            text
+        ) == _per_term_plain_language_suggestions(text), text
+
+
+def test_document_text_index_derives_each_text_once(monkeypatch):
+    from dayamlchecker import text_index
+
+    calls = []
+    real_markup_to_plain = text_index._markup_to_plain
+
+    def counting_markup_to_plain(rendered):
+        calls.append(rendered)
+        return real_markup_to_plain(rendered)
+
+    monkeypatch.setattr(text_index, "_markup_to_plain", counting_markup_to_plain)
+    index = text_index.DocumentTextIndex(
+        {"question": "Commence **now**. Then stop.", "__line__": 1},
+        "question: Commence **now**. Then stop.\n",
+    )
+
+    indexed = index.text("Commence **now**. Then stop.")
+    assert index.visible("question") is indexed
+    assert indexed.plain == "Commence **now**. Then stop."
+    assert indexed.sentences == ("Commence **now**.", " Then stop.")
+    assert indexed.word_count == 4
+    assert len(calls) == 1
+    assert [section.location for section in index.sections] == ["question"]
+    assert index.sections is index.sections
+
+
+def test_style_and_accessibility_share_one_text_index(monkeypatch):
+    from dayamlchecker import text_index
+
+    built = []
+    real_init = text_index.DocumentTextIndex.__init__
+
+    def recording_init(self, doc, source_code):
+        built.append(self)
+        real_init(self, doc, source_code)
+
+    monkeypatch.setattr(text_index.DocumentTextIndex, "__init__", recording_init)
+    yaml_text = (
+        "question: |\n"
+        "  Commence the interview.\n"
+        "subquestion: |\n"
+        "  [click here](https://example.com)\n"
+        "field: user_name\n"
+        "---\n"
+        "question: Second screen\n"
+        "field: other_name\n"
+    )
+
+    findings = find_errors_from_string(
+        yaml_text,
+        input_file="<string_input>",
+        lint_mode="accessibility",
+        runtime_options=RuntimeOptions(style_enabled=True),
+    )
+
+    message_ids = {finding.message_id for finding in findings}
+    assert MessageId.STYLE_PLAIN_LANGUAGE_REPLACEMENT in message_ids
+    assert MessageId.ACCESSIBILITY_NON_DESCRIPTIVE_LINK_TEXT in message_ids
+    assert len(built) == 2
+
+
+def test_style_rules_share_one_traversal_of_each_document(monkeypatch):
+    field_walks = []
+    real_iter_fields = style_module._iter_fields
+
+    def counting_iter_fields(doc):
+        field_walks.append(doc.get("question"))
+        return real_iter_fields(doc)
+
+    monkeypatch.setattr(style_module, "_iter_fields", counting_iter_fields)
+    yaml_text = (
+        "question: |\n"
+        "  Commence the interview.\n"
+        "fields:\n"
+        '  - label: "Enter Your First Name"\n'
+        "    field: FirstName\n"
+        '  - label: "Last name"\n'
+        "    field: last_name\n"
+        "---\n"
+        "question: Second screen\n"
+        "field: other_name\n"
+    )
+
+    findings = find_errors_from_string(
+        yaml_text,
+        input_file="<string_input>",
+        lint_mode="accessibility",
+        runtime_options=RuntimeOptions(style_enabled=True),
+    )
+
+    message_ids = {finding.message_id for finding in findings}
+    assert MessageId.STYLE_TITLE_CASE_LABEL in message_ids
+    assert MessageId.STYLE_FIELD_LABEL_INSTRUCTION_VERB in message_ids
+    assert MessageId.STYLE_VARIABLE_ROOT_NOT_SNAKE_CASE in message_ids
+    assert sorted(field_walks) == ["Commence the interview.\n", "Second screen"]
+
+
+def test_style_rules_only_receive_the_events_they_handle(monkeypatch):
+    events = []
+
+    class DocumentRule(style_module._StyleRule):
+        def visit_document(self, parsed_doc):
+            events.append(("document", parsed_doc.index))
+
+    class FieldRule(style_module._StyleRule):
+        def visit_field(self, parsed_doc, index, field):
+            events.append(("field", parsed_doc.index, index))
+
+    monkeypatch.setattr(style_module, "_STYLE_RULES", (DocumentRule, FieldRule))
+    docs = [
+        style_module.ParsedInterviewDocument(
+            doc={"question": "One", "fields": [{"A": "a"}, {"B": "b"}]},
+            source_code="question: One\n",
+            document_start_line=1,
+            index=0,
+        ),
+        style_module.ParsedInterviewDocument(
+            doc={"question": "Two"},
+            source_code="question: Two\n",
+            document_start_line=5,
+            index=1,
+        ),
+    ]
+
+    assert style_module._run_style_rules(docs) == []
+    assert events == [
+        ("document", 0),
+        ("field", 0, 0),
+        ("field", 0, 1),
+        ("document", 1),
+    ]
+
+
+def test_style_llm_requests_run_concurrently_and_merge_in_rule_order(monkeypatch):
+    import threading
+
+    both_sent = threading.Barrier(2, timeout=10)
+    answered = []
+
+    def fake_call_openai_chat_completion(**kwargs):
+        rule_id = (
+            "plain-language-rewrite-opportunities"
+            if "plain-language-rewrite-opportunities" in kwargs["system_prompt"]
+            else "tone-and-respect"
+        )
+        # Each request waits for the other, so a serial runner would time out.
+        both_sent.wait()
+        if rule_id == "tone-and-respect":
+            both_sent.wait()
+        answered.append(rule_id)
+        if rule_id != "tone-and-respect":
+            both_sent.wait()
+        return (
+            {
+                "findings": [
+                    {
+                        "rule_id": rule_id,
+                        "message": f"{rule_id} finding.",
+                        "screen_id": "block-0",
+                        "problematic_text": "You must do this now.",
+                    }
+                ]
+            },
+            None,
+        )
+
+    monkeypatch.setattr(
+        style_module,
+        "_call_openai_chat_completion",
+        fake_call_openai_chat_completion,
+    )
+
+    findings = find_errors_from_string(
+        "question: |\n  You must do this now.\nfield: user_name\n",
+        input_file="<string_input>",
+        runtime_options=RuntimeOptions(
+            style_include_llm=True,
+            style_openai_api_key="test-key",
+            style_llm_concurrency=2,
+        ),
+    )
+
+    assert answered == ["plain-language-rewrite-opportunities", "tone-and-respect"]
+    llm_message_ids = [
+        finding.message_id
+        for finding in findings
+        if finding.message_id
+        in {
+            MessageId.STYLE_TONE_AND_RESPECT,
+            MessageId.STYLE_PLAIN_LANGUAGE_REWRITE_OPPORTUNITY,
+        }
+    ]
+    assert llm_message_ids == [
+        MessageId.STYLE_TONE_AND_RESPECT,
+        MessageId.STYLE_PLAIN_LANGUAGE_REWRITE_OPPORTUNITY,
+    ]
+
+
+def test_style_llm_cache_sends_only_changed_screens(monkeypatch, tmp_path):
+    sent_screens: list[list[str]] = []
+
+    def fake_call_openai_chat_completion(**kwargs):
+        payload = kwargs["user_prompt"][kwargs["user_prompt"].index("[{") :]
+        screens = json.JSONDecoder().raw_decode(payload)[0]
+        sent_screens.append([screen["screen_id"] for screen in screens])
+        return (
+            {
+                "findings": [
+                    {
+                        "rule_id": "tone-and-respect",
+                        "message": f"Harsh wording on {screen['screen_id']}.",
+                        "screen_id": screen["screen_id"],
+                        "problematic_text": "You must",
+                    }
+                    for screen in screens
+                    if "must" in screen["text"]
+                ]
+            },
+            None,
+        )
+
+    monkeypatch.setattr(
+        style_module,
+        "_call_openai_chat_completion",
+        fake_call_openai_chat_completion,
+    )
+    options = RuntimeOptions(
+        style_include_llm=True,
+        style_openai_api_key="test-key",
+        style_llm_cache_dir=tmp_path,
+    )
+
+    def run(second_question: str) -> list[str]:
+        sent_screens.clear()
+        findings = find_errors_from_string(
+            "id: first\nquestion: You must do this now.\nfield: a\n"
+            f"---\nid: second\nquestion: {second_question}\nfield: b\n",
+            input_file="<string_input>",
+            runtime_options=options,
+        )
+        return [
+            finding.message
+            for finding in findings
+            if finding.message_id == MessageId.STYLE_TONE_AND_RESPECT
+        ]
+
+    expected = ['Harsh wording on first. Quote: "You must"']
+    assert run("Ready to begin?") == expected
+    assert sent_screens == [["first", "second"], ["first", "second"]]
+    assert run("Ready to begin?") == expected
+    assert sent_screens == []
+    assert run("You must begin.") == [
+        'Harsh wording on first. Quote: "You must"',
+        'Harsh wording on second. Quote: "You must"',
+    ]
+    assert sent_screens == [["second"], ["second"]]
+    # Reviews only update the cache in memory until the run saves it.
+    assert not (tmp_path / "style-llm.json").exists()
+    style_module.save_llm_result_caches()
+    assert (tmp_path / "style-llm.json").exists()
+
+
+def test_style_llm_cache_drops_screens_that_are_no_longer_reused(monkeypatch, tmp_path):
+    from dayamlchecker import cache
+
+    clock = [0.0]
+    monkeypatch.setattr(cache.time, "time", lambda: clock[0])
+    path = tmp_path / "style-llm.json"
+    results = style_module._LLMResultCache(path)
+    results.put("reused", [])
+    results.put("edited-away", [])
+    results.save()
+
+    clock[0] = float(cache.JSONCache.MAX_AGE + 1)
+    results = style_module._LLMResultCache(path)
+    assert results.get("reused") == []
+    results.save()
+
+    assert list(cache.JSONCache.load(path, version=1).entries) == ["reused"]
+
+
+def test_style_llm_reviews_every_screen_in_token_budgeted_chunks(monkeypatch):
+    import threading
+
+    chunks: list[list[str]] = []
+    chunks_lock = threading.Lock()
+
+    def fake_call_openai_chat_completion(**kwargs):
+        payload = kwargs["user_prompt"][kwargs["user_prompt"].index("[{") :]
+        screens = json.JSONDecoder().raw_decode(payload)[0]
+        if "plain-language-rewrite-opportunities" in kwargs["system_prompt"]:
+            return ({"findings": []}, None)
+        with chunks_lock:
+            chunks.append([screen["screen_id"] for screen in screens])
+        return (
+            {
+                "findings": [
+                    {
+                        "rule_id": "tone-and-respect",
+                        "message": f"Check {screen['screen_id']}.",
+                        "screen_id": screen["screen_id"],
+                    }
+                    for screen in screens
+                ]
+            },
+            None,
+        )
+
+    monkeypatch.setattr(
+        style_module,
+        "_call_openai_chat_completion",
+        fake_call_openai_chat_completion,
+    )
+    screen_count = 300
+    yaml_text = "---\n".join(
+        f"id: screen_{index}\nquestion: |\n  Tell us about item {index}.\nfield: a\n"
+        for index in range(screen_count)
+    )
+
+    findings = find_errors_from_string(
+        yaml_text,
+        input_file="<string_input>",
+        runtime_options=RuntimeOptions(
+            style_include_llm=True,
+            style_openai_api_key="test-key",
+            style_llm_chunk_tokens=200,
+        ),
+    )
+
+    sent = sorted(screen_id for chunk in chunks for screen_id in chunk)
+    assert sent == sorted(f"screen_{index}" for index in range(screen_count))
+    assert len(chunks) > 1
+    assert max(len(chunk) for chunk in chunks) < screen_count
+    lines = {
+        finding.message: finding.line_number
+        for finding in findings
+        if finding.message_id == MessageId.STYLE_TONE_AND_RESPECT
+    }
+    assert len(lines) == screen_count
+    # Each document is five lines long (four lines plus the --- separator).
+    assert lines["Check screen_0."] == 2
+    assert lines["Check screen_299."] == 299 * 5 + 2
+    assert list(lines) == [f"Check screen_{index}." for index in range(screen_count)]
+
+
+def test_plan_screen_chunks_keeps_order_and_budget():
+    screens = [{"screen_id": f"s{index}", "text": "x" * 100} for index in range(10)]
+
+    chunks = style_module._plan_screen_chunks(screens, 100)
+
+    assert [screen for chunk in chunks for screen in chunk] == screens
+    assert all(
+        sum(
+            style_module._estimate_tokens(json.dumps(screen, ensure_ascii=False))
+            for screen in chunk
+        )
+        <= 100
+        for chunk in chunks
+    )
+    assert style_module._plan_screen_chunks(screens[:1], 1) == [screens[:1]]
+
+
+def test_review_llm_screens_packs_files_and_routes_findings_back(monkeypatch):
+    sent: list[list[str]] = []
+
+    def fake_call_openai_chat_completion(**kwargs):
+        payload = kwargs["user_prompt"][kwargs["user_prompt"].index("[{") :]
+        screens = json.JSONDecoder().raw_decode(payload)[0]
+        if "plain-language-rewrite-opportunities" in kwargs["system_prompt"]:
+            return ({"findings": []}, None)
+        sent.append([screen["screen_id"] for screen in screens])
+        return (
+            {
+                "findings": [
+                    {
+                        "rule_id": "tone-and-respect",
+                        "message": f"Check {screen['text']}",
+                        "screen_id": screen["screen_id"],
+                    }
+                    for screen in screens
+                ]
+            },
+            None,
+        )
+
+    monkeypatch.setattr(
+        style_module,
+        "_call_openai_chat_completion",
+        fake_call_openai_chat_completion,
+    )
+    options = style_module.StyleLintOptions(include_llm=True, openai_api_key="test-key")
+    files = [
+        style_module._LLMFileScreens(
+            input_file=f"file_{index}.yml",
+            screens=({"screen_id": "intro", "text": f"Intro {index}"},),
+            screen_lines={"intro": 10 + index},
+        )
+        for index in range(3)
+    ]
+
+    reviewed = style_module.review_llm_screens(files, options=options)
+
+    assert sent == [["0/intro", "1/intro", "2/intro"]]
+    assert [
+        [
+            (f.file_name, f.line_number, f.message, f.context["screen_id"])
+            for f in findings
+        ]
+        for findings in reviewed
+    ] == [
+        [(f"file_{index}.yml", 10 + index, f"Check Intro {index}", "intro")]
+        for index in range(3)
+    ]
+
+
+def test_review_llm_screens_routes_unprefixed_and_unknown_screen_ids(
+    monkeypatch, tmp_path
+):
+    requests_sent: list[list[str]] = []
+
+    def fake_call_openai_chat_completion(**kwargs):
+        if "plain-language-rewrite-opportunities" in kwargs["system_prompt"]:
+            return ({"findings": []}, None)
+        payload = kwargs["user_prompt"][kwargs["user_prompt"].index("[{") :]
+        screens = json.JSONDecoder().raw_decode(payload)[0]
+        requests_sent.append([screen["screen_id"] for screen in screens])
+        return (
+            {
+                "findings": [
+                    {
+                        "rule_id": "tone-and-respect",
+                        "message": f"About {screen_id}.",
+                        "screen_id": screen_id,
+                    }
+                    # Without file prefixes: one unique id, one id both
+                    # files use, and one id that names no screen at all.
+                    for screen_id in ("second_file_screen", "intro", "unknown")
+                ]
+            },
+            None,
+        )
+
+    monkeypatch.setattr(
+        style_module,
+        "_call_openai_chat_completion",
+        fake_call_openai_chat_completion,
+    )
+    options = style_module.StyleLintOptions(
+        include_llm=True, openai_api_key="test-key", llm_cache_dir=tmp_path
+    )
+    files = [
+        style_module._LLMFileScreens(
+            input_file="a.yml",
+            screens=({"screen_id": "intro", "text": "Intro a"},),
+            screen_lines={"intro": 2},
+        ),
+        style_module._LLMFileScreens(
+            input_file="b.yml",
+            screens=(
+                {"screen_id": "intro", "text": "Intro b"},
+                {"screen_id": "second_file_screen", "text": "You must"},
+            ),
+            screen_lines={"intro": 2, "second_file_screen": 7},
+        ),
+    ]
+
+    def review(
+        files: list[style_module._LLMFileScreens],
+    ) -> list[list[tuple[str | None, int | None, str]]]:
+        return [
+            [(f.file_name, f.line_number, f.context["screen_id"]) for f in findings]
+            for findings in style_module.review_llm_screens(files, options=options)
+        ]
+
+    expected = [[], [("b.yml", 7, "second_file_screen")]]
+    assert review(files) == expected
+    assert requests_sent == [["0/intro", "1/intro", "1/second_file_screen"]]
+    # The routed finding was cached under the screen it names.
+    assert review(files) == expected
+    assert len(requests_sent) == 1
+
+    # With a single file, an unknown id is still reported for that file but
+    # is not cached under any screen.
+    single = [
+        style_module._LLMFileScreens(
+            input_file="c.yml",
+            screens=({"screen_id": "start", "text": "Start"},),
+            screen_lines={"start": 3},
+        )
+    ]
+    assert review(single) == [
+        [
+            ("c.yml", 1, "second_file_screen"),
+            ("c.yml", 1, "intro"),
+            ("c.yml", 1, "unknown"),
+        ]
+    ]
+    assert review(single) == [[]]
+    assert len(requests_sent) == 2
+
+
+def test_every_registered_style_rule_can_be_built():
+    for rule_type in style_module._STYLE_RULES:
+        assert isinstance(rule_type(), style_module._StyleRule)
+
+    class ForgotTheHook(style_module._UserFacingTextRule):
+        pass
+
+    with pytest.raises(TypeError):
+        ForgotTheHook()
@@ -0,0 +1,116 @@
+"""URL checker benchmarks against the ``url_stand_in_server`` fixture.
+
+These drive ``run_url_check()`` with thousands of URLs and print timings, so
+they only run when ``DAYAMLCHECKER_URL_BENCHMARKS=1`` is set::
+
+    DAYAMLCHECKER_URL_BENCHMARKS=1 python -m pytest -s tests/test_url_check_benchmarks.py
+"""
+
+import os
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from dayamlchecker.check_questions_urls import (
+    URLCheckResult,
+    URLCheckStats,
+    run_url_check,
+)
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("DAYAMLCHECKER_URL_BENCHMARKS") != "1",
+    reason="set DAYAMLCHECKER_URL_BENCHMARKS=1 to run URL checker benchmarks",
+)
+
+
+def _run_benchmark(
+    name: str, root: Path, urls: list[str], **kwargs
+) -> tuple[URLCheckResult, URLCheckStats]:
+    question = root / "docassemble" / "Bench" / "data" / "questions" / "urls.yml"
+    question.parent.mkdir(parents=True, exist_ok=True)
+    question.write_text(
+        "question: Links\nsubquestion: |\n" + "".join(f"  * {url}\n" for url in urls),
+        encoding="utf-8",
+    )
+    stats = URLCheckStats()
+    started = time.monotonic()
+    result = run_url_check(
+        root=root,
+        question_files=[question],
+        check_documents=False,
+        stats=stats,
+        **kwargs,
+    )
+    elapsed = time.monotonic() - started
+    latencies = sorted(request.elapsed for request in stats.requests)
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+    print(
+        f"\n{name}: {len(urls)} URLs, {len(stats.requests)} requests, "
+        f"{elapsed:.2f}s total, request p95 {p95 * 1000:.1f}ms, "
+        f"{len(result.issues)} issue(s)"
+    )
+    return result, stats
+
+
+def test_benchmark_many_urls_with_latency_distribution(
+    tmp_path: Path, url_stand_in_server
+) -> None:
+    rng = random.Random(1234)
+    # Mostly fast responses with a long tail, like a mix of real sites.
+    url_stand_in_server.latency = lambda: min(rng.lognormvariate(-6.5, 1.0), 0.25)
+    urls = [url_stand_in_server.url(f"page-{index}") for index in range(2000)]
+    urls += [url_stand_in_server.url(f"status/404/gone-{index}") for index in range(50)]
+
+    result, stats = _run_benchmark("latency distribution", tmp_path, urls)
+
+    assert result.checked_url_count == len(urls)
+    assert len(stats.requests) == len(urls)
+    assert sum(issue.category == "broken" for issue in result.issues) == 50
+
+
+def test_benchmark_spellings_of_the_same_page_are_fetched_once(
+    tmp_path: Path, url_stand_in_server
+) -> None:
+    host, port = url_stand_in_server.server_address[:2]
+    urls = []
+    for index in range(1000):
+        urls += [
+            f"http://{host!s}:{port}/page-{index}",
+            f"http://{host!s}:{port}/page-{index}#intro",
+            f"http://{host!s}:{port}/page-{index}#details",
+        ]
+
+    result, stats = _run_benchmark("duplicate spellings", tmp_path, urls)
+
+    assert result.checked_url_count == len(urls)
+    assert len(stats.requests) == 1000
+    assert max(url_stand_in_server.request_counts.values()) == 1
+
+
+def test_benchmark_budget_bounds_slow_hosts(
+    tmp_path: Path, url_stand_in_server
+) -> None:
+    urls = [url_stand_in_server.url(f"delay/50/page-{index}") for index in range(500)]
+
+    started = time.monotonic()
+    result, _ = _run_benchmark("slow host with a 3s budget", tmp_path, urls, budget=3)
+
+    # The last request's timeout is cut to the time left and its retries are
+    # turned off, so the run ends near the budget; the rest is slack for
+    # starting the run and reporting the skipped URLs.
+    assert time.monotonic() - started < 3 + 2
+    assert any(issue.category == "skipped" for issue in result.issues)
+
+
+def test_benchmark_failing_host(tmp_path: Path, url_stand_in_server) -> None:
+    # Every request to a resetting host is retried, so this measures what a
+    # host that is down costs per URL.
+    urls = [url_stand_in_server.url(f"reset/page-{index}") for index in range(20)]
+    urls += [url_stand_in_server.url(f"page-{index}") for index in range(200)]
+
+    result, stats = _run_benchmark("failing host", tmp_path, urls)
+
+    assert sum(issue.category == "unreachable" for issue in result.issues) == 20
+    assert sum(request.retries for request in stats.requests) == 40
@@ -0,0 +1,208 @@
+"""Parity checks for the fast URL extraction path.
+
+The fast path must report exactly what scanning every line with linkify and
+the original character-by-character comment stripper reported.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+from linkify_it import LinkifyIt  # type: ignore[attr-defined,import-untyped]
+
+import dayamlchecker.check_questions_urls as check_questions_urls
+from dayamlchecker.check_questions_urls import (
+    extract_urls_from_file,
+    is_reserved_example_domain,
+    parse_url_token,
+)
+
+
+def _legacy_strip_yaml_comment_from_line(
+    line: str, in_single: bool, in_double: bool
+) -> tuple[str, bool, bool]:
+    result: list[str] = []
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if char == "'" and not in_double:
+            if in_single and index + 1 < len(line) and line[index + 1] == "'":
+                result.append("''")
+                index += 2
+                continue
+            in_single = not in_single
+            result.append(char)
+            index += 1
+            continue
+        if char == '"' and not in_single:
+            backslashes = len(line[:index]) - len(line[:index].rstrip("\\"))
+            if backslashes % 2 == 0:
+                in_double = not in_double
+                result.append(char)
+                index += 1
+                continue
+        if (
+            char == "#"
+            and not in_single
+            and not in_double
+            and (index == 0 or line[index - 1].isspace())
+        ):
+            break
+        result.append(char)
+        index += 1
+    return "".join(result), in_single, in_double
+
+
+def _legacy_scan_text_for_urls(
+    text: str, linkify: LinkifyIt
+) -> tuple[list[str], list[str]]:
+    found_urls: list[str] = []
+    concatenated_urls: list[str] = []
+    for match in linkify.match(text) or []:
+        url, is_concatenated = parse_url_token(match.url)
+        if is_concatenated:
+            concatenated_urls.append(match.url.strip())
+            continue
+        if not url or is_reserved_example_domain(url):
+            continue
+        found_urls.append(url)
+    return found_urls, concatenated_urls
+
+
+_FIXTURE_LINES = [
+    "question: Visit https://courts.suffolklitlab.org/forms today.",
+    'subquestion: "[Help](https://help.suffolklitlab.org/path?a=1&b=2)"',
+    "note: (https://paren.suffolklitlab.org/x), and https://b.suffolklitlab.org/y;",
+    "bad: https://one.suffolklitlab.org/helphttps://two.suffolklitlab.org/",
+    "query: https://forms.suffolklitlab.org/?form_to_use=https://x.suffolklitlab.org/",
+    "upper: HTTPS://UPPER.suffolklitlab.org/Path",
+    "email: someone@suffolklitlab.org and mailto:help@suffolklitlab.org",
+    "ftp: ftp://files.suffolklitlab.org/file.txt",
+    "unicode: https://bücher.suffolklitlab.org/straße",
+    "punct: **https://bold.suffolklitlab.org/**, <https://angle.suffolklitlab.org>",
+    "trailing: https://t.suffolklitlab.org/a,, https://t.suffolklitlab.org/b:",
+    "port: https://p.suffolklitlab.org:8443/x http://p.suffolklitlab.org:99999/",
+    "word: seehttps://glued.suffolklitlab.org/ x_https://under.suffolklitlab.org/",
+    "reserved: https://example.com/ https://docs.example.org/path",
+    "mako: ${ url_action('x') } https://mako.suffolklitlab.org/${ var }",
+    "  # https://comment.suffolklitlab.org/ in a comment",
+    "key: 'it''s https://single.suffolklitlab.org/' # https://c.suffolklitlab.org/",
+    'key: "esc \\" https://double.suffolklitlab.org/" # tail',
+    "code: |",
+    "  x = 'https://code.suffolklitlab.org/'  # https://py-comment.suffolklitlab.org/",
+    "  y = 1",
+    "plain: no links here",
+    "bare: docassemble.org, www.suffolklitlab.org/path and 10.0.0.1:8080",
+    "local: http://localhost:8080/path https://a/b",
+    "trail-dash: https://dash.suffolklitlab.org/a- https://eq.suffolklitlab.org/a=",
+]
+
+_RANDOM_PIECES = [
+    "https://",
+    "http://",
+    "HTTPS://",
+    "a.suffolklitlab.org",
+    "docassemble.org",
+    "example.com",
+    "/path",
+    "/",
+    "?q=1",
+    "&b=https://z.org",
+    "#frag",
+    ":8080",
+    " ",
+    "  ",
+    "\t",
+    "\n",
+    "'",
+    "''",
+    '"',
+    '\\"',
+    "#",
+    " # ",
+    "(",
+    ")",
+    "[",
+    "]",
+    "<",
+    ">",
+    "*",
+    ",",
+    ";",
+    ":",
+    ".",
+    "!",
+    "-",
+    "_",
+    "$",
+    "{",
+    "}",
+    "@",
+    "x",
+    "é",
+    "docassemble.org",
+    "www.",
+    "user.name",
+    "?",
+    "--",
+    "..",
+    ".>",
+    "0",
+    "http://plain.suffolklitlab.org",
+    "code: |\n",
+    "key: ",
+]
+
+
+def _legacy_extract(
+    path: Path, linkify: LinkifyIt, monkeypatch: pytest.MonkeyPatch
+) -> object:
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            check_questions_urls,
+            "_strip_yaml_comment_from_line",
+            _legacy_strip_yaml_comment_from_line,
+        )
+        patch.setattr(
+            check_questions_urls,
+            "_scan_text_for_urls",
+            _legacy_scan_text_for_urls,
+        )
+        return extract_urls_from_file(path, linkify)
+
+
+# The checker itself turns fuzzy links off; callers of extract_urls_from_file
+# may pass a default LinkifyIt that reports bare domains too.
+_LINKIFY_OPTIONS = [None, {"fuzzy_link": False}]
+
+
+@pytest.mark.parametrize("options", _LINKIFY_OPTIONS)
+@pytest.mark.parametrize("suffix", [".yml", ".txt", ".py"])
+def test_fast_extraction_matches_linkify_on_fixtures(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    suffix: str,
+    options: dict[str, bool] | None,
+) -> None:
+    path = tmp_path / f"fixture{suffix}"
+    path.write_text("\n".join(_FIXTURE_LINES) + "\n", encoding="utf-8")
+
+    fast = extract_urls_from_file(path, LinkifyIt(options=options))
+
+    assert fast == _legacy_extract(path, LinkifyIt(options=options), monkeypatch)
+    assert "https://courts.suffolklitlab.org/forms" in fast[0]
+
+
+@pytest.mark.parametrize("options", _LINKIFY_OPTIONS)
+def test_fast_extraction_matches_linkify_on_random_text(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, options: dict[str, bool] | None
+) -> None:
+    rng = random.Random(20240529)
+    path = tmp_path / "random.yml"
+    for _ in range(400):
+        text = "".join(rng.choice(_RANDOM_PIECES) for _ in range(rng.randint(1, 40)))
+        path.write_text(text, encoding="utf-8")
+
+        assert extract_urls_from_file(
+            path, LinkifyIt(options=options)
+        ) == _legacy_extract(path, LinkifyIt(options=options), monkeypatch), text
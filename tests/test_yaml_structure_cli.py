@@ -1,11 +1,18 @@
 import io
 import sys
+import threading
 from contextlib import redirect_stdout
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 import dayamlchecker.yaml_structure as yaml_structure
-from dayamlchecker.check_questions_urls import URLCheckResult, URLIssue
+from dayamlchecker.check_questions_urls import (
+    URLCheckResult,
+    URLIssue,
+    read_url_manifests,
+)
 from dayamlchecker.messages import MessageId, make_finding, print_github_annotation
 from dayamlchecker.yaml_structure import _collect_yaml_files, main
 
@@ -428,3 +435,300 @@ def test_main_passes_custom_url_checker_flags(monkeypatch):
         assert captured["yaml_severity"] == "error"
         assert captured["document_severity"] == "ignore"
         assert captured["unreachable_severity"] == "error"
+
+
+def test_main_shares_worker_pool_with_url_checker(monkeypatch):
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        first = root / "docassemble" / "Demo" / "data" / "questions" / "first.yml"
+        second = root / "docassemble" / "Demo" / "data" / "questions" / "second.yml"
+        _write_valid_question(first)
+        _write_valid_question(second)
+
+        captured: dict[str, object] = {}
+
+        def fake_run_url_check(**kwargs):
+            captured.update(kwargs)
+            return URLCheckResult(checked_url_count=0, ignored_url_count=0, issues=())
+
+        monkeypatch.setattr(yaml_structure, "run_url_check", fake_run_url_check)
+
+        assert main(["--jobs", "2", str(first), str(second)]) == 0
+        assert captured["executor"] is not None
+        assert captured["file_texts"] == {
+            first: first.read_text(encoding="utf-8"),
+            second: second.read_text(encoding="utf-8"),
+        }
+
+        captured.clear()
+        assert main([str(first), str(second)]) == 0
+        assert captured["executor"] is None
+
+
+@pytest.mark.parametrize("extra_args", [[], ["--no-url-check"]])
+def test_main_writes_url_manifest_instead_of_checking_urls(monkeypatch, extra_args):
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        question = root / "docassemble" / "Demo" / "data" / "questions" / "q.yml"
+        question.parent.mkdir(parents=True)
+        question.write_text(
+            "question: |\n"
+            "  Read https://help.suffolklitlab.org/guide first.\n"
+            "field: user_name\n",
+            encoding="utf-8",
+        )
+        manifest = root / "urls.json"
+
+        def fail_run_url_check(**kwargs):
+            raise AssertionError("URLs should not be checked")
+
+        monkeypatch.setattr(yaml_structure, "run_url_check", fail_run_url_check)
+
+        assert (
+            main(["--url-manifest-out", str(manifest), *extra_args, str(question)]) == 0
+        )
+        collected = read_url_manifests([manifest])
+        assert collected.yaml_urls == {
+            "https://help.suffolklitlab.org/guide": {
+                "docassemble/Demo/data/questions/q.yml"
+            }
+        }
+
+
+def test_main_checks_urls_while_linting_and_keeps_output_order(monkeypatch, capsys):
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        interview = root / "docassemble" / "Demo" / "data" / "questions" / "test.yml"
+        _write_valid_question(interview)
+        url_check_started = threading.Event()
+
+        def fake_process_file(input_file, **kwargs):
+            # Only returns once the URL checker is running alongside it.
+            assert url_check_started.wait(timeout=10)
+            return [
+                make_finding(
+                    MessageId.ACCESSIBILITY_YESNO_SHORTCUT,
+                    file_name=input_file,
+                    line_number=1,
+                    shortcut="yesno",
+                )
+            ]
+
+        def fake_run_url_check(**kwargs):
+            url_check_started.set()
+            return URLCheckResult(
+                checked_url_count=1,
+                ignored_url_count=0,
+                issues=(
+                    URLIssue.create(
+                        severity="warning",
+                        category="broken",
+                        source_kind="template",
+                        url="https://example.invalid/document",
+                        sources=("docassemble/Demo/data/templates/notice.docx",),
+                        status_code=404,
+                    ),
+                ),
+            )
+
+        monkeypatch.setattr(yaml_structure, "process_file", fake_process_file)
+        monkeypatch.setattr(yaml_structure, "run_url_check", fake_run_url_check)
+
+        assert main([str(interview)]) == 1
+
+        out = capsys.readouterr().out
+        assert out.index("yesno") < out.index("https://example.invalid/document")
+
+
+def test_main_replays_url_checks_and_fails_loudly_on_misses(capsys):
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        question = root / "docassemble" / "Demo" / "data" / "questions" / "q.yml"
+        question.parent.mkdir(parents=True)
+        question.write_text(
+            "question: |\n"
+            "  Read https://help.suffolklitlab.org/guide first.\n"
+            "field: user_name\n",
+            encoding="utf-8",
+        )
+        cassette = root / "urls.cassette.json"
+        cassette.write_text('{"version": 1, "responses": {}}', encoding="utf-8")
+
+        assert main(["--url-check-replay", str(cassette), str(question)]) == 1
+        assert (
+            "no recorded response for https://help.suffolklitlab.org/guide"
+            in capsys.readouterr().err
+        )
+
+        cassette.write_text(
+            '{"version": 1, "responses": {"https://help.suffolklitlab.org/guide":'
+            ' {"status_code": 404, "unreachable": false}}}',
+            encoding="utf-8",
+        )
+        assert main(["--url-check-replay", str(cassette), str(question)]) == 1
+        assert "https://help.suffolklitlab.org/guide" in capsys.readouterr().out
+
+
+def test_main_fix_formats_files_and_lints_the_formatted_text(monkeypatch, capsys):
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        messy = root / "messy.yml"
+        messy.write_text("---\nmandatory: True\ncode: |\n  x=1\n", encoding="utf-8")
+        broken = root / "broken.yml"
+        broken.write_text(
+            "---\nmandatory: True\ncode: |\n  if True\n", encoding="utf-8"
+        )
+        linted: dict[str, str | None] = {}
+        real_process_file = yaml_structure.process_file
+
+        def recording_process_file(input_file, **kwargs):
+            linted[input_file] = kwargs["full_content"]
+            return real_process_file(input_file, **kwargs)
+
+        monkeypatch.setattr(yaml_structure, "process_file", recording_process_file)
+
+        assert main(["--no-url-check", "--fix", str(messy), str(broken)]) == 1
+
+        captured = capsys.readouterr()
+        assert messy.read_text(encoding="utf-8") == (
+            "---\nmandatory: True\ncode: |\n  x = 1\n"
+        )
+        assert linted[str(messy)] == messy.read_text(encoding="utf-8")
+        assert f"Reformatted: {messy}" in captured.err
+        assert f"Could not format {broken}" in captured.err
+        assert linted[str(broken)] == "---\nmandatory: True\ncode: |\n  if True\n"
+        assert str(broken) in captured.out
+        assert str(messy) not in captured.out
+
+
+def test_main_fix_skips_docassemble_files_and_uses_formatter_flags(capsys):
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        interview = root / "interview.yml"
+        interview.write_text(
+            "---\nmandatory: True\ncode: |\n  value = some_function(first_argument)\n",
+            encoding="utf-8",
+        )
+        examples = root / "examples.yml"
+        examples.write_text("---\ncode: |\n  x=1\n", encoding="utf-8")
+
+        assert (
+            main(
+                [
+                    "--no-url-check",
+                    "--fix",
+                    "--fix-line-length",
+                    "30",
+                    str(interview),
+                    str(examples),
+                ]
+            )
+            == 0
+        )
+
+        assert interview.read_text(encoding="utf-8") == (
+            "---\nmandatory: True\ncode: |\n"
+            "  value = some_function(\n"
+            "    first_argument\n"
+            "  )\n"
+        )
+        assert examples.read_text(encoding="utf-8") == "---\ncode: |\n  x=1\n"
+        assert f"Reformatted: {examples}" not in capsys.readouterr().err
+
+
+def test_main_style_llm_overlaps_files_and_keeps_output_order(monkeypatch, capsys):
+    from dayamlchecker import style
+
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        files = [root / f"screen_{index}.yml" for index in range(3)]
+        for path in files:
+            path.write_text(
+                f"---\nid: {path.stem}\nquestion: |\n  Commence the interview.\n"
+                "field: user_name\n",
+                encoding="utf-8",
+            )
+        # Six requests (two rules for three files) must all be in flight
+        # before any of them is answered.
+        all_sent = threading.Barrier(6, timeout=10)
+
+        def fake_call_openai_chat_completion(**kwargs):
+            all_sent.wait()
+            return ({"findings": []}, None)
+
+        monkeypatch.setattr(
+            style, "_call_openai_chat_completion", fake_call_openai_chat_completion
+        )
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        with pytest.raises(SystemExit):
+            main(["--style-llm-concurrency", "0", str(files[0])])
+        capsys.readouterr()
+        main(
+            [
+                "--no-url-check",
+                "--style-llm",
+                "--style-llm-concurrency",
+                "6",
+                *(str(path) for path in files),
+            ]
+        )
+
+        out = capsys.readouterr().out
+        positions = [out.index(f"{path}:") for path in files]
+        assert positions == sorted(positions)
+
+
+def test_main_style_llm_coalesce_shares_requests_across_files(monkeypatch, capsys):
+    import json
+
+    from dayamlchecker import style
+
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        files = [root / f"screen_{index}.yml" for index in range(4)]
+        for path in files:
+            path.write_text(
+                f"---\nid: {path.stem}\nquestion: |\n  Ready to begin?\n"
+                "field: user_name\n",
+                encoding="utf-8",
+            )
+        prompts: list[str] = []
+
+        def fake_call_openai_chat_completion(**kwargs):
+            prompts.append(kwargs["user_prompt"])
+            payload = kwargs["user_prompt"][kwargs["user_prompt"].index("[{") :]
+            screens = json.JSONDecoder().raw_decode(payload)[0]
+            return (
+                {
+                    "findings": [
+                        {
+                            "rule_id": "tone-and-respect",
+                            "message": "Sounds abrupt.",
+                            "screen_id": screen["screen_id"],
+                        }
+                        for screen in screens
+                    ]
+                },
+                None,
+            )
+
+        monkeypatch.setattr(
+            style, "_call_openai_chat_completion", fake_call_openai_chat_completion
+        )
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        def run(*args: str) -> str:
+            prompts.clear()
+            main(["--no-url-check", "--no-cache", *args, *map(str, files)])
+            return capsys.readouterr().out
+
+        per_file = run("--style-llm")
+        assert len(prompts) == 8
+        coalesced = run("--style-llm", "--style-llm-coalesce")
+        assert len(prompts) == 2
+        assert all('"3/screen_3"' in prompt for prompt in prompts)
+        assert coalesced == per_file
+        assert coalesced.count("Sounds abrupt.") == len(files)
+        for path in files:
+            assert f"{path}:3\n  Sounds abrupt." in coalesced